@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 from django.conf import settings
 from django.contrib import admin
 from django.db import models
+from django.db.models import Sum
 from django.utils.safestring import mark_safe
 from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
@@ -23,7 +24,10 @@ from parler.admin import TranslatableAdmin
 
 
 from .forms import JobCategoryAdminForm, JobOpeningAdminForm
-from .models import JobApplication, JobCategory, JobOpening, JobsConfig
+from .models import (
+    JobAlertSubscription, JobApplication, JobApplicationStatistic, JobCategory, JobOpening,
+    JobsConfig,
+)
 
 
 def _send_rejection_email(modeladmin, request, queryset, lang_code='',
@@ -43,7 +47,9 @@ def _send_rejection_email(modeladmin, request, queryset, lang_code='',
 
     # 2. update status or delete objects
     if not delete_application:
-        queryset.update(is_rejected=True, rejection_date=now())
+        rejection_date = now()
+        queryset.update(is_rejected=True, rejection_date=rejection_date,
+                        modified=rejection_date)
         success_msg = _("Successfully sent {0} rejection email(s).").format(
             qs_count)
     else:
@@ -205,11 +211,58 @@ class JobOpeningAdmin(PlaceholderAdminMixin,
     num_applications.admin_order_field = 'applications_count'
 
 
+class JobApplicationStatisticAdmin(admin.ModelAdmin):
+    """
+    Read-only report of the daily application statistics, with the totals of
+    the filtered days, e.g. of a category or namespace.
+    """
+    change_list_template = (
+        'admin/aldryn_jobs/jobapplicationstatistic/change_list.html')
+    date_hierarchy = 'date'
+    list_display = ['date', 'job_opening', 'applications', 'rejections',
+                    'attachments']
+    list_filter = ['job_opening__category__app_config',
+                   'job_opening__category', 'job_opening']
+    list_select_related = ['job_opening']
+    readonly_fields = list_display
+    actions = None
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        response = super(JobApplicationStatisticAdmin, self).changelist_view(
+            request, extra_context)
+        context = getattr(response, 'context_data', None) or {}
+        if 'cl' in context:
+            context['totals'] = context['cl'].queryset.aggregate(
+                applications=Sum('applications'),
+                rejections=Sum('rejections'),
+                attachments=Sum('attachments'),
+            )
+        return response
+
+
+class JobAlertSubscriptionAdmin(admin.ModelAdmin):
+    list_display = ['email', 'category', 'language', 'is_confirmed',
+                    'created', 'last_alert']
+    list_filter = ['category__app_config', 'category', 'language',
+                   'is_confirmed']
+    list_select_related = ['category']
+    search_fields = ['email']
+    readonly_fields = ['created', 'last_alert']
+
+
 class JobsConfigAdmin(PlaceholderAdminMixin, BaseAppHookConfig):
     pass
 
 
+admin.site.register(JobAlertSubscription, JobAlertSubscriptionAdmin)
 admin.site.register(JobApplication, JobApplicationAdmin)
+admin.site.register(JobApplicationStatistic, JobApplicationStatisticAdmin)
 admin.site.register(JobCategory, JobCategoryAdmin)
 admin.site.register(JobOpening, JobOpeningAdmin)
 admin.site.register(JobsConfig, JobsConfigAdmin)
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Email alerts about new job openings for the subscribers of their categories
+(see JobAlertSubscription).
+
+The send_job_alerts management command claims the openings which went live
+since its last run as a batch and sends each confirmed subscriber one email
+per language with the new openings of all their categories. Subscribers are
+read and mailed in chunks of ALDRYN_JOBS_ALERT_CHUNK_SIZE over one
+connection to the mail server. Every chunk is marked as alerted once it is
+sent, so an interrupted run is resumed without sending anything twice.
+Alerts refused for their recipient are logged and not sent again.
+"""
+from __future__ import unicode_literals
+
+import logging
+import smtplib
+from collections import OrderedDict, defaultdict
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.mail import get_connection
+from django.core.urlresolvers import reverse
+from django.db.models import Q
+from django.utils import timezone
+
+from cms.utils.i18n import force_language
+from emailit.api import construct_mail, send_mail
+
+from .cache import get_cache_key, get_jobs_config
+from .models import JobAlertSubscription, JobOpening, Watermark
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_NAME = 'job-alerts'
+
+
+def get_chunk_size():
+    return getattr(settings, 'ALDRYN_JOBS_ALERT_CHUNK_SIZE', 500)
+
+
+def get_confirmation_interval():
+    return getattr(settings, 'ALDRYN_JOBS_ALERT_CONFIRMATION_INTERVAL', 3600)
+
+
+def get_site_url():
+    # Like the links to the admin in the staff notifications.
+    return 'http://{0}'.format(Site.objects.get_current().domain)
+
+
+def send_confirmation_email(subscription, confirm_url):
+    """
+    Sends the link to confirm the subscription, unless it was sent within
+    the last ALDRYN_JOBS_ALERT_CONFIRMATION_INTERVAL seconds. Returns
+    whether it was sent.
+    """
+    key = get_cache_key('alert-confirmation', subscription.pk)
+    if not cache.add(key, True, get_confirmation_interval()):
+        return False
+    try:
+        send_mail(recipients=[subscription.email],
+                  context={'subscription': subscription,
+                           'confirm_url': confirm_url},
+                  template_base='aldryn_jobs/emails/alert_confirmation',
+                  language=subscription.language)
+    except:  # noqa: This is a 3rd-party app, so we don't know for sure which kinds of errors may be raised here
+        cache.delete(key)
+        raise
+    return True
+
+
+def claim_job_openings():
+    """
+    Marks the live job openings nobody has been alerted of as a new batch,
+    and returns its time, None if there are none.
+    """
+    now = timezone.now()
+    claimed = JobOpening.objects.filter(
+        is_live=True, alerted__isnull=True).update(alerted=now)
+    return now if claimed else None
+
+
+def get_pending_batches():
+    """
+    Returns the times of the batches of job openings alerts haven't been
+    sent for completely, oldest first.
+    """
+    job_openings = JobOpening.objects.filter(alerted__isnull=False)
+    since = Watermark.get_value(WATERMARK_NAME)
+    if since is not None:
+        job_openings = job_openings.filter(alerted__gt=since)
+    return sorted(set(job_openings.values_list('alerted', flat=True)))
+
+
+def get_new_job_openings(batch):
+    """
+    Returns a {language: {category pk: section}} dict of the job openings
+    of the batch, sections being dicts with the category name, its namespace
+    and the titles and URLs of the openings.
+    """
+    job_openings = (
+        JobOpening.objects.filter(alerted=batch, is_live=True,
+                                  category__app_config__isnull=False)
+                          .select_related('category')
+                          .prefetch_related('translations',
+                                            'category__translations')
+                          .order_by('category__ordering', 'ordering')
+    )
+    site_url = get_site_url()
+    sections = defaultdict(OrderedDict)
+    for job_opening in job_openings:
+        category = job_opening.category
+        namespace = get_jobs_config(pk=category.app_config_id).namespace
+        for translation in job_opening.translations.all():
+            language = translation.language_code
+            url = job_opening.get_absolute_url(language)
+            if not url:
+                continue
+            if category.pk not in sections[language]:
+                sections[language][category.pk] = {
+                    'name': category.safe_translation_getter(
+                        'name', language_code=language,
+                        any_language=True),
+                    'namespace': namespace,
+                    'job_openings': [],
+                }
+            sections[language][category.pk]['job_openings'].append({
+                'title': translation.title,
+                'url': site_url + url,
+            })
+    return sections
+
+
+def iter_subscribers(subscriptions, chunk_size):
+    """
+    Yields (email, rows) tuples of the subscriptions, one per email address,
+    rows being (pk, category pk, key) tuples. Subscriptions are read
+    chunk_size at a time, ordered by email address.
+    """
+    email, rows = None, []
+    last = None
+    while True:
+        chunk = subscriptions.order_by('email', 'pk')
+        if last is not None:
+            chunk = chunk.filter(
+                Q(email__gt=last[0]) | Q(email=last[0], pk__gt=last[1]))
+        chunk = list(chunk.values_list(
+            'email', 'pk', 'category_id', 'key')[:chunk_size])
+        if not chunk:
+            break
+        for row_email, pk, category_id, key in chunk:
+            if row_email != email:
+                if rows:
+                    yield email, rows
+                email, rows = row_email, []
+            rows.append((pk, category_id, key))
+        last = chunk[-1][:2]
+    if rows:
+        yield email, rows
+
+
+def send_alerts(batch, connection, chunk_size=None):
+    """
+    Sends the alerts for the batch of job openings to the subscribers who
+    didn't get them yet, and returns the number of emails sent.
+    """
+    chunk_size = chunk_size or get_chunk_size()
+    site = Site.objects.get_current()
+    site_url = get_site_url()
+    sent = 0
+    for language, sections in get_new_job_openings(batch).items():
+        subscriptions = JobAlertSubscription.objects.filter(
+            Q(last_alert__isnull=True) | Q(last_alert__lt=batch),
+            is_confirmed=True,
+            language=language,
+            category_id__in=list(sections),
+        )
+        messages, count = [], 0
+        for email, rows in iter_subscribers(subscriptions, chunk_size):
+            with force_language(language):
+                context = {'sections': [
+                    dict(sections[category_id], unsubscribe_url=(
+                        site_url + reverse(
+                            '{0}:job-alert-unsubscribe'.format(
+                                sections[category_id]['namespace']),
+                            kwargs={'key': key})))
+                    for pk, category_id, key in rows
+                ]}
+            messages.append((construct_mail(
+                recipients=[email], context=context, site=site,
+                template_base='aldryn_jobs/emails/job_alert',
+                language=language), [pk for pk, category_id, key in rows]))
+            count += len(rows)
+            if count >= chunk_size:
+                sent += send_chunk(messages, batch, connection)
+                messages, count = [], 0
+        if messages:
+            sent += send_chunk(messages, batch, connection)
+    return sent
+
+
+def send_chunk(messages, batch, connection):
+    """
+    Sends the (message, subscription pks) tuples and marks the subscriptions
+    of every message handled as alerted of the batch, and returns the number
+    of messages sent. Messages refused for their recipient are logged and
+    marked, too; other errors are raised, the remaining messages are sent by
+    the next run.
+    """
+    sent = 0
+    alerted = []
+    try:
+        for message, subscription_ids in messages:
+            try:
+                connection.send_messages([message])
+            except smtplib.SMTPRecipientsRefused:
+                logger.exception(
+                    'Job alert refused for %s', ', '.join(message.to))
+            else:
+                sent += 1
+            alerted.extend(subscription_ids)
+    finally:
+        JobAlertSubscription.objects.filter(
+            pk__in=alerted).update(last_alert=batch)
+    return sent
+
+
+def send_job_alerts(chunk_size=None):
+    """
+    Sends the alerts for the job openings which went live since the last
+    call, and those of interrupted calls. Returns the number of emails sent.
+    """
+    claim_job_openings()
+    sent = 0
+    connection = get_connection()
+    connection.open()
+    try:
+        for batch in get_pending_batches():
+            sent += send_alerts(batch, connection, chunk_size)
+            Watermark.set_value(WATERMARK_NAME, batch)
+    finally:
+        connection.close()
+    return sent
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Read-only JSON API for the job openings and categories of a namespace, in
+the language of the request.
+
+Results are ordered by id and paginated with an opaque cursor::
+
+    GET <apphook>/api/openings/?fields=id,title,url&limit=20
+    {"results": [...], "next": "<apphook>/api/openings/?...&cursor=..."}
+
+Responses carry an ETag which changes with the job content, conditional
+requests are answered with 304 Not Modified.
+
+Applications are posted as multipart/form-data with the fields of the
+application form, see JobApplicationAPI.
+"""
+from __future__ import unicode_literals
+
+import hashlib
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.utils.encoding import force_bytes, force_text
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+from django.utils.translation import get_language_from_request
+from django.views.decorators.http import condition
+from django.views.generic import View
+
+from aldryn_apphooks_config.mixins import AppConfigMixin
+
+from .cache import get_content_version
+from .forms import JobApplicationForm
+from .models import JobApplication, JobCategory, JobOpening
+from .utils import get_app_url
+from .views import ApplicationRateLimitMixin, ReplicaReadMixin
+
+
+def get_page_size():
+    return getattr(settings, 'ALDRYN_JOBS_API_PAGE_SIZE', 50)
+
+
+def get_max_page_size():
+    return getattr(settings, 'ALDRYN_JOBS_API_MAX_PAGE_SIZE', 200)
+
+
+def get_etag(request, *args, **kwargs):
+    # The URL identifies namespace, language and page, the content version
+    # changes with every change of openings and categories.
+    return hashlib.md5(force_bytes(':'.join([
+        get_content_version(), request.get_host(), request.get_full_path(),
+    ]))).hexdigest()
+
+
+def get_idempotency_key(request):
+    return request.META.get('HTTP_IDEMPOTENCY_KEY', '').strip() or None
+
+
+def encode_cursor(pk):
+    return force_text(urlsafe_base64_encode(force_bytes(pk)))
+
+
+def decode_cursor(cursor):
+    try:
+        return int(urlsafe_base64_decode(cursor))
+    except (TypeError, ValueError):
+        raise ValueError('Invalid cursor.')
+
+
+class BaseListAPIView(ReplicaReadMixin, AppConfigMixin, View):
+    """
+    Lists the rows of get_queryset() as JSON. Rows are read with values(),
+    `fields` maps the names of the fields in the output to their lookups.
+    """
+    fields = OrderedDict()
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def get_value(self, name, row):
+        return row[self.fields[name]]
+
+    def get_fields(self):
+        names = self.request.GET.get('fields')
+        if not names:
+            return list(self.fields)
+        names = [name.strip() for name in names.split(',') if name.strip()]
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise ValueError('Unknown fields: {0}.'.format(', '.join(unknown)))
+        return names
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.GET.get('limit', get_page_size()))
+        except ValueError:
+            raise ValueError('Invalid limit.')
+        if limit < 1:
+            raise ValueError('Invalid limit.')
+        return min(limit, get_max_page_size())
+
+    def get_cursor(self):
+        cursor = self.request.GET.get('cursor')
+        return decode_cursor(cursor) if cursor else None
+
+    def get_next_url(self, pk):
+        query = self.request.GET.copy()
+        query['cursor'] = encode_cursor(pk)
+        return self.request.build_absolute_uri(
+            '{0}?{1}'.format(self.request.path, query.urlencode()))
+
+    @method_decorator(condition(etag_func=get_etag))
+    def get(self, request, *args, **kwargs):
+        if self.config is None:
+            raise Http404
+        self.language = get_language_from_request(request, check_path=True)
+        try:
+            fields = self.get_fields()
+            limit = self.get_limit()
+            cursor = self.get_cursor()
+        except ValueError as error:
+            return JsonResponse({'error': force_text(error)}, status=400)
+
+        queryset = self.get_queryset().order_by('pk')
+        if cursor is not None:
+            queryset = queryset.filter(pk__gt=cursor)
+        lookups = set(self.fields[name] for name in fields)
+        lookups.add('pk')
+        # One page at most, read here so that it comes from the replica.
+        rows = list(queryset.values(*lookups)[:limit + 1])
+        next_url = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_url = self.get_next_url(rows[-1]['pk'])
+        return StreamingHttpResponse(
+            self.stream(rows, fields, next_url),
+            content_type='application/json')
+
+    def stream(self, rows, fields, next_url):
+        encoder = DjangoJSONEncoder()
+        yield '{"results": ['
+        for index, row in enumerate(rows):
+            item = OrderedDict(
+                (name, self.get_value(name, row)) for name in fields)
+            yield (',' if index else '') + encoder.encode(item)
+        yield '], "next": {0}}}'.format(encoder.encode(next_url))
+
+
+class JobOpeningListAPI(BaseListAPIView):
+    fields = OrderedDict([
+        ('id', 'pk'),
+        ('title', 'translations__title'),
+        ('slug', 'translations__slug'),
+        ('lead_in', 'translations__lead_in'),
+        ('category', 'category_id'),
+        ('can_apply', 'can_apply'),
+        ('publication_start', 'publication_start'),
+        ('publication_end', 'publication_end'),
+        ('url', 'translations__url_path'),
+    ])
+
+    def get_queryset(self):
+        return (
+            JobOpening.objects.active()
+                              .namespace(self.namespace)
+                              .filter(translations__language_code=self.language)
+        )
+
+    def get_value(self, name, row):
+        value = super(JobOpeningListAPI, self).get_value(name, row)
+        if name == 'url':
+            app_url = get_app_url(self.namespace, self.language)
+            return app_url + value if app_url and value else None
+        return value
+
+
+class JobCategoryListAPI(BaseListAPIView):
+    fields = OrderedDict([
+        ('id', 'pk'),
+        ('name', 'translations__name'),
+        ('slug', 'translations__slug'),
+        ('ordering', 'ordering'),
+        ('url', 'translations__slug'),
+    ])
+
+    def get_queryset(self):
+        return (
+            JobCategory.objects.namespace(self.namespace)
+                               .filter(translations__language_code=self.language)
+        )
+
+    def get_value(self, name, row):
+        value = super(JobCategoryListAPI, self).get_value(name, row)
+        if name == 'url':
+            app_url = get_app_url(self.namespace, self.language)
+            return '{0}{1}/'.format(app_url, value) if app_url and value else None
+        return value
+
+
+class JobApplicationAPI(ApplicationRateLimitMixin, ReplicaReadMixin,
+                        AppConfigMixin, View):
+    """
+    Stores an application for an active job opening::
+
+        POST <apphook>/api/openings/<id>/applications/
+        Idempotency-Key: <unique key chosen by the client, optional>
+        {"status": "created", "id": <application id>}
+
+    Invalid submissions are answered with status 400 and the form errors::
+
+        {"status": "invalid", "errors": {"email": ["..."]}}
+
+    Requests are subject to the usual CSRF protection. Attachments are
+    streamed to the FILE_UPLOAD_HANDLERS while the body is parsed. A repeated
+    request with the same Idempotency-Key gets the response of the first one,
+    with status 200 instead of 201, and nothing is stored or sent again.
+    """
+    form_class = JobApplicationForm
+    http_method_names = ['post', 'options']
+
+    def get_job_opening(self):
+        return (
+            JobOpening.objects.active()
+                              .namespace(self.namespace)
+                              .filter(pk=self.kwargs['pk'])
+                              .first()
+        )
+
+    def post(self, request, *args, **kwargs):
+        job_opening = self.get_job_opening() if self.config else None
+        if job_opening is None:
+            return JsonResponse({'status': 'not found'}, status=404)
+        if not job_opening.can_apply:
+            return JsonResponse({'status': 'closed'}, status=403)
+
+        idempotency_key = get_idempotency_key(request)
+        max_length = JobApplication._meta.get_field(
+            'idempotency_key').max_length
+        if idempotency_key and len(idempotency_key) > max_length:
+            return JsonResponse({
+                'status': 'invalid',
+                'errors': {'idempotency_key': ['Key is too long.']},
+            }, status=400)
+
+        form = self.form_class(
+            data=request.POST, files=request.FILES,
+            job_opening=job_opening, request=request)
+        if not form.is_valid():
+            return JsonResponse({
+                'status': 'invalid',
+                'errors': dict(
+                    (field, [force_text(error) for error in errors])
+                    for field, errors in form.errors.items()),
+            }, status=400)
+        application, created = form.save_once(idempotency_key)
+        return JsonResponse(
+            {'status': 'created', 'id': application.pk},
+            status=201 if created else 200)
@@ -1,7 +1,24 @@
 # -*- coding: utf-8 -*-
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
+from django.db.models.signals import post_delete, post_save
 
 
 class AldrynJobs(AppConfig):
     name = 'aldryn_jobs'
     verbose_name = 'Aldryn Jobs'
+
+    def ready(self):
+        from cms.models import CMSPlugin
+        from .models import (
+            bump_version_on_content_change, purge_job_opening_content,
+        )
+
+        # Plugins are saved as instances of their own models, and deleted
+        # along with their CMSPlugin rows.
+        for model in apps.get_models():
+            if not issubclass(model, CMSPlugin):
+                continue
+            for receiver in (bump_version_on_content_change,
+                             purge_job_opening_content):
+                post_save.connect(receiver, sender=model)
+                post_delete.connect(receiver, sender=model)
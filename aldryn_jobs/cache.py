@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import threading
+from collections import OrderedDict
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, DateTimeField, F, Min, Q, When
+from django.utils import timezone
+from django.utils.encoding import force_text
+
+from cms.utils.conf import get_cms_setting
+
+from .cms_appconfig import JobsConfig
+
+CACHE_PREFIX = getattr(settings, 'ALDRYN_JOBS_CACHE_PREFIX', 'aldryn_jobs')
+JOBS_CONFIG_CACHE_SIZE = getattr(
+    settings, 'ALDRYN_JOBS_CONFIG_CACHE_SIZE', 100)
+
+# Stored instead of None, which the cache API uses to signal a miss.
+NO_TRANSITION = 'none'
+
+
+def get_cache_key(*bits):
+    return ':'.join([CACHE_PREFIX] + [force_text(bit) for bit in bits])
+
+
+def get_max_cache_timeout():
+    return get_cms_setting('CACHE_DURATIONS')['content']
+
+
+def _get_version(name):
+    key = get_cache_key(name, 'version')
+    version = cache.get(key)
+    if version is None:
+        version = uuid4().hex
+        cache.set(key, version, None)
+    return version
+
+
+def _invalidate_version(name):
+    cache.set(get_cache_key(name, 'version'), uuid4().hex, None)
+
+
+def get_content_version():
+    """
+    Returns a token which changes whenever job openings or categories change.
+    Cache keys for content derived from them include it.
+    """
+    return _get_version('content')
+
+
+def invalidate_content():
+    """
+    Forgets all cached job content, e.g. rendered plugins and the publication
+    transitions of all namespaces.
+    """
+    _invalidate_version('content')
+
+
+# (field, value) -> (config version, database, field values)
+_jobs_configs = OrderedDict()
+_jobs_configs_lock = threading.Lock()
+_jobs_config_fields = None
+
+
+def _get_jobs_config_fields():
+    global _jobs_config_fields
+    if _jobs_config_fields is None:
+        _jobs_config_fields = [
+            field.attname for field in JobsConfig._meta.concrete_fields]
+    return _jobs_config_fields
+
+
+def get_jobs_config(pk=None, namespace=None):
+    """
+    Returns the JobsConfig with the given pk or namespace, or None if there is
+    no such config.
+
+    Configs are kept in a small LRU cache of the process, which is checked
+    against a version in the shared cache, so that saving a config in one
+    process invalidates them in all others. Every call returns a new instance
+    built from the cached row.
+    """
+    lookup = ('pk', pk) if pk is not None else ('namespace', namespace)
+    version = _get_version('config')
+    fields = _get_jobs_config_fields()
+    with _jobs_configs_lock:
+        entry = _jobs_configs.pop(lookup, None)
+        if entry is not None and entry[0] == version:
+            _jobs_configs[lookup] = entry
+            return JobsConfig.from_db(entry[1], fields, entry[2])
+
+    queryset = JobsConfig.objects.filter(**{lookup[0]: lookup[1]})
+    rows = list(queryset.values_list(*fields)[:1])
+    if not rows:
+        return None
+    entry = (version, queryset.db, rows[0])
+    with _jobs_configs_lock:
+        values = dict(zip(fields, rows[0]))
+        _jobs_configs[('pk', values[JobsConfig._meta.pk.attname])] = entry
+        _jobs_configs[('namespace', values['namespace'])] = entry
+        while len(_jobs_configs) > JOBS_CONFIG_CACHE_SIZE:
+            _jobs_configs.popitem(last=False)
+    return JobsConfig.from_db(entry[1], fields, entry[2])
+
+
+def invalidate_jobs_configs():
+    """
+    Forgets the cached configs of all processes.
+    """
+    _invalidate_version('config')
+    with _jobs_configs_lock:
+        _jobs_configs.clear()
+
+
+def get_notification_emails_cache_key(category_id):
+    return get_cache_key('notification-emails', category_id)
+
+
+def invalidate_notification_emails(category_ids):
+    """
+    Forgets the cached email addresses of the supervisors of the categories.
+    """
+    cache.delete_many([
+        get_notification_emails_cache_key(category_id)
+        for category_id in category_ids])
+
+
+def _compute_next_publication_transition(namespace=None):
+    # avoid circular import
+    from .models import JobOpening
+
+    openings = JobOpening.objects.all()
+    if namespace is not None:
+        openings = openings.namespace(namespace)
+    now = timezone.now()
+    transitions = openings.aggregate(
+        next_start=Min(Case(
+            When(
+                Q(is_live=False,
+                  is_active=True,
+                  publication_start__isnull=False)
+                & (Q(publication_end__isnull=True)
+                   | Q(publication_end__gt=now)),
+                then=F('publication_start'),
+            ),
+            output_field=DateTimeField(),
+        )),
+        next_end=Min(Case(
+            When(is_live=True, then=F('publication_end')),
+            output_field=DateTimeField(),
+        )),
+    )
+    candidates = [value for value in transitions.values() if value]
+    if not candidates:
+        return None
+    # A transition which is due but has not been processed by the
+    # "update_job_openings" command yet means the content may change any
+    # moment now.
+    return max(min(candidates), now)
+
+
+def get_next_publication_transition(namespace=None):
+    """
+    Returns the datetime at which the next job opening in the given namespace
+    (or in any namespace, if None) goes live or expires, or None if there is
+    no such transition scheduled.
+    """
+    key = get_cache_key(
+        'publication', get_content_version(), namespace or '')
+    transition = cache.get(key)
+    if transition is None:
+        transition = _compute_next_publication_transition(namespace)
+        cache.set(
+            key, transition or NO_TRANSITION,
+            get_publication_cache_timeout(transition=transition))
+    elif transition == NO_TRANSITION:
+        transition = None
+    return transition
+
+
+def get_publication_cache_timeout(namespace=None, transition=NO_TRANSITION):
+    """
+    Returns the number of seconds content depending on the active job openings
+    of a namespace can be cached for: until the next publication transition,
+    but never longer than the CMS content cache duration.
+    """
+    if transition == NO_TRANSITION:
+        transition = get_next_publication_transition(namespace)
+    max_timeout = get_max_cache_timeout()
+    if transition is None:
+        return max_timeout
+    seconds = int((transition - timezone.now()).total_seconds())
+    return max(0, min(seconds, max_timeout))
@@ -5,7 +5,9 @@ from __future__ import unicode_literals
 from django.utils.translation import ugettext as _
 
 from aldryn_apphooks_config.models import AppHookConfig
+from cms.models import Placeholder
 from cms.models.fields import PlaceholderField
+from cms.utils.plugins import assign_plugins
 
 
 class JobsConfig(AppHookConfig):
@@ -36,3 +38,24 @@ class JobsConfig(AppHookConfig):
     class Meta:
         verbose_name = _('Aldryn Jobs configuration')
         verbose_name_plural = _('Aldryn Jobs configurations')
+
+    def get_placeholder_fields(self):
+        return [field for field in self._meta.fields
+                if isinstance(field, PlaceholderField)]
+
+    def prefetch_placeholders(self, request, language=None):
+        """
+        Loads all placeholders of the config with one query and their plugins
+        in the given language (the one of the request by default) with one
+        query per plugin type, instead of one placeholder at a time as they
+        are rendered.
+        """
+        fields = self.get_placeholder_fields()
+        placeholders = Placeholder.objects.in_bulk([
+            getattr(self, field.attname) for field in fields
+            if getattr(self, field.attname) is not None])
+        assign_plugins(request, placeholders.values(), None, language)
+        for field in fields:
+            placeholder = placeholders.get(getattr(self, field.attname))
+            if placeholder is not None:
+                setattr(self, field.name, placeholder)
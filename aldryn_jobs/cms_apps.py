@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 
 from django.utils.translation import ugettext_lazy as _
 
+from aldryn_jobs.cache import get_jobs_config
 from aldryn_jobs.models import JobsConfig
 from aldryn_apphooks_config.app_base import CMSConfigApp
 from cms.apphook_pool import apphook_pool
@@ -16,5 +17,9 @@ class JobsApp(CMSConfigApp):
     def get_urls(self, *args, **kwargs):
         return ['aldryn_jobs.urls']
 
+    def get_config(self, namespace):
+        # Used by the views and the toolbar through get_app_instance().
+        return get_jobs_config(namespace=namespace)
+
 
 apphook_pool.register(JobsApp)
@@ -12,6 +12,7 @@ from menus.menu_pool import menu_pool
 
 from .models import JobCategory
 from .models import JobOpening
+from .routers import read_from_replica
 
 
 class JobCategoryMenu(CMSAttachMenu):
@@ -31,6 +32,8 @@ class JobCategoryMenu(CMSAttachMenu):
                        .language(language)
                        .active_translations(language)
         )
+        with read_from_replica():
+            categories = list(categories)
         for category in categories:
             try:
                 node = NavigationNode(category.name,
@@ -62,6 +65,10 @@ class JobOpeningMenu(CMSAttachMenu):
                       .language(current_language)
                       .active_translations(current_language)
         )
+        with read_from_replica():
+            # The URLs are built from the stored paths of the translations.
+            openings = list(openings.select_related('category')
+                                    .prefetch_related('translations'))
         for job_opening in openings:
             try:
                 node = NavigationNode(
@@ -7,6 +7,7 @@ from django.utils.translation import ugettext_lazy as _
 from cms.plugin_base import CMSPluginBase
 from cms.plugin_pool import plugin_pool
 
+from .cache import get_jobs_config, get_next_publication_transition
 from .forms import (
     JobListPluginForm,
     JobCategoriesListPluginForm,
@@ -14,19 +15,32 @@ from .forms import (
 from .models import (
     JobListPlugin,
     JobCategoriesPlugin,
-    JobOpening,
+    get_available_job_openings,
 )
+from .routers import read_from_replica
 from .utils import namespace_is_apphooked
 
 
+def get_app_config(instance):
+    # Loads the config of the plugin from the process-local cache, the
+    # templates use it through instance.app_config, too.
+    if instance.app_config_id is None:
+        return None
+    config = get_jobs_config(pk=instance.app_config_id)
+    if config is not None:
+        instance.app_config = config
+    return config
+
+
 class NameSpaceCheckMixin(object):
 
     def render(self, context, instance, placeholder):
         # check if we have a valid app_config that is app hooked to a page.
         # so that we won't have a 500 error if page with that app hook
         # was deleted.
-        if instance.app_config:
-            namespace = instance.app_config.namespace
+        app_config = get_app_config(instance)
+        if app_config:
+            namespace = app_config.namespace
         else:
             namespace = ''
 
@@ -42,15 +56,35 @@ class NameSpaceCheckMixin(object):
             context, instance, placeholder)
 
 
-class JobCategoriesList(NameSpaceCheckMixin, CMSPluginBase):
+class PublicationExpirationMixin(object):
+
+    def get_cache_expiration(self, request, instance, placeholder):
+        # The rendered openings change as soon as one of them goes live or
+        # expires, so that is when the cached output has to expire, too.
+        app_config = get_app_config(instance)
+        if not app_config:
+            return None
+        return get_next_publication_transition(app_config.namespace)
+
+
+class JobCategoriesList(PublicationExpirationMixin, NameSpaceCheckMixin,
+                        CMSPluginBase):
     model = JobCategoriesPlugin
     form = JobCategoriesListPluginForm
     module = 'Jobs'
     name = _('Categories list')
     render_template = 'aldryn_jobs/plugins/categories_list.html'
 
+    def render(self, context, instance, placeholder):
+        context = super(JobCategoriesList, self).render(
+            context, instance, placeholder)
+        if not context.get('plugin_configuration_error', False):
+            with read_from_replica():
+                context['categories'] = list(instance.categories)
+        return context
+
 
-class JobList(NameSpaceCheckMixin, CMSPluginBase):
+class JobList(PublicationExpirationMixin, NameSpaceCheckMixin, CMSPluginBase):
     form = JobListPluginForm
     model = JobListPlugin
     module = "Jobs"
@@ -59,18 +93,45 @@ class JobList(NameSpaceCheckMixin, CMSPluginBase):
 
     def render(self, context, instance, placeholder):
         context = super(JobList, self).render(context, instance, placeholder)
-        if instance.app_config:
-            namespace = instance.app_config.namespace
+        app_config = get_app_config(instance)
+        if app_config:
+            namespace = app_config.namespace
         else:
             namespace = ''
         if namespace == '' or context.get('plugin_configuration_error', False):
-            vacancies = JobOpening.objects.none()
-        else:
-            vacancies = instance.get_job_openings(namespace)
+            context['vacancies'] = []
+            context['vacancies_count'] = 0
+            return context
+        with read_from_replica():
+            available = self.get_available_job_openings(
+                context, namespace, instance.language)
+            vacancies = instance.get_job_openings(namespace, available)
+            if vacancies and len(vacancies) == instance.max_openings:
+                # Only the shown openings were fetched, count all of them.
+                vacancies_count = instance.count_job_openings(
+                    namespace, available)
+            else:
+                vacancies_count = len(vacancies)
         context['vacancies'] = vacancies
-        context['vacancies_count'] = len(vacancies)
+        context['vacancies_count'] = vacancies_count
         return context
 
+    def get_available_job_openings(self, context, namespace, language):
+        # All job list plugins of a request showing the same namespace share
+        # the queryset, and so its results once it is evaluated. Plugins only
+        # iterate it (see JobListPlugin.get_latest_job_openings()), plugins
+        # with chosen openings don't evaluate it.
+        request = context.get('request')
+        if request is None:
+            return get_available_job_openings(namespace, language)
+        if not hasattr(request, '_aldryn_jobs_openings'):
+            request._aldryn_jobs_openings = {}
+        key = (namespace, language)
+        if key not in request._aldryn_jobs_openings:
+            request._aldryn_jobs_openings[key] = get_available_job_openings(
+                namespace, language)
+        return request._aldryn_jobs_openings[key]
+
 
 plugin_pool.register_plugin(JobCategoriesList)
 plugin_pool.register_plugin(JobList)
@@ -52,9 +52,11 @@ def get_jobopening_from_path(path, language, current_url=None):
             job_slug = current_url.kwargs['job_opening_slug']
             job_opening = job_opening.translated(language, slug=job_slug)
 
-        if job_opening.count():
+        try:
             # Let MultipleObjectsReturned propagate if it is raised
             return job_opening.get()
+        except JobOpening.DoesNotExist:
+            pass
 
     return None
 
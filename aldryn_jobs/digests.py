@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Digests of new applications for the staff, instead of one email for every
+application::
+
+    # One email per category, to all of its supervisors.
+    ALDRYN_JOBS_NOTIFICATION_DIGEST = 'category'
+    # One email per supervisor, for all of their categories.
+    ALDRYN_JOBS_NOTIFICATION_DIGEST = 'supervisor'
+
+The send_application_digests management command sends the digests of the
+applications made since its last run.
+"""
+from __future__ import unicode_literals
+
+import logging
+from collections import OrderedDict, defaultdict
+
+from django.utils import timezone
+
+from emailit.api import send_mail
+
+from .forms import DEFAULT_SEND_TO, get_notification_digest
+from .models import JobApplication, JobCategory
+
+logger = logging.getLogger(__name__)
+
+# Number of applications released per query.
+BATCH_SIZE = 500
+
+
+def claim_pending_applications():
+    """
+    Marks the applications the staff hasn't been notified of yet as notified
+    with one query, so that overlapping runs don't send them twice, and
+    returns the time they are marked with.
+    """
+    now = timezone.now()
+    JobApplication.objects.filter(notified__isnull=True).update(
+        notified=now, modified=now)
+    return now
+
+
+def get_claimed_applications(claimed):
+    return (
+        JobApplication.objects.filter(notified=claimed)
+                              .select_related('job_opening__category')
+                              .prefetch_related('job_opening__translations')
+                              .order_by('created', 'pk')
+    )
+
+
+def get_category_recipients(category_ids):
+    """
+    Returns a {category pk: list of email addresses} dict of the staff
+    notified of applications in the given categories.
+    """
+    recipients = defaultdict(list)
+    supervisors = JobCategory.objects.filter(
+        pk__in=category_ids).values_list('pk', 'supervisors__email')
+    for category_id, email in supervisors:
+        if email:
+            recipients[category_id].append(email)
+    if DEFAULT_SEND_TO:
+        for category_id in category_ids:
+            recipients[category_id].append(DEFAULT_SEND_TO)
+    return recipients
+
+
+def build_digests(applications, digest='category'):
+    """
+    Returns (recipients, applications) tuples, one per category with
+    applications or one per recipient, depending on the digest mode.
+    """
+    categories = OrderedDict()
+    for application in applications:
+        categories.setdefault(
+            application.job_opening.category_id, []).append(application)
+    recipients = get_category_recipients(list(categories))
+    if digest == 'category':
+        return [
+            (recipients[category_id], category_applications)
+            for category_id, category_applications in categories.items()
+        ]
+
+    digests = OrderedDict()
+    for category_id, category_applications in categories.items():
+        for email in recipients[category_id]:
+            digests.setdefault(email, []).extend(category_applications)
+    return [
+        ([email], sorted(digest_applications,
+                         key=lambda application: application.created))
+        for email, digest_applications in digests.items()
+    ]
+
+
+def send_application_digests():
+    """
+    Sends the digests of all applications the staff hasn't been notified of
+    yet, and returns the number of digests and applications.
+
+    Applications are claimed before sending. Those which weren't in any
+    digest sent are released, and sent again on the next call; with one
+    digest per supervisor, the other supervisors' digests are not repeated
+    for a failed one.
+    """
+    claimed = claim_pending_applications()
+    applications = list(get_claimed_applications(claimed))
+    delivered = set()
+    sent = 0
+    digests = build_digests(
+        applications, get_notification_digest() or 'category')
+    for recipients, digest_applications in digests:
+        if not recipients:
+            delivered.update(
+                application.pk for application in digest_applications)
+            continue
+        try:
+            send_mail(recipients=recipients,
+                      context={'job_applications': digest_applications},
+                      template_base='aldryn_jobs/emails/digest')
+        except:  # noqa: This is a 3rd-party app, so we don't know for sure which kinds of errors may be raised here
+            logger.exception(
+                'Could not send an application digest to %s!',
+                ', '.join(recipients))
+        else:
+            sent += 1
+            delivered.update(
+                application.pk for application in digest_applications)
+
+    failed = [application.pk for application in applications
+              if application.pk not in delivered]
+    for start in range(0, len(failed), BATCH_SIZE):
+        JobApplication.objects.filter(
+            pk__in=failed[start:start + BATCH_SIZE],
+        ).update(notified=None, modified=timezone.now())
+    return sent, len(applications) - len(failed)
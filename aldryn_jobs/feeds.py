@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+XML feed of the active job openings of a namespace in the language of the
+request, for job boards and aggregators::
+
+    GET <apphook>/feed/
+
+The feed is streamed while openings are read from the database
+ALDRYN_JOBS_FEED_CHUNK_SIZE at a time, so memory use doesn't grow with the
+number of openings. Descriptions are the plain text of the openings (see
+JobOpening.get_search_data()), stored with their translations and only
+computed again for openings which changed since. Responses carry an ETag
+which changes with the job content, conditional requests are answered with
+304 Not Modified.
+
+The export_job_feed management command writes the same feed to a file.
+"""
+from __future__ import unicode_literals
+
+import re
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.http import Http404, StreamingHttpResponse
+from django.utils.cache import patch_response_headers
+from django.utils.decorators import method_decorator
+from django.utils.six import StringIO
+from django.utils.translation import get_language_from_request
+from django.utils.xmlutils import SimplerXMLGenerator
+from django.views.decorators.http import condition
+from django.views.generic import View
+
+from aldryn_apphooks_config.mixins import AppConfigMixin
+
+from .api import get_etag
+from .cache import get_publication_cache_timeout
+from .models import JobCategory, JobOpening
+from .utils import get_app_url, get_request
+
+# Characters which are not allowed in XML 1.0 documents.
+INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+FIELDS = [
+    'pk', 'version', 'created', 'publication_start', 'category_id',
+    'translations__title', 'translations__url_path',
+    'translations__search_data', 'translations__search_data_version',
+]
+
+
+def get_chunk_size():
+    return getattr(settings, 'ALDRYN_JOBS_FEED_CHUNK_SIZE', 200)
+
+
+def clean_text(value):
+    return INVALID_XML_CHARS.sub('', value or '')
+
+
+def update_search_data(versions, language):
+    """
+    Stores the search data of the job openings with the given
+    {pk: version} in the given language, and returns it as a {pk: text}
+    dict.
+    """
+    request = get_request(language=language)
+    search_data = {}
+    job_openings = (
+        JobOpening.objects.filter(pk__in=list(versions))
+                          .select_related('category', 'content')
+    )
+    for job_opening in job_openings:
+        text = job_opening.get_search_data(language, request)
+        # Neither bumps the version nor purges the pages of the opening.
+        JobOpening._parler_meta.root_model.objects.filter(
+            master_id=job_opening.pk, language_code=language,
+        ).update(search_data=text,
+                 search_data_version=versions[job_opening.pk])
+        search_data[job_opening.pk] = text
+    return search_data
+
+
+def iter_job_openings(namespace, language, chunk_size=None):
+    """
+    Yields chunks of the active job openings of the namespace in the given
+    language, as lists of dicts of the FIELDS, with up to date search data.
+    """
+    chunk_size = chunk_size or get_chunk_size()
+    job_openings = (
+        JobOpening.objects.active()
+                          .namespace(namespace)
+                          .filter(translations__language_code=language)
+                          .order_by('pk')
+    )
+    last = None
+    while True:
+        chunk = job_openings
+        if last is not None:
+            chunk = chunk.filter(pk__gt=last)
+        chunk = list(chunk.values(*FIELDS)[:chunk_size])
+        if not chunk:
+            break
+        outdated = dict(
+            (row['pk'], row['version']) for row in chunk
+            if row['translations__search_data_version'] != row['version'])
+        if outdated:
+            search_data = update_search_data(outdated, language)
+            for row in chunk:
+                if row['pk'] in search_data:
+                    row['translations__search_data'] = search_data[row['pk']]
+        yield chunk
+        if len(chunk) < chunk_size:
+            break
+        last = chunk[-1]['pk']
+
+
+def generate_feed(namespace, language, base_url, chunk_size=None):
+    """
+    Yields the XML feed of the namespace in the given language piece by
+    piece. URLs are made absolute with base_url, e.g. 'https://example.com'.
+    """
+    app_url = get_app_url(namespace, language)
+    categories = dict(
+        JobCategory.objects.namespace(namespace)
+                           .filter(translations__language_code=language)
+                           .values_list('pk', 'translations__name'))
+    site = Site.objects.get_current()
+    stream = StringIO()
+    xml = SimplerXMLGenerator(stream, 'utf-8')
+    xml.startDocument()
+    xml.startElement('source', {})
+    xml.addQuickElement('publisher', clean_text(site.name))
+    xml.addQuickElement('publisherurl', base_url + '/')
+
+    for chunk in iter_job_openings(namespace, language, chunk_size):
+        for row in chunk:
+            if not row['translations__url_path']:
+                continue
+            date = row['publication_start'] or row['created']
+            xml.startElement('job', {})
+            xml.addQuickElement('referencenumber', str(row['pk']))
+            xml.addQuickElement(
+                'title', clean_text(row['translations__title']))
+            xml.addQuickElement('date', date.isoformat())
+            xml.addQuickElement(
+                'url', base_url + app_url + row['translations__url_path'])
+            xml.addQuickElement(
+                'category', clean_text(categories.get(row['category_id'])))
+            xml.addQuickElement(
+                'description', clean_text(row['translations__search_data']))
+            xml.endElement('job')
+        yield stream.getvalue()
+        stream.seek(0)
+        stream.truncate()
+
+    xml.endElement('source')
+    xml.endDocument()
+    yield stream.getvalue()
+
+
+class JobOpeningFeed(AppConfigMixin, View):
+    """
+    Streams the XML feed of the namespace, see generate_feed().
+    """
+
+    @method_decorator(condition(etag_func=get_etag))
+    def get(self, request, *args, **kwargs):
+        if self.config is None:
+            raise Http404
+        language = get_language_from_request(request, check_path=True)
+        if get_app_url(self.namespace, language) is None:
+            raise Http404
+        response = StreamingHttpResponse(
+            generate_feed(self.namespace, language,
+                          request.build_absolute_uri('/').rstrip('/')),
+            content_type='application/xml; charset=utf-8')
+        patch_response_headers(
+            response, get_publication_cache_timeout(self.namespace))
+        return response
@@ -4,8 +4,11 @@ from __future__ import unicode_literals
 
 import os
 import logging
+import uuid
+from datetime import timedelta
 
 from django import forms
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from django.conf import settings
 from django.core.exceptions import (
@@ -13,6 +16,7 @@ from django.core.exceptions import (
     ImproperlyConfigured,
 )
 from django.core.urlresolvers import reverse
+from django.utils import timezone
 from django.utils.translation import ugettext
 
 from aldryn_apphooks_config.utils import setup_config
@@ -23,8 +27,8 @@ from multiupload.fields import MultiFileField
 from parler.forms import TranslatableModelForm
 
 from .models import (
-    JobApplication, JobApplicationAttachment, JobCategory, JobOpening,
-    JobsConfig, JobListPlugin, JobCategoriesPlugin)
+    JobAlertSubscription, JobApplication, JobApplicationAttachment,
+    JobCategory, JobOpening, JobsConfig, JobListPlugin, JobCategoriesPlugin)
 from .utils import namespace_is_apphooked, SALUTATION_CHOICES
 
 SEND_ATTACHMENTS_WITH_EMAIL = getattr(
@@ -34,6 +38,24 @@ DEFAULT_SEND_TO = getattr(settings, 'ALDRYN_JOBS_DEFAULT_SEND_TO', None)
 logger = logging.getLogger(__name__)
 
 
+def get_application_repeat_window():
+    """
+    Returns the seconds in which another application with the same email
+    address for the same job opening is taken for a repeat of the first one,
+    0 if repeats are only recognized by their idempotency key.
+    """
+    return getattr(settings, 'ALDRYN_JOBS_APPLICATION_REPEAT_WINDOW', 0)
+
+
+def get_notification_digest():
+    """
+    Returns 'category' or 'supervisor' if the staff is notified of new
+    applications in digests per category or supervisor (see
+    aldryn_jobs.digests), None if once for every application.
+    """
+    return getattr(settings, 'ALDRYN_JOBS_NOTIFICATION_DIGEST', None)
+
+
 class AutoAppConfigFormMixin(object):
     """
     If there is only a single AppConfig to choose, automatically select it.
@@ -120,6 +142,11 @@ class JobApplicationForm(forms.ModelForm):
         required=False
     )
 
+    # Identifies the rendered form, so that submitting it twice stores one
+    # application only.
+    idempotency_key = forms.CharField(
+        max_length=255, required=False, widget=forms.HiddenInput)
+
     # Add Google ReCaptcha2 to protect the form input
     from django.apps import apps
     if apps.is_installed("snowpenguin.django.recaptcha2"):
@@ -132,6 +159,7 @@ class JobApplicationForm(forms.ModelForm):
         if not hasattr(self, 'request') and kwargs.get('request') is not None:
             self.request = kwargs.pop('request')
         super(JobApplicationForm, self).__init__(*args, **kwargs)
+        self.fields['idempotency_key'].initial = uuid.uuid4().hex
 
     class Meta:
         model = JobApplication
@@ -146,6 +174,9 @@ class JobApplicationForm(forms.ModelForm):
     def save(self, commit=True):
         instance = super(JobApplicationForm, self).save(commit=False)
         instance.job_opening = self.job_opening
+        notify_staff = not get_notification_digest()
+        if notify_staff:
+            instance.notified = timezone.now()
 
         if commit:
             instance.save()
@@ -163,15 +194,65 @@ class JobApplicationForm(forms.ModelForm):
             # prevent the form from ultimately getting saved here.
             logger.exception('Could not send a confirmation email!')
 
-        try:
-            self.send_staff_notifications()
-        except:  # noqa: This is a 3rd-party app, so we don't know for sure which kinds of errors may be raised here
-            # We're handling ANY exception here because we don't want to
-            # prevent the form from ultimately getting saved here.
-            logger.exception('Could not send a staff notifications!')
+        # Otherwise the application is part of the next digest.
+        if notify_staff:
+            try:
+                self.send_staff_notifications()
+            except:  # noqa: This is a 3rd-party app, so we don't know for sure which kinds of errors may be raised here
+                # We're handling ANY exception here because we don't want to
+                # prevent the form from ultimately getting saved here.
+                logger.exception('Could not send a staff notifications!')
 
         return instance
 
+    def get_existing_application(self, idempotency_key=None):
+        """
+        Returns the application this submission repeats, if any: the one
+        with the same idempotency key, or the first one with the same email
+        address (in any case) within get_application_repeat_window() seconds.
+        """
+        applications = JobApplication.objects.filter(
+            job_opening=self.job_opening)
+        if idempotency_key:
+            existing = applications.filter(
+                idempotency_key=idempotency_key).first()
+            if existing is not None:
+                return existing
+        window = get_application_repeat_window()
+        if window:
+            since = timezone.now() - timedelta(seconds=window)
+            return applications.filter(
+                email__iexact=self.cleaned_data['email'],
+                created__gte=since,
+            ).order_by('created').first()
+        return None
+
+    def save_once(self, idempotency_key=None):
+        """
+        Saves the application like save(), unless the submission repeats an
+        application stored before (see get_existing_application()). That one
+        is returned then, nothing is written and no emails are sent. The
+        idempotency key defaults to the one of the rendered form. Returns an
+        (application, created) tuple.
+        """
+        idempotency_key = (
+            idempotency_key or self.cleaned_data.get('idempotency_key') or None)
+        existing = self.get_existing_application(idempotency_key)
+        if existing is not None:
+            return existing, False
+        self.instance.idempotency_key = idempotency_key
+        try:
+            with transaction.atomic():
+                return self.save(), True
+        except IntegrityError:
+            # A concurrent request with the same key won the race.
+            if not idempotency_key:
+                raise
+            existing = self.get_existing_application(idempotency_key)
+            if existing is None:
+                raise
+            return existing, False
+
     def send_confirmation_email(self):
         context = {'job_application': self.instance}
         send_mail(recipients=[self.instance.email],
@@ -218,6 +299,39 @@ class JobApplicationForm(forms.ModelForm):
                   template_base='aldryn_jobs/emails/notification', **kwargs)
 
 
+class JobAlertSubscriptionForm(forms.ModelForm):
+
+    class Meta:
+        model = JobAlertSubscription
+        fields = ['email', 'category']
+
+    def __init__(self, *args, **kwargs):
+        self.namespace = kwargs.pop('namespace')
+        self.language = kwargs.pop('language')
+        super(JobAlertSubscriptionForm, self).__init__(*args, **kwargs)
+        self.fields['category'].queryset = (
+            JobCategory.objects.namespace(self.namespace)
+                               .language(self.language)
+                               .active_translations(self.language)
+        )
+
+    def clean_email(self):
+        # One subscription per address, however it is spelled.
+        return self.cleaned_data['email'].lower()
+
+    def save(self, commit=True):
+        """
+        Returns the subscription of the email address to the category in
+        the language of the form, existing ones are not subscribed again.
+        """
+        subscription, created = JobAlertSubscription.objects.get_or_create(
+            category=self.cleaned_data['category'],
+            language=self.language,
+            email=self.cleaned_data['email'],
+        )
+        return subscription
+
+
 class JobsConfigForm(AppDataForm):
     pass
 
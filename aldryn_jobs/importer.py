@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""
+Bulk import of job openings from external systems (e.g. an ATS).
+
+Every row describes one translation of a job opening::
+
+    external_id, language, category, title, slug, lead_in, is_active,
+    can_apply, publication_start, publication_end, ordering
+
+``external_id``, ``language``, ``category`` (the slug of a category in the
+target namespace) and ``title`` are required. Openings are matched by
+``external_id``, rows whose content did not change since the last import are
+skipped.
+"""
+from __future__ import unicode_literals
+
+import csv
+import hashlib
+import io
+import json
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import six, timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.encoding import force_text
+
+from .cms_appconfig import JobsConfig
+from .models import (
+    JobCategory, JobOpening, bump_job_opening_versions,
+    invalidate_job_content, purge_job_opening_pages, update_job_opening_paths,
+)
+from .signals import (
+    job_opening_published, job_opening_unpublished, send_on_commit,
+)
+from .utils import bulk_update
+
+MASTER_FIELDS = (
+    'category', 'is_active', 'can_apply', 'publication_start',
+    'publication_end', 'ordering',
+)
+TRANSLATED_FIELDS = ('title', 'slug', 'lead_in')
+TRUE_VALUES = ('1', 'true', 'yes', 'y', 'on')
+
+ImportResult = namedtuple(
+    'ImportResult', ['created', 'updated', 'unchanged', 'errors'])
+
+
+class RowError(ValueError):
+    pass
+
+
+def read_csv(fileobj):
+    for row in csv.DictReader(fileobj):
+        yield dict(
+            (force_text(key), force_text(value) if value is not None else '')
+            for key, value in row.items())
+
+
+def read_jsonl(fileobj):
+    for line in fileobj:
+        line = force_text(line).strip()
+        if line:
+            yield json.loads(line)
+
+
+def read_file(path, file_format=None):
+    """
+    Returns the rows of a CSV or JSONL file as a list of dicts. The format is
+    derived from the file extension if not given.
+    """
+    if file_format is None:
+        file_format = 'jsonl' if path.endswith(('.jsonl', '.json')) else 'csv'
+    if file_format == 'csv' and six.PY2:
+        # The Python 2 csv module doesn't support unicode input.
+        with open(path, 'rb') as fileobj:
+            return list(read_csv(fileobj))
+    with io.open(path, encoding='utf-8', newline='') as fileobj:
+        reader = read_jsonl if file_format == 'jsonl' else read_csv
+        return list(reader(fileobj))
+
+
+def _parse_bool(value, default):
+    if value is None or value == '':
+        return default
+    if isinstance(value, bool):
+        return value
+    return force_text(value).strip().lower() in TRUE_VALUES
+
+
+def _parse_datetime(value):
+    if not value:
+        return None
+    parsed = parse_datetime(force_text(value).strip())
+    if parsed is None:
+        raise RowError('Invalid date/time: {0}'.format(value))
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, timezone.get_default_timezone())
+    return parsed
+
+
+def _clean_row(row, languages):
+    data = {}
+    for name in ('external_id', 'language', 'category', 'title'):
+        value = force_text(row.get(name) or '').strip()
+        if not value:
+            raise RowError('Missing value for "{0}"'.format(name))
+        data[name] = value
+    if data['language'] not in languages:
+        raise RowError('Unknown language: {0}'.format(data['language']))
+    data['slug'] = force_text(row.get('slug') or '').strip()
+    data['lead_in'] = force_text(row.get('lead_in') or '')
+    data['is_active'] = _parse_bool(row.get('is_active'), True)
+    data['can_apply'] = _parse_bool(row.get('can_apply'), True)
+    data['publication_start'] = _parse_datetime(row.get('publication_start'))
+    data['publication_end'] = _parse_datetime(row.get('publication_end'))
+    try:
+        data['ordering'] = int(row.get('ordering') or 0)
+    except (TypeError, ValueError):
+        raise RowError('Invalid ordering: {0}'.format(row.get('ordering')))
+    return data
+
+
+def _get_row_hash(data):
+    serialized = json.dumps(
+        data, sort_keys=True, default=lambda value: value.isoformat())
+    return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+
+class SlugAllocator(object):
+    """
+    Hands out slugs which are unique per language within a namespace, with
+    the existing slugs loaded in a single query up front.
+    """
+
+    def __init__(self, scope, translation_model):
+        self.slugifier = JobOpening()
+        self.taken = {}
+        existing = translation_model.objects.filter(
+            slug_scope=scope,
+        ).values_list('language_code', 'slug', 'master_id')
+        for language, slug, master_id in existing:
+            self.taken.setdefault(language, {})[slug] = master_id
+
+    def allocate(self, language, master_id, source):
+        taken = self.taken.setdefault(language, {})
+        slug = self.slugifier.slugify(source)
+        if not slug:
+            slug = force_text(self.slugifier.get_slug_default())
+        candidate, idx = slug, 1
+        max_length = self.slugifier.get_slug_max_length()
+        while taken.get(candidate, master_id) != master_id:
+            max_length = self.slugifier.get_slug_max_length(len(str(idx)))
+            candidate = self.slugifier._get_candidate_slug(
+                slug[:max_length], idx)
+            idx += 1
+        taken[candidate] = master_id
+        return candidate
+
+
+def import_job_openings(rows, namespace, batch_size=500):
+    """
+    Creates or updates job openings and their translations in the given
+    namespace from an iterable of row dicts (see the module docstring) and
+    returns an ImportResult.
+
+    All writes are done with bulk queries; invalid rows are reported in
+    ImportResult.errors as (row number, message) tuples and skipped.
+    """
+    translation_model = JobOpening._parler_meta.root_model
+    languages = [code for code, __ in settings.LANGUAGES]
+    errors = []
+
+    # The slug scope of the openings, see ScopedSlugMixin.
+    scope = JobsConfig.objects.filter(
+        namespace=namespace).values_list('pk', flat=True).first()
+
+    # Categories are referenced by their slug in any language.
+    category_ids = dict(
+        JobCategory._parler_meta.root_model.objects.filter(
+            master__app_config__namespace=namespace,
+        ).values_list('slug', 'master_id'))
+
+    cleaned = []
+    for number, row in enumerate(rows, start=1):
+        try:
+            data = _clean_row(row, languages)
+        except RowError as error:
+            errors.append((number, force_text(error)))
+            continue
+        if data['category'] not in category_ids:
+            errors.append((number, 'Unknown category: {0}'.format(
+                data['category'])))
+            continue
+        data['category'] = category_ids[data['category']]
+        cleaned.append((data, _get_row_hash(data)))
+
+    with transaction.atomic():
+        external_ids = set(data['external_id'] for data, __ in cleaned)
+        openings = dict(
+            (opening.external_id, opening) for opening in
+            JobOpening.objects.filter(external_id__in=external_ids))
+        translations = dict(
+            ((translation.master_id, translation.language_code), translation)
+            for translation in translation_model.objects.filter(
+                master__external_id__in=external_ids))
+        was_live = dict(
+            (opening.pk, opening.is_live) for opening in openings.values())
+
+        # Drop unchanged rows before doing any work for them.
+        changed = []
+        unchanged = 0
+        for data, row_hash in cleaned:
+            opening = openings.get(data['external_id'])
+            translation = opening and translations.get(
+                (opening.pk, data['language']))
+            if translation and translation.import_hash == row_hash:
+                unchanged += 1
+            else:
+                changed.append((data, row_hash))
+
+        # Shared fields, the last row of an opening wins.
+        new_openings = {}
+        updated_openings = {}
+        for data, __ in changed:
+            opening = openings.get(data['external_id'])
+            if opening is None:
+                opening = new_openings.setdefault(
+                    data['external_id'],
+                    JobOpening(external_id=data['external_id']))
+            else:
+                updated_openings[opening.pk] = opening
+            opening.category_id = data['category']
+            for name in MASTER_FIELDS[1:]:
+                setattr(opening, name, data[name])
+            opening.is_live = opening.get_active()
+
+        if new_openings:
+            # NOTE: django CMS creates the "content" placeholder of every new
+            # opening in its PlaceholderField.pre_save().
+            JobOpening.objects.bulk_create(
+                new_openings.values(), batch_size=batch_size)
+            for opening in JobOpening.objects.filter(
+                    external_id__in=new_openings.keys()):
+                openings[opening.external_id] = opening
+        bulk_update(
+            updated_openings.values(),
+            ['category'] + list(MASTER_FIELDS[1:]) + ['is_live'],
+            batch_size=batch_size)
+
+        # Translations
+        slugs = changed and SlugAllocator(scope, translation_model)
+        new_translations = []
+        updated_translations = {}
+        for data, row_hash in changed:
+            opening = openings[data['external_id']]
+            language = data['language']
+            translation = translations.get((opening.pk, language))
+            if translation is None:
+                translation = translation_model(
+                    master_id=opening.pk, language_code=language)
+                new_translations.append(translation)
+                translations[(opening.pk, language)] = translation
+            elif translation.pk is not None:
+                updated_translations[translation.pk] = translation
+            translation.slug_scope = scope
+            translation.title = data['title']
+            translation.lead_in = data['lead_in']
+            # Keep the URL of existing translations stable unless the row
+            # asks for a different slug.
+            translation.slug = slugs.allocate(
+                language, opening.pk,
+                data['slug'] or translation.slug or data['title'])
+            translation.import_hash = row_hash
+
+        translation_model.objects.bulk_create(
+            new_translations, batch_size=batch_size)
+        bulk_update(
+            updated_translations.values(),
+            list(TRANSLATED_FIELDS) + ['import_hash', 'slug_scope'],
+            batch_size=batch_size)
+
+    if changed:
+        # Bulk queries bypass save(), keep caches and listeners informed.
+        invalidate_job_content([scope])
+        changed_openings = JobOpening.objects.filter(
+            external_id__in=set(data['external_id'] for data, __ in changed))
+        update_job_opening_paths(changed_openings)
+        bump_job_opening_versions(changed_openings)
+        purge_job_opening_pages(changed_openings)
+        touched = list(new_openings.values()) + list(updated_openings.values())
+        for opening in touched:
+            opening = openings[opening.external_id]
+            if opening.is_live and not was_live.get(opening.pk, False):
+                send_on_commit(job_opening_published,
+                               sender=JobOpening, job_opening=opening)
+            elif was_live.get(opening.pk, False) and not opening.is_live:
+                send_on_commit(job_opening_unpublished,
+                               sender=JobOpening, job_opening=opening)
+
+    return ImportResult(
+        created=len(new_openings),
+        updated=len(updated_openings),
+        unchanged=unchanged,
+        errors=errors,
+    )
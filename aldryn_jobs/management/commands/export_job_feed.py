@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import io
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.translation import override
+
+from aldryn_jobs.feeds import generate_feed
+from aldryn_jobs.utils import get_app_url
+
+
+class Command(BaseCommand):
+    help = (
+        'Writes the XML feed of the active job openings of a namespace in '
+        'one language, as served under feed/ of the apphook.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('namespace')
+        parser.add_argument(
+            '--language', default=None,
+            help='Language of the feed, LANGUAGE_CODE by default.')
+        parser.add_argument(
+            '--output', default=None,
+            help='File the feed is written to, standard output by default.')
+        parser.add_argument(
+            '--base-url', dest='base_url', default=None,
+            help='Scheme and host the URLs in the feed start with, '
+                 'http:// and the domain of the current site by default.')
+        parser.add_argument(
+            '--chunk-size', type=int, dest='chunk_size', default=None,
+            help='Number of job openings read at a time, '
+                 'ALDRYN_JOBS_FEED_CHUNK_SIZE by default.')
+
+    def handle(self, *args, **options):
+        namespace = options['namespace']
+        language = options['language'] or settings.LANGUAGE_CODE
+        if get_app_url(namespace, language) is None:
+            raise CommandError(
+                'The namespace "{0}" is not apphooked in "{1}".'.format(
+                    namespace, language))
+        base_url = (options['base_url'] or 'http://{0}'.format(
+            Site.objects.get_current().domain)).rstrip('/')
+
+        with override(language):
+            feed = generate_feed(namespace, language, base_url,
+                                 options['chunk_size'])
+            if options['output']:
+                with io.open(options['output'], 'w',
+                             encoding='utf-8') as output:
+                    for piece in feed:
+                        output.write(piece)
+            else:
+                for piece in feed:
+                    self.stdout.write(piece, ending='')
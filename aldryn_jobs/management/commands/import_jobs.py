@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from django.core.management.base import BaseCommand, CommandError
+
+from aldryn_jobs.importer import import_job_openings, read_file
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates or updates job openings of a namespace from a CSV or JSONL '
+        'file with one row per job opening translation.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'namespace',
+            help='Namespace of the jobs app config to import into.')
+        parser.add_argument('path')
+        parser.add_argument(
+            '--format', choices=['csv', 'jsonl'], default=None,
+            help='File format, derived from the file extension by default.')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        try:
+            rows = read_file(options['path'], file_format=options['format'])
+        except (IOError, ValueError) as error:
+            raise CommandError(error)
+
+        result = import_job_openings(
+            rows, options['namespace'], batch_size=options['batch_size'])
+
+        for number, message in result.errors:
+            self.stderr.write('Row {0}: {1}'.format(number, message))
+        self.stdout.write(
+            '{0} created, {1} updated, {2} unchanged, {3} error(s).'.format(
+                result.created, result.updated, result.unchanged,
+                len(result.errors)))
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.translation import override
+
+from aldryn_jobs.digests import send_application_digests
+
+
+class Command(BaseCommand):
+    help = (
+        'Sends the staff digests of the applications made since the last '
+        'run, see ALDRYN_JOBS_NOTIFICATION_DIGEST. Run it periodically, e.g. '
+        'every hour from cron.'
+    )
+
+    def handle(self, *args, **options):
+        # In the default language, commands run without one.
+        with override(settings.LANGUAGE_CODE):
+            digests, applications = send_application_digests()
+        self.stdout.write(
+            '{0} digest(s) sent for {1} application(s).'.format(
+                digests, applications))
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.translation import override
+
+from aldryn_jobs.alerts import send_job_alerts
+
+
+class Command(BaseCommand):
+    help = (
+        'Sends the subscribers of job alerts the job openings published '
+        'since the last run. Run it periodically, e.g. every hour from cron.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, dest='chunk_size', default=None,
+            help='Number of subscriptions read and mailed at a time, '
+                 'ALDRYN_JOBS_ALERT_CHUNK_SIZE by default.')
+
+    def handle(self, *args, **options):
+        # In the default language, commands run without one.
+        with override(settings.LANGUAGE_CODE):
+            sent = send_job_alerts(chunk_size=options['chunk_size'])
+        self.stdout.write('{0} alert(s) sent.'.format(sent))
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from django.core.management.base import BaseCommand
+
+from aldryn_jobs.statistics import update_application_statistics
+
+
+class Command(BaseCommand):
+    help = (
+        'Updates the daily application statistics of the days with '
+        'applications changed since the last run. Run it periodically, e.g. '
+        'every few minutes from cron.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full', action='store_true', dest='full', default=False,
+            help='Rebuild the statistics of all days.')
+
+    def handle(self, *args, **options):
+        days = update_application_statistics(full=options['full'])
+        self.stdout.write('{0} day(s) updated.'.format(days))
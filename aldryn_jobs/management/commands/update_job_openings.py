@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from django.core.management.base import BaseCommand
+
+from aldryn_jobs.models import JobOpening
+
+
+class Command(BaseCommand):
+    help = (
+        'Publishes and unpublishes job openings whose publication window '
+        'started or ended since the last run. Run it periodically, e.g. '
+        'every minute from cron.'
+    )
+
+    def handle(self, *args, **options):
+        published, unpublished = JobOpening.objects.update_live_state()
+        if options['verbosity'] > 1:
+            for job_opening in published:
+                self.stdout.write('Published: {0}'.format(job_opening.pk))
+            for job_opening in unpublished:
+                self.stdout.write('Unpublished: {0}'.format(job_opening.pk))
+        self.stdout.write(
+            '{0} job opening(s) published, {1} unpublished.'.format(
+                len(published), len(unpublished)))
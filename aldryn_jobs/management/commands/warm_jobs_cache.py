@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import time
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.urlresolvers import NoReverseMatch, reverse
+from django.db import connection
+from django.test import Client
+
+from cms.utils.i18n import force_language
+
+from aldryn_jobs.models import JobCategory, JobOpening, JobsConfig
+
+
+class Command(BaseCommand):
+    help = (
+        'Renders the job list, category and detail pages of all apphooked '
+        'namespaces in all languages as an anonymous visitor, so that their '
+        'caches are warm, and reports the timings.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--namespace', action='append', dest='namespaces',
+            help='Only warm this namespace, can be given several times.')
+        parser.add_argument(
+            '--language', action='append', dest='languages',
+            help='Only warm this language, can be given several times.')
+        parser.add_argument(
+            '--threads', type=int, default=4,
+            help='Number of pages rendered concurrently.')
+        parser.add_argument(
+            '--host', default=None,
+            help='Host name the pages are requested for, the first allowed '
+                 'host by default.')
+
+    def handle(self, *args, **options):
+        languages = options['languages'] or [
+            code for code, __ in settings.LANGUAGES]
+        configs = JobsConfig.objects.all()
+        if options['namespaces']:
+            configs = configs.filter(namespace__in=options['namespaces'])
+
+        urls = []
+        for config in configs:
+            for language in languages:
+                urls.extend(self.get_urls(config.namespace, language))
+
+        self.host = options['host'] or self.get_default_host()
+        threads = max(1, options['threads'])
+        if threads == 1:
+            results = [self.warm(url) for url in urls]
+        else:
+            pool = ThreadPool(threads)
+            try:
+                results = pool.map(self.warm_in_thread, urls)
+            finally:
+                pool.close()
+                pool.join()
+
+        self.report(results, options['verbosity'])
+
+    def get_default_host(self):
+        for host in settings.ALLOWED_HOSTS:
+            if '*' not in host:
+                return host.lstrip('.')
+        return 'localhost'
+
+    def get_urls(self, namespace, language):
+        """
+        Returns (kind, url) tuples for all pages of the namespace, none if it
+        is not apphooked in that language.
+        """
+        with force_language(language):
+            try:
+                yield 'list', reverse('{0}:job-opening-list'.format(namespace))
+            except NoReverseMatch:
+                return
+        categories = (
+            JobCategory.objects.namespace(namespace)
+                               .language(language)
+                               .active_translations(language)
+                               .distinct())
+        for category in categories:
+            yield 'category', category.get_absolute_url(language)
+        job_openings = (
+            JobOpening.objects.active()
+                              .namespace(namespace)
+                              .language(language)
+                              .active_translations(language)
+                              .distinct()
+                              .select_related('category__app_config'))
+        for job_opening in job_openings:
+            yield 'detail', job_opening.get_absolute_url(language)
+
+    def warm(self, item):
+        kind, url = item
+        start = time.time()
+        try:
+            status = Client(HTTP_HOST=self.host).get(url).status_code
+        except Exception as e:
+            # The test client raises the exceptions of views, report them
+            # like the server errors they would be.
+            self.stderr.write('{0} {1}: {2!r}'.format(500, url, e))
+            status = 500
+        return kind, url, status, time.time() - start
+
+    def warm_in_thread(self, item):
+        try:
+            return self.warm(item)
+        finally:
+            # Every worker thread opens its own database connection.
+            connection.close()
+
+    def report(self, results, verbosity):
+        timings = OrderedDict(
+            (kind, []) for kind in ('list', 'category', 'detail'))
+        for kind, url, status, duration in results:
+            timings[kind].append(duration)
+            if status != 200:
+                self.stderr.write('{0} {1}'.format(status, url))
+            elif verbosity > 1:
+                self.stdout.write('{0} {1:.3f}s'.format(url, duration))
+        for kind, durations in timings.items():
+            if not durations:
+                continue
+            self.stdout.write(
+                '{0}: {1} page(s), {2:.3f}s average, {3:.3f}s max'.format(
+                    kind, len(durations), sum(durations) / len(durations),
+                    max(durations)))
@@ -2,33 +2,94 @@
 
 from __future__ import unicode_literals
 
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import F, Q
 from django.utils import timezone
 
 from parler.managers import TranslatableManager, TranslatableQuerySet
 
+from .signals import (
+    job_opening_published, job_opening_unpublished, send_on_commit,
+)
+
 
 class JobOpeningsQuerySet(TranslatableQuerySet):
 
     def active(self):
-        now = timezone.now()
+        return self.filter(is_live=True)
+
+    def namespace(self, namespace):
+        return self.filter(category__app_config__namespace=namespace)
+
+    def due_to_go_live(self, now=None):
+        """
+        Openings which should be live at `now` but are not flagged so yet.
+        """
+        if now is None:
+            now = timezone.now()
         return self.filter(
             Q(publication_start__isnull=True) | Q(publication_start__lte=now),
             Q(publication_end__isnull=True) | Q(publication_end__gt=now),
-            is_active=True
+            is_active=True,
+            is_live=False,
         )
 
-    def namespace(self, namespace):
-        return self.filter(category__app_config__namespace=namespace)
+    def due_to_expire(self, now=None):
+        """
+        Openings which are flagged as live but should not be at `now`.
+        """
+        if now is None:
+            now = timezone.now()
+        return self.filter(
+            Q(is_active=False)
+            | Q(publication_start__gt=now)
+            | Q(publication_end__lte=now),
+            is_live=True,
+        )
 
 
 class JobOpeningsManager(TranslatableManager):
 
     def get_queryset(self):
-        return JobOpeningsQuerySet(self.model, using=self.db)
+        return JobOpeningsQuerySet(self.model, using=self._db)
 
     def active(self):
         return self.get_queryset().active()
 
     def namespace(self, namespace):
         return self.get_queryset().namespace(namespace)
+
+    def update_live_state(self, now=None):
+        """
+        Flips `is_live` for every opening whose publication window started or
+        ended since the last run and sends the corresponding signals.
+
+        Returns a tuple of (published, unpublished) job openings.
+        """
+        if now is None:
+            now = timezone.now()
+        queryset = self.get_queryset()
+
+        with transaction.atomic():
+            published = list(
+                queryset.due_to_go_live(now).select_for_update())
+            unpublished = list(
+                queryset.due_to_expire(now).select_for_update())
+            if published:
+                queryset.filter(
+                    pk__in=[opening.pk for opening in published]
+                ).update(is_live=True, version=F('version') + 1)
+            if unpublished:
+                queryset.filter(
+                    pk__in=[opening.pk for opening in unpublished]
+                ).update(is_live=False, version=F('version') + 1)
+
+        for job_opening in published:
+            job_opening.is_live = True
+            send_on_commit(job_opening_published,
+                           sender=self.model, job_opening=job_opening)
+        for job_opening in unpublished:
+            job_opening.is_live = False
+            send_on_commit(job_opening_unpublished,
+                           sender=self.model, job_opening=job_opening)
+        return published, unpublished
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.db.models import Q
+from django.utils import timezone
+
+
+def populate_is_live(apps, schema_editor):
+    JobOpening = apps.get_model('aldryn_jobs', 'JobOpening')
+    now = timezone.now()
+    JobOpening.objects.filter(
+        Q(publication_start__isnull=True) | Q(publication_start__lte=now),
+        Q(publication_end__isnull=True) | Q(publication_end__gt=now),
+        is_active=True,
+    ).update(is_live=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0005_auto_20200130_1618'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobopening',
+            name='is_live',
+            field=models.BooleanField(db_index=True, default=False, editable=False, verbose_name='live?'),
+        ),
+        migrations.RunPython(populate_is_live, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+TRANSLATION_MODELS = ('jobcategorytranslation', 'jobopeningtranslation')
+INDEX_FIELDS = ('language_code', 'slug')
+
+
+def create_slug_indexes(apps, schema_editor):
+    # Build the same statement as AlterIndexTogether would, but on PostgreSQL
+    # create the index without locking the table against writes.
+    concurrently = (
+        schema_editor.connection.vendor == 'postgresql'
+        and not getattr(schema_editor, 'atomic_migration', True)
+    )
+    for model_name in TRANSLATION_MODELS:
+        model = apps.get_model('aldryn_jobs', model_name)
+        fields = [model._meta.get_field(name) for name in INDEX_FIELDS]
+        sql = str(schema_editor._create_index_sql(model, fields, suffix='_idx'))
+        if concurrently:
+            sql = sql.replace('CREATE INDEX', 'CREATE INDEX CONCURRENTLY', 1)
+        schema_editor.execute(sql)
+
+
+def drop_slug_indexes(apps, schema_editor):
+    for model_name in TRANSLATION_MODELS:
+        model = apps.get_model('aldryn_jobs', model_name)
+        schema_editor.alter_index_together(model, {INDEX_FIELDS}, set())
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('aldryn_jobs', '0006_jobopening_is_live'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_slug_indexes, drop_slug_indexes),
+            ],
+            state_operations=[
+                migrations.AlterIndexTogether(
+                    name='jobcategorytranslation',
+                    index_together=set([('language_code', 'slug')]),
+                ),
+                migrations.AlterIndexTogether(
+                    name='jobopeningtranslation',
+                    index_together=set([('language_code', 'slug')]),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 09:27
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0007_translation_slug_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobopening',
+            name='external_id',
+            field=models.CharField(blank=True, editable=False, max_length=255, null=True, unique=True, verbose_name='external id'),
+        ),
+        migrations.AddField(
+            model_name='jobopeningtranslation',
+            name='import_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=40),
+        ),
+    ]
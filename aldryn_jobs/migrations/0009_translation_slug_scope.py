@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 09:33
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+# max_length of the slug fields
+SLUG_MAX_LENGTH = 255
+
+
+def _get_candidate_slug(slug, idx):
+    suffix = '-{0}'.format(idx)
+    return slug[:SLUG_MAX_LENGTH - len(suffix)] + suffix
+
+
+def _make_unique(translations):
+    """
+    Suffixes slugs which are used more than once per language and scope, so
+    the unique constraint can be added.
+    """
+    taken = set()
+    duplicates = []
+    for translation in translations.order_by('pk'):
+        key = (translation.language_code, translation.slug_scope)
+        if (key, translation.slug) in taken:
+            duplicates.append(translation)
+        else:
+            taken.add((key, translation.slug))
+    for translation in duplicates:
+        key = (translation.language_code, translation.slug_scope)
+        idx = 1
+        while (key, _get_candidate_slug(translation.slug, idx)) in taken:
+            idx += 1
+        translation.slug = _get_candidate_slug(translation.slug, idx)
+        taken.add((key, translation.slug))
+        translation.save(update_fields=['slug'])
+
+
+def populate_slug_scope(apps, schema_editor):
+    JobCategoryTranslation = apps.get_model(
+        'aldryn_jobs', 'JobCategoryTranslation')
+    JobOpeningTranslation = apps.get_model(
+        'aldryn_jobs', 'JobOpeningTranslation')
+    JobsConfig = apps.get_model('aldryn_jobs', 'JobsConfig')
+
+    for config_pk in JobsConfig.objects.values_list('pk', flat=True):
+        JobCategoryTranslation.objects.filter(
+            master__app_config=config_pk).update(slug_scope=config_pk)
+        JobOpeningTranslation.objects.filter(
+            master__category__app_config=config_pk).update(slug_scope=config_pk)
+
+    _make_unique(JobCategoryTranslation.objects.filter(
+        slug_scope__isnull=False))
+    _make_unique(JobOpeningTranslation.objects.filter(
+        slug_scope__isnull=False))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0008_jobopening_external_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobcategorytranslation',
+            name='slug_scope',
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobopeningtranslation',
+            name='slug_scope',
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.RunPython(populate_slug_scope, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='jobcategorytranslation',
+            unique_together=set([('language_code', 'slug_scope', 'slug'), ('language_code', 'master')]),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobopeningtranslation',
+            unique_together=set([('language_code', 'slug_scope', 'slug'), ('language_code', 'master')]),
+        ),
+    ]
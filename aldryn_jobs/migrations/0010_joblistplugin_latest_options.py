@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 09:41
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0009_translation_slug_scope'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='joblistplugin',
+            name='max_openings',
+            field=models.PositiveIntegerField(blank=True, help_text='Number of latest Job Openings to show, if none are chosen. Leave empty to show all.', null=True, verbose_name='maximum number of job openings'),
+        ),
+        migrations.AddField(
+            model_name='joblistplugin',
+            name='sort_order',
+            field=models.CharField(choices=[('manual', 'as ordered in the admin'), ('newest', 'newest first')], default='manual', help_text='Order of the latest Job Openings, if none are chosen.', max_length=10, verbose_name='order'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 09:48
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0010_joblistplugin_latest_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobopening',
+            name='version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 10:10
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.db.models.functions import Concat
+
+
+def populate_url_path(apps, schema_editor):
+    JobCategoryTranslation = apps.get_model(
+        'aldryn_jobs', 'JobCategoryTranslation')
+    JobOpeningTranslation = apps.get_model(
+        'aldryn_jobs', 'JobOpeningTranslation')
+
+    category_slugs = JobCategoryTranslation.objects.exclude(
+        slug='').values_list('master_id', 'language_code', 'slug')
+    for category_id, language_code, category_slug in category_slugs:
+        JobOpeningTranslation.objects.filter(
+            master__category=category_id, language_code=language_code,
+        ).exclude(slug='').update(url_path=Concat(
+            models.Value(category_slug + '/'), 'slug', models.Value('/')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0011_jobopening_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobopeningtranslation',
+            name='url_path',
+            field=models.CharField(blank=True, default='', editable=False, max_length=512),
+        ),
+        migrations.RunPython(populate_url_path, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 10:20
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0013_jobapplication_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='jobapplication',
+            index_together=set([('job_opening', 'email', 'created')]),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 10:26
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0014_jobapplication_repeat_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobApplicationStatistic',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='date')),
+                ('applications', models.PositiveIntegerField(default=0, verbose_name='applications')),
+                ('rejections', models.PositiveIntegerField(default=0, verbose_name='rejections')),
+                ('attachments', models.PositiveIntegerField(default=0, verbose_name='attachments')),
+                ('is_stale', models.BooleanField(default=False, editable=False)),
+                ('job_opening', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_statistics', to='aldryn_jobs.JobOpening', verbose_name='job opening')),
+            ],
+            options={
+                'verbose_name': 'application statistic',
+                'verbose_name_plural': 'application statistics',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Watermark',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('value', models.DateTimeField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='modified',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='modified'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobapplicationstatistic',
+            unique_together=set([('job_opening', 'date')]),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 10:29
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+def mark_notified(apps, schema_editor):
+    # Existing applications were notified when they were made.
+    JobApplication = apps.get_model('aldryn_jobs', 'JobApplication')
+    JobApplication.objects.update(notified=models.F('created'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0015_application_statistics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='notified',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True, verbose_name='staff notified'),
+        ),
+        migrations.RunPython(mark_notified, migrations.RunPython.noop),
+    ]
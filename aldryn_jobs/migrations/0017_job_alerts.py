@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 10:37
+from __future__ import unicode_literals
+
+import aldryn_jobs.models
+from django.db import migrations, models
+from django.utils import timezone
+import django.db.models.deletion
+
+
+def mark_alerted(apps, schema_editor):
+    # Openings which are live already are not announced anymore.
+    JobOpening = apps.get_model('aldryn_jobs', 'JobOpening')
+    Watermark = apps.get_model('aldryn_jobs', 'Watermark')
+    now = timezone.now()
+    JobOpening.objects.filter(is_live=True).update(alerted=now)
+    Watermark.objects.update_or_create(
+        name='job-alerts', defaults={'value': now})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0016_jobapplication_notified'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobAlertSubscription',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=15, verbose_name='language')),
+                ('email', models.EmailField(max_length=254, verbose_name='email')),
+                ('key', models.CharField(default=aldryn_jobs.models.get_random_key, editable=False, max_length=32, unique=True)),
+                ('is_confirmed', models.BooleanField(default=False, verbose_name='confirmed?')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='created')),
+                ('last_alert', models.DateTimeField(blank=True, editable=False, null=True, verbose_name='last alert')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='alert_subscriptions', to='aldryn_jobs.JobCategory', verbose_name='category')),
+            ],
+            options={
+                'verbose_name': 'job alert subscription',
+                'verbose_name_plural': 'job alert subscriptions',
+                'ordering': ['-created'],
+            },
+        ),
+        migrations.AddField(
+            model_name='jobopening',
+            name='alerted',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobalertsubscription',
+            unique_together=set([('category', 'language', 'email')]),
+        ),
+        migrations.RunPython(mark_alerted, migrations.RunPython.noop),
+    ]
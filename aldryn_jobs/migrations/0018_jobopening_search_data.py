@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 10:43
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0017_job_alerts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobopeningtranslation',
+            name='search_data',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobopeningtranslation',
+            name='search_data_version',
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.db.models.functions import Concat
+
+# See JobCategory.reserved_slugs.
+RESERVED_SLUGS = ['api']
+
+
+def rename_slugs(apps, slugs):
+    """
+    Renames category translations with one of the given slugs to the next
+    free slug, also used by later migrations which reserve more slugs.
+    """
+    JobCategoryTranslation = apps.get_model(
+        'aldryn_jobs', 'JobCategoryTranslation')
+    JobOpeningTranslation = apps.get_model(
+        'aldryn_jobs', 'JobOpeningTranslation')
+
+    for translation in JobCategoryTranslation.objects.filter(
+            slug__in=slugs):
+        taken = set(JobCategoryTranslation.objects.filter(
+            language_code=translation.language_code,
+            slug_scope=translation.slug_scope,
+            slug__startswith=translation.slug,
+        ).values_list('slug', flat=True))
+        idx = 1
+        while '{0}-{1}'.format(translation.slug, idx) in taken:
+            idx += 1
+        translation.slug = '{0}-{1}'.format(translation.slug, idx)
+        translation.save(update_fields=['slug'])
+        JobOpeningTranslation.objects.filter(
+            master__category=translation.master_id,
+            language_code=translation.language_code,
+        ).exclude(slug='').update(url_path=Concat(
+            models.Value(translation.slug + '/'), 'slug', models.Value('/')))
+
+
+def rename_reserved_slugs(apps, schema_editor):
+    rename_slugs(apps, RESERVED_SLUGS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0018_jobopening_search_data'),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_reserved_slugs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from importlib import import_module
+
+from django.db import migrations
+
+# See JobCategory.reserved_slugs.
+RESERVED_SLUGS = ['feed']
+
+
+def rename_reserved_slugs(apps, schema_editor):
+    import_module(
+        'aldryn_jobs.migrations.0019_reserve_category_slugs'
+    ).rename_slugs(apps, RESERVED_SLUGS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aldryn_jobs', '0020_reserve_alerts_category_slug'),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_reserved_slugs, migrations.RunPython.noop),
+    ]
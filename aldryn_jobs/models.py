@@ -3,9 +3,14 @@ from __future__ import unicode_literals
 
 from django import get_version
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
 from django.core.urlresolvers import reverse, NoReverseMatch
-from django.db import models
-from django.db.models.signals import pre_delete
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Concat
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_delete, pre_save,
+)
 from django.dispatch.dispatcher import receiver
 from django.utils.encoding import force_text, python_2_unicode_compatible
 from django.utils.timezone import now
@@ -21,19 +26,38 @@ from aldryn_translation_tools.models import (
 
 from cms.models import CMSPlugin
 from cms.models.fields import PlaceholderField
-from cms.utils.i18n import force_language, get_current_language
+from cms.utils.i18n import (
+    force_language, get_current_language, get_default_language,
+)
+from menus.menu_pool import menu_pool
 from distutils.version import LooseVersion
 from functools import partial
 from os.path import join as join_path
+from parler.cache import get_translation_cache_key
 from parler.models import TranslatableModel, TranslatedFields
 from sortedm2m.fields import SortedManyToManyField
+from threading import local
 from uuid import uuid4
 
 from aldryn_search.utils import strip_tags
 
+from .cache import (
+    get_jobs_config, get_notification_emails_cache_key, invalidate_content,
+    invalidate_jobs_configs, invalidate_notification_emails,
+)
 from .cms_appconfig import JobsConfig
 from .managers import JobOpeningsManager
-from .utils import get_valid_filename, get_plugin_index_data, get_request
+from .purge import (
+    get_category_key, get_config_key, get_opening_key, get_purge_backend,
+    purge,
+)
+from .signals import (
+    job_opening_published, job_opening_unpublished, send_on_commit,
+)
+from .utils import (
+    get_app_url, get_valid_filename, get_plugin_index_data, get_request,
+    get_statistic_date,
+)
 
 # NOTE: We need to use LooseVersion NOT StrictVersion as Aldryn sometimes uses
 # patched versions of Django with version numbers in the form: X.Y.Z.postN
@@ -46,6 +70,22 @@ loose_version = LooseVersion(get_version())
 user_model = getattr(settings, 'AUTH_USER_MODEL', 'auth.User')
 
 
+def get_language_codes():
+    return [code for code, __ in settings.LANGUAGES]
+
+
+def get_translated_slugs(obj):
+    """
+    Returns a dict of the slugs of all translations of a translatable model
+    instance by language.
+    """
+    return dict(obj.translations.values_list('language_code', 'slug'))
+
+
+def get_random_key():
+    return uuid4().hex
+
+
 def default_jobs_attachment_upload_to(instance, filename):
     date = now().strftime('%Y/%m')
     return join_path(
@@ -72,18 +112,136 @@ JobApplicationFileField = partial(
 )
 
 
+def update_slug_scope(translations, scope):
+    """
+    Moves the given translations into another slug scope. Translations of
+    which the slug is taken in the new scope are saved again with the next
+    free slug, see ScopedSlugMixin.
+    """
+    if scope is None:
+        # NULL scopes don't conflict.
+        translations.filter(slug_scope__isnull=False).update(slug_scope=None)
+        return
+    translations = translations.exclude(slug_scope=scope)
+    moved = list(translations.values_list('pk', 'language_code', 'slug'))
+    taken = set(translations.model.objects.filter(
+        slug_scope=scope,
+        slug__in=set(slug for __, __, slug in moved),
+    ).values_list('language_code', 'slug'))
+    conflict_ids = [
+        pk for pk, language_code, slug in moved
+        if (language_code, slug) in taken]
+    translations.exclude(pk__in=conflict_ids).update(slug_scope=scope)
+    conflicts = translations.model.objects.filter(
+        pk__in=conflict_ids).select_related('master')
+    for translation in conflicts:
+        translation.slug = translation.master.make_new_slug(
+            translation.slug, translation.language_code)
+        translation.master.save_translation(translation)
+
+
+class ScopedSlugMixin(object):
+    """
+    Allocates slugs which are unique per language within a scope (the pk of
+    the jobs app config) for a TranslatedAutoSlugifyMixin model.
+
+    All conflicting slugs are fetched with a single prefix query, instead of
+    one query per candidate. The scope is denormalized into the `slug_scope`
+    field of the translations, where a unique constraint backs the
+    allocation, and a translation whose slug was taken concurrently is saved
+    again with the next free slug. `reserved_slugs` are never allocated.
+    """
+    slug_save_attempts = 3
+    reserved_slugs = ()
+
+    def get_slug_scope(self):
+        raise NotImplementedError
+
+    def _get_slug_translations(self, language):
+        translations = self._parler_meta.root_model.objects.filter(
+            language_code=language, slug_scope=self.get_slug_scope())
+        if self.pk:
+            translations = translations.exclude(master_id=self.pk)
+        return translations
+
+    def _slug_exists(self, slug, language=None, **kwargs):
+        language = (
+            language or self.get_current_language() or get_default_language())
+        return self._get_slug_translations(language).filter(slug=slug).exists()
+
+    def make_new_slug(self, slug=None, language=None, **kwargs):
+        if not slug:
+            slug = self._get_ideal_slug()
+        language = (
+            language or self.get_current_language() or get_default_language())
+        # Truncated candidates for up to 4 digit suffixes share this prefix,
+        # anything beyond that is left to the unique constraint.
+        prefix = slug[:self.get_slug_max_length(idx_len=4)]
+        taken = set(
+            self._get_slug_translations(language)
+                .filter(slug__startswith=prefix)
+                .values_list('slug', flat=True)
+        )
+        taken.update(self.reserved_slugs)
+        idx = 1
+        candidate = slug
+        max_length = self.get_slug_max_length()
+        while candidate in taken:
+            if len(candidate) > max_length:
+                max_length = self.get_slug_max_length(len(str(idx)))
+            candidate = self._get_candidate_slug(slug[:max_length], idx)
+            idx += 1
+        return candidate
+
+    def save(self, **kwargs):
+        slug = self._get_existing_slug()
+        setattr(self, self.slug_field_name, self.make_new_slug(slug=slug))
+        # The slug is final now, skip TranslatedAutoSlugifyMixin.save() which
+        # would check it once more.
+        result = super(TranslatedAutoSlugifyMixin, self).save(**kwargs)
+        # Translations which were not loaded are not saved by parler.
+        update_slug_scope(self.translations.all(), self.get_slug_scope())
+        return result
+
+    def save_translation(self, translation, *args, **kwargs):
+        translation.slug_scope = self.get_slug_scope()
+        attempts = self.slug_save_attempts
+        while True:
+            try:
+                with transaction.atomic():
+                    return super(ScopedSlugMixin, self).save_translation(
+                        translation, *args, **kwargs)
+            except IntegrityError:
+                attempts -= 1
+                slug = translation.slug
+                language = translation.language_code
+                if not attempts or not self._slug_exists(slug, language):
+                    raise
+                translation.slug = self.make_new_slug(slug, language)
+
+
 @python_2_unicode_compatible
-class JobCategory(TranslatedAutoSlugifyMixin,
+class JobCategory(ScopedSlugMixin,
+                  TranslatedAutoSlugifyMixin,
                   TranslationHelperMixin,
                   TranslatableModel):
     slug_source_field_name = 'name'
+    # The first path segment of the apphook's other URLs, see urls.py.
+    reserved_slugs = ('alerts', 'api', 'feed')
 
     translations = TranslatedFields(
         name=models.CharField(_('name'), max_length=255),
         slug=models.SlugField(
             _('slug'), max_length=255, blank=True,
             help_text=_('Auto-generated. Used in the URL. If changed, the URL '
-                        'will change. Clear it to have the slug re-created.'))
+                        'will change. Clear it to have the slug re-created.')),
+        # pk of the app config, see ScopedSlugMixin
+        slug_scope=models.PositiveIntegerField(null=True, editable=False),
+        # URLs are resolved by slug within the current language.
+        meta={
+            'index_together': [('language_code', 'slug')],
+            'unique_together': [('language_code', 'slug_scope', 'slug')],
+        },
     )
 
     supervisors = models.ManyToManyField(
@@ -110,22 +268,40 @@ class JobCategory(TranslatedAutoSlugifyMixin,
     def __str__(self):
         return self.safe_translation_getter('name', str(self.pk))
 
-    def _slug_exists(self, *args, **kwargs):
-        """Provide additional filtering for slug generation"""
-        qs = kwargs.get('qs', None)
-        if qs is None:
-            qs = self._get_slug_queryset()
-        # limit qs to current app_config only
-        kwargs['qs'] = qs.filter(app_config=self.app_config)
-        return super(JobCategory, self)._slug_exists(*args, **kwargs)
+    def get_slug_scope(self):
+        return self.app_config_id
+
+    def save(self, **kwargs):
+        super(JobCategory, self).save(**kwargs)
+        # The slugs of the job openings are scoped by app config, too.
+        update_slug_scope(
+            JobOpening._parler_meta.root_model.objects.filter(
+                master__category=self),
+            self.app_config_id)
+
+    def get_namespace(self):
+        config = get_jobs_config(pk=self.app_config_id)
+        if config is not None:
+            return config.namespace
+        return 'aldryn_jobs'
 
     def get_absolute_url(self, language=None):
         language = language or self.get_current_language()
         slug = self.safe_translation_getter('slug', language_code=language)
-        if self.app_config_id:
-            namespace = self.app_config.namespace
-        else:
-            namespace = 'aldryn_jobs'
+        return self._get_url(language, slug)
+
+    def get_absolute_urls(self, languages=None):
+        """
+        Returns a dict of the URLs of the category in the given languages (all
+        configured ones by default), with one query for all slugs.
+        """
+        slugs = get_translated_slugs(self)
+        return dict(
+            (language, self._get_url(language, slugs.get(language)))
+            for language in languages or get_language_codes())
+
+    def _get_url(self, language, slug):
+        namespace = self.get_namespace()
         with force_language(language):
             try:
                 if not slug:
@@ -134,13 +310,13 @@ class JobCategory(TranslatedAutoSlugifyMixin,
                 return reverse(
                     '{0}:category-job-opening-list'.format(namespace),
                     kwargs=kwargs,
-                    current_app=self.app_config.namespace
+                    current_app=namespace
                 )
             except NoReverseMatch:
                 return "/%s/" % language
 
     def get_notification_emails(self):
-        return self.supervisors.values_list('email', flat=True)
+        return get_category_notification_emails(self.pk)
 
     # We keep this 'count' name for compatibility in templates:
     # there used to be annotate() call with the same property name.
@@ -148,8 +324,54 @@ class JobCategory(TranslatedAutoSlugifyMixin,
         return self.jobs.active().count()
 
 
+def get_category_notification_emails(category_id):
+    """
+    Returns the email addresses of the supervisors of the category, cached
+    until the supervisors or their addresses change.
+    """
+    key = get_notification_emails_cache_key(category_id)
+    emails = cache.get(key)
+    if emails is None:
+        # Needs no query for the category itself.
+        emails = list(JobCategory(pk=category_id).supervisors.values_list(
+            'email', flat=True))
+        cache.set(key, emails)
+    return emails
+
+
+@receiver(m2m_changed, sender=JobCategory.supervisors.through)
+def invalidate_notification_emails_on_supervisor_change(
+        sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            invalidate_notification_emails([instance.pk])
+    elif action == 'pre_clear':
+        # The categories of the user are unknown after clearing.
+        instance._cleared_job_category_ids = list(
+            instance.job_opening_categories.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        invalidate_notification_emails(
+            getattr(instance, '_cleared_job_category_ids', []))
+    elif action in ('post_add', 'post_remove'):
+        invalidate_notification_emails(pk_set)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_notification_emails_on_user_change(sender, instance, **kwargs):
+    if kwargs.get('created'):
+        return
+    # e.g. the last login time only
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and 'email' not in update_fields:
+        return
+    invalidate_notification_emails(
+        instance.job_opening_categories.values_list('pk', flat=True))
+
+
 @python_2_unicode_compatible
-class JobOpening(TranslatedAutoSlugifyMixin,
+class JobOpening(ScopedSlugMixin,
+                 TranslatedAutoSlugifyMixin,
                  TranslationHelperMixin,
                  TranslatableModel):
     slug_source_field_name = 'title'
@@ -163,7 +385,26 @@ class JobOpening(TranslatedAutoSlugifyMixin,
                         'will change. Clear it to have the slug re-created.')),
         lead_in=HTMLField(
             _('short description'), blank=True,
-            help_text=_('This text will be displayed in lists.'))
+            help_text=_('This text will be displayed in lists.')),
+        # Hash of the last imported row, see aldryn_jobs.importer.
+        import_hash=models.CharField(
+            max_length=40, blank=True, default='', editable=False),
+        # pk of the category's app config, see ScopedSlugMixin
+        slug_scope=models.PositiveIntegerField(null=True, editable=False),
+        # Path of the detail page relative to the apphook, see
+        # update_job_opening_paths().
+        url_path=models.CharField(
+            max_length=512, blank=True, default='', editable=False),
+        # Plain text of get_search_data() as of the opening's
+        # search_data_version, see aldryn_jobs.feeds.
+        search_data=models.TextField(blank=True, default='', editable=False),
+        search_data_version=models.PositiveIntegerField(
+            null=True, editable=False),
+        # URLs are resolved by slug within the current language.
+        meta={
+            'index_together': [('language_code', 'slug')],
+            'unique_together': [('language_code', 'slug_scope', 'slug')],
+        },
     )
 
     content = PlaceholderField('Job Opening Content')
@@ -173,9 +414,27 @@ class JobOpening(TranslatedAutoSlugifyMixin,
     publication_start = models.DateTimeField(_('published since'), null=True, blank=True)
     publication_end = models.DateTimeField(_('published until'), null=True, blank=True)
     can_apply = models.BooleanField(_('viewer can apply for the job?'), default=True)
+    # Materialized publication state, kept up to date by save() and the
+    # "update_job_openings" management command. Use it instead of evaluating
+    # the publication window on every query.
+    is_live = models.BooleanField(
+        _('live?'), default=False, editable=False, db_index=True)
 
     ordering = models.IntegerField(_('ordering'), default=0)
 
+    # Identifier of the opening in an external system it is imported from.
+    external_id = models.CharField(
+        _('external id'), max_length=255, unique=True, null=True, blank=True,
+        editable=False)
+
+    # Incremented whenever the rendered opening may change, see
+    # aldryn_jobs.templatetags.aldryn_jobs_tags.render_job_openings.
+    version = models.PositiveIntegerField(default=0, editable=False)
+    # When the opening was claimed for sending job alerts, see
+    # aldryn_jobs.alerts.
+    alerted = models.DateTimeField(
+        null=True, blank=True, editable=False, db_index=True)
+
     objects = JobOpeningsManager()
 
     class Meta:
@@ -187,30 +446,79 @@ class JobOpening(TranslatedAutoSlugifyMixin,
     def __str__(self):
         return self.safe_translation_getter('title', str(self.pk))
 
-    def _slug_exists(self, *args, **kwargs):
-        """Provide additional filtering for slug generation"""
-        qs = kwargs.get('qs', None)
-        if qs is None:
-            qs = self._get_slug_queryset()
-        # limit qs to current app_config only
-        kwargs['qs'] = qs.filter(category__app_config=self.category.app_config)
-        return super(JobOpening, self)._slug_exists(*args, **kwargs)
+    def get_slug_scope(self):
+        return self.category.app_config_id
+
+    def save(self, **kwargs):
+        is_live = self.get_active()
+        adding = self._state.adding
+        if adding:
+            changed = is_live
+        else:
+            # Flipped by a conditional update rather than compared with the
+            # possibly stale instance, so concurrent saves send one signal
+            # per transition.
+            changed = bool(
+                JobOpening.objects.filter(pk=self.pk)
+                                  .exclude(is_live=is_live)
+                                  .update(is_live=is_live))
+        self.is_live = is_live
+        if not adding:
+            # Incremented in the database, so a stale instance can't reuse a
+            # version number.
+            self.version = models.F('version') + 1
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {
+                'is_live', 'version'}
+        super(JobOpening, self).save(**kwargs)
+        if not adding:
+            # Incremented by the save and the receivers of the translations.
+            self.refresh_from_db(fields=['version'])
+
+        if changed:
+            send_on_commit(
+                job_opening_published if is_live else job_opening_unpublished,
+                sender=self.__class__, job_opening=self)
 
     def get_absolute_url(self, language=None):
         language = language or self.get_current_language()
         if not language:
             language = get_current_language()
+        try:
+            url_path = self.get_translation(language).url_path
+        except ObjectDoesNotExist:
+            url_path = None
+        if url_path:
+            app_url = get_app_url(self.category.get_namespace(), language)
+            if app_url is not None:
+                return app_url + url_path
         slug = self.safe_translation_getter('slug', language_code=language)
         category_slug = self.category.safe_translation_getter(
             'slug', language_code=language
         )
-        namespace = getattr(
-            self.category.app_config, "namespace", "aldryn_jobs")
+        return self._get_url(language, slug, category_slug)
+
+    def get_absolute_urls(self, languages=None):
+        """
+        Returns a dict of the URLs of the opening in the given languages (all
+        configured ones by default), with one query for the slugs of the
+        opening and one for those of its category.
+        """
+        slugs = get_translated_slugs(self)
+        category_slugs = get_translated_slugs(self.category)
+        return dict(
+            (language, self._get_url(
+                language, slugs.get(language), category_slugs.get(language)))
+            for language in languages or get_language_codes())
+
+    def _get_url(self, language, slug, category_slug):
+        namespace = self.category.get_namespace()
         with force_language(language):
             try:
                 # FIXME: does not looks correct return category url here
                 if not slug:
-                    return self.category.get_absolute_url(language=language)
+                    return self.category._get_url(language, category_slug)
                 kwargs = {
                     'category_slug': category_slug,
                     'job_opening_slug': slug,
@@ -218,7 +526,7 @@ class JobOpening(TranslatedAutoSlugifyMixin,
                 return reverse(
                     '{0}:job-opening-detail'.format(namespace),
                     kwargs=kwargs,
-                    current_app=self.category.app_config.namespace
+                    current_app=namespace
                 )
             except NoReverseMatch:
                 # FIXME: this is wrong, if have some problem in reverse
@@ -233,7 +541,7 @@ class JobOpening(TranslatedAutoSlugifyMixin,
         ])
 
     def get_notification_emails(self):
-        return self.category.get_notification_emails()
+        return get_category_notification_emails(self.category_id)
 
     def get_search_data(self, language=None, request=None):
         """
@@ -282,9 +590,24 @@ class JobApplication(models.Model):
     created = models.DateTimeField(_('created'), auto_now_add=True)
     is_rejected = models.BooleanField(_('rejected?'), default=False)
     rejection_date = models.DateTimeField(_('rejection date'), null=True, blank=True)
+    # Bulk updates have to set it, too, see update_application_statistics.
+    modified = models.DateTimeField(
+        _('modified'), auto_now=True, db_index=True)
+    # When the staff was notified, None while waiting for a digest.
+    notified = models.DateTimeField(
+        _('staff notified'), null=True, blank=True, editable=False,
+        db_index=True)
+    # Chosen by the client, repeated submissions with the same key are
+    # answered with the application stored for the first one.
+    idempotency_key = models.CharField(
+        max_length=255, null=True, blank=True, editable=False)
 
     class Meta:
         ordering = ['-created']
+        unique_together = [('job_opening', 'idempotency_key')]
+        # Looks up repeated applications, see
+        # forms.get_application_repeat_window().
+        index_together = [('job_opening', 'email', 'created')]
         verbose_name = _('job application')
         verbose_name_plural = _('job applications')
 
@@ -303,12 +626,354 @@ def cleanup_attachments(sender, instance, **kwargs):
             attachment.file.delete(False)
 
 
+@receiver(post_save, sender=JobOpening)
+@receiver(post_delete, sender=JobOpening)
+def invalidate_job_opening_content(sender, instance, **kwargs):
+    # Might be deleted along with its category, don't rely on the relation.
+    invalidate_job_content(JobCategory.objects.filter(
+        pk=instance.category_id).values_list('app_config_id', flat=True))
+
+
+@receiver(post_save, sender=JobCategory)
+@receiver(post_delete, sender=JobCategory)
+def invalidate_job_category_content(sender, instance, **kwargs):
+    invalidate_job_content([instance.app_config_id])
+
+
+# App config pks of which the plugins are cleared once the current
+# transaction of the thread is committed.
+_pending_config_ids = local()
+
+
+def _clear_pending_plugin_caches():
+    config_ids = set(_pending_config_ids.value)
+    _pending_config_ids.value.clear()
+    # Only the first hook of a transaction finds any configs.
+    if not config_ids:
+        return
+    placeholders = set()
+    for model in (JobListPlugin, JobCategoriesPlugin):
+        plugins = model.objects.filter(
+            app_config_id__in=config_ids).select_related('placeholder')
+        for plugin in plugins:
+            if (plugin.placeholder_id, plugin.language) not in placeholders:
+                placeholders.add((plugin.placeholder_id, plugin.language))
+                plugin.placeholder.clear_cache(plugin.language)
+
+
+def invalidate_job_content(config_ids):
+    """
+    Forgets all cached job content (see invalidate_content()) and, once the
+    current transaction (if any) is committed, the django CMS placeholder
+    cache of the jobs plugins of the given app configs. Pages cached by
+    django CMS expire at the next publication transition at the latest.
+    """
+    invalidate_content()
+    config_ids = [pk for pk in config_ids if pk is not None]
+    if not config_ids:
+        return
+    if not hasattr(_pending_config_ids, 'value'):
+        _pending_config_ids.value = set()
+    _pending_config_ids.value.update(config_ids)
+    on_commit = getattr(transaction, 'on_commit', None)
+    if on_commit is None:
+        # Django < 1.9
+        _clear_pending_plugin_caches()
+    else:
+        # Configs of a rolled back transaction are cleared with the next one,
+        # which is harmless.
+        on_commit(_clear_pending_plugin_caches)
+
+
+@receiver(post_save, sender=JobsConfig)
+@receiver(post_delete, sender=JobsConfig)
+def invalidate_jobs_config_cache(sender, **kwargs):
+    invalidate_jobs_configs()
+
+
+def get_job_opening_path(category_slug, slug):
+    return '{0}/{1}/'.format(category_slug, slug)
+
+
+def update_job_opening_paths(job_openings, language=None):
+    """
+    Stores the path of the detail page, relative to the apphook, in the
+    translations of the given job openings (a queryset), in the given
+    language or all of them. Translations are updated with one query per
+    category and language, translations of which the category has no slug in
+    their language get no path.
+    """
+    translation_model = JobOpening._parler_meta.root_model
+    translations = translation_model.objects.filter(master__in=job_openings)
+    category_slugs = JobCategory._parler_meta.root_model.objects.filter(
+        master__jobs__in=job_openings).exclude(slug='')
+    if language is not None:
+        translations = translations.filter(language_code=language)
+        category_slugs = category_slugs.filter(language_code=language)
+    category_slugs = category_slugs.values_list(
+        'master_id', 'language_code', 'slug').distinct()
+
+    with transaction.atomic():
+        translations.update(url_path='')
+        for category_id, language_code, category_slug in category_slugs:
+            translations.filter(
+                master__category_id=category_id, language_code=language_code,
+            ).exclude(slug='').update(url_path=Concat(
+                models.Value(category_slug + '/'), 'slug',
+                models.Value('/')))
+    # Bulk updates bypass the translation cache of parler.
+    cache.delete_many([
+        get_translation_cache_key(translation_model, master_id, language_code)
+        for master_id, language_code in translations.values_list(
+            'master_id', 'language_code')])
+
+
+@receiver(pre_save, sender=JobOpening._parler_meta.root_model)
+def set_job_opening_path(sender, instance, **kwargs):
+    category_slug = JobCategory._parler_meta.root_model.objects.filter(
+        master__jobs=instance.master_id,
+        language_code=instance.language_code,
+    ).values_list('slug', flat=True).first()
+    if category_slug and instance.slug:
+        instance.url_path = get_job_opening_path(category_slug, instance.slug)
+    else:
+        instance.url_path = ''
+
+
+@receiver(post_save, sender=JobOpening)
+def update_paths_on_job_opening_change(sender, instance, created, **kwargs):
+    # The category may have changed, new openings have no translations yet.
+    if not created:
+        update_job_opening_paths(JobOpening.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=JobCategory._parler_meta.root_model)
+@receiver(post_delete, sender=JobCategory._parler_meta.root_model)
+def update_paths_on_category_change(sender, instance, **kwargs):
+    update_job_opening_paths(
+        JobOpening.objects.filter(category_id=instance.master_id),
+        instance.language_code)
+
+
+def bump_job_opening_versions(job_openings):
+    """
+    Marks the rendered fragments of the given job openings as outdated.
+    """
+    job_openings.update(version=models.F('version') + 1)
+
+
+@receiver(post_save, sender=JobOpening._parler_meta.root_model)
+@receiver(post_delete, sender=JobOpening._parler_meta.root_model)
+def bump_version_on_translation_change(sender, instance, **kwargs):
+    bump_job_opening_versions(
+        JobOpening.objects.filter(pk=instance.master_id))
+
+
+@receiver(post_save, sender=JobCategory)
+@receiver(post_save, sender=JobCategory._parler_meta.root_model)
+def bump_version_on_category_change(sender, instance, **kwargs):
+    category_id = getattr(instance, 'master_id', instance.pk)
+    bump_job_opening_versions(
+        JobOpening.objects.filter(category_id=category_id))
+
+
+# Connected to the plugin models in AldrynJobs.ready().
+def bump_version_on_content_change(sender, instance, **kwargs):
+    # Plugins of any type in the "content" placeholder of an opening.
+    if instance.placeholder_id:
+        bump_job_opening_versions(
+            JobOpening.objects.filter(content_id=instance.placeholder_id))
+
+
+def purge_job_opening_pages(job_openings, lists=True):
+    """
+    Purges the detail pages of the given job openings and, unless `lists` is
+    False, the list pages of their app configs from surrogate caches.
+    """
+    if get_purge_backend() is None:
+        return
+    keys = []
+    values = job_openings.values_list('pk', 'category__app_config_id')
+    for job_opening_id, config_id in values:
+        keys.append(get_opening_key(job_opening_id))
+        if lists:
+            keys.append(get_config_key(config_id))
+    purge(keys)
+
+
+@receiver(post_save, sender=JobOpening)
+@receiver(post_delete, sender=JobOpening)
+def purge_job_opening(sender, instance, **kwargs):
+    if get_purge_backend() is None:
+        return
+    # Might be deleted along with its category, don't rely on the relation.
+    config_ids = JobCategory.objects.filter(
+        pk=instance.category_id,
+    ).values_list('app_config_id', flat=True)
+    purge([get_opening_key(instance.pk)] + [
+        get_config_key(config_id) for config_id in config_ids])
+
+
+@receiver(job_opening_published)
+@receiver(job_opening_unpublished)
+def purge_published_job_opening(sender, job_opening, **kwargs):
+    purge_job_opening_pages(JobOpening.objects.filter(pk=job_opening.pk))
+
+
+@receiver(post_save, sender=JobOpening._parler_meta.root_model)
+@receiver(post_delete, sender=JobOpening._parler_meta.root_model)
+def purge_job_opening_translation(sender, instance, **kwargs):
+    purge_job_opening_pages(JobOpening.objects.filter(pk=instance.master_id))
+
+
+# Connected to the plugin models in AldrynJobs.ready().
+def purge_job_opening_content(sender, instance, **kwargs):
+    # Plugins of any type in the "content" placeholder of an opening.
+    if instance.placeholder_id:
+        purge_job_opening_pages(
+            JobOpening.objects.filter(content_id=instance.placeholder_id),
+            lists=False)
+
+
+@receiver(post_save, sender=JobCategory)
+@receiver(post_delete, sender=JobCategory)
+def purge_job_category(sender, instance, **kwargs):
+    purge([get_category_key(instance.pk),
+           get_config_key(instance.app_config_id)])
+
+
+@receiver(post_save, sender=JobCategory._parler_meta.root_model)
+@receiver(post_delete, sender=JobCategory._parler_meta.root_model)
+def purge_job_category_translation(sender, instance, **kwargs):
+    if get_purge_backend() is None:
+        return
+    config_ids = JobCategory.objects.filter(
+        pk=instance.master_id,
+    ).values_list('app_config_id', flat=True)
+    purge([get_category_key(instance.master_id)] + [
+        get_config_key(config_id) for config_id in config_ids])
+
+
+@receiver(job_opening_published)
+@receiver(job_opening_unpublished)
+def clear_publication_dependent_caches(sender, job_opening, **kwargs):
+    invalidate_job_content([job_opening.category.app_config_id])
+    # Job openings are part of the menu, which is cached by django CMS.
+    menu_pool.clear(all=True)
+
+
 class JobApplicationAttachment(models.Model):
     application = models.ForeignKey(JobApplication, related_name='attachments',
                                     verbose_name=_('job application'))
     file = JobApplicationFileField()
 
 
+@python_2_unicode_compatible
+class JobAlertSubscription(models.Model):
+    """
+    A subscription to email alerts about new openings in a category, in one
+    language. Alerts are only sent once the address is confirmed.
+    """
+    category = models.ForeignKey(
+        JobCategory, related_name='alert_subscriptions',
+        verbose_name=_('category'))
+    language = models.CharField(_('language'), max_length=15)
+    email = models.EmailField(_('email'), max_length=254)
+    # Identifies the subscription in confirmation and unsubscribe links.
+    key = models.CharField(
+        max_length=32, unique=True, editable=False,
+        default=get_random_key)
+    is_confirmed = models.BooleanField(_('confirmed?'), default=False)
+    created = models.DateTimeField(_('created'), auto_now_add=True)
+    # The batch of job openings the last alert was sent for.
+    last_alert = models.DateTimeField(
+        _('last alert'), null=True, blank=True, editable=False)
+
+    class Meta:
+        ordering = ['-created']
+        unique_together = [('category', 'language', 'email')]
+        verbose_name = _('job alert subscription')
+        verbose_name_plural = _('job alert subscriptions')
+
+    def __str__(self):
+        return self.email
+
+
+@python_2_unicode_compatible
+class JobApplicationStatistic(models.Model):
+    """
+    The applications for a job opening on one day, maintained by the
+    update_application_statistics management command.
+    """
+    job_opening = models.ForeignKey(
+        JobOpening, related_name='application_statistics',
+        verbose_name=_('job opening'))
+    date = models.DateField(_('date'))
+    applications = models.PositiveIntegerField(_('applications'), default=0)
+    rejections = models.PositiveIntegerField(_('rejections'), default=0)
+    attachments = models.PositiveIntegerField(_('attachments'), default=0)
+    # Set when applications of the day were deleted.
+    is_stale = models.BooleanField(default=False, editable=False)
+
+    class Meta:
+        ordering = ['-date']
+        unique_together = [('job_opening', 'date')]
+        verbose_name = _('application statistic')
+        verbose_name_plural = _('application statistics')
+
+    def __str__(self):
+        return '{0} {1}'.format(self.job_opening, self.date)
+
+
+@python_2_unicode_compatible
+class Watermark(models.Model):
+    """
+    The point in time up to which a batch job processed its data.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    value = models.DateTimeField()
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def get_value(cls, name):
+        return (
+            cls.objects.filter(name=name).values_list('value', flat=True)
+                                         .first()
+        )
+
+    @classmethod
+    def set_value(cls, name, value):
+        cls.objects.update_or_create(name=name, defaults={'value': value})
+
+
+@receiver(post_delete, sender=JobApplication)
+def mark_application_statistic_stale(sender, instance, **kwargs):
+    JobApplicationStatistic.objects.filter(
+        job_opening_id=instance.job_opening_id,
+        date=get_statistic_date(instance.created),
+    ).update(is_stale=True)
+
+
+def get_available_job_openings(namespace, language, translated=True):
+    """
+    Returns the active job openings of a namespace in the given language, with
+    everything needed to render their links fetched along with them. Openings
+    without a translation in the language are only included if `translated`
+    is False.
+    """
+    job_openings = JobOpening.objects.namespace(namespace).language(language)
+    if translated:
+        job_openings = job_openings.active_translations(language)
+    return (
+        job_openings.active()
+                    .distinct()
+                    .select_related('category__app_config')
+                    .prefetch_related('translations', 'category__translations')
+    )
+
+
 @python_2_unicode_compatible
 class JobListPlugin(CMSPlugin):
     """ Store job list for JobListPlugin. """
@@ -328,25 +993,91 @@ class JobListPlugin(CMSPlugin):
                     "show latest. Note that Job Openings from different "
                     "app configs will not appear."))
 
+    SORT_ORDER_MANUAL = 'manual'
+    SORT_ORDER_NEWEST = 'newest'
+    SORT_ORDER_CHOICES = (
+        (SORT_ORDER_MANUAL, _('as ordered in the admin')),
+        (SORT_ORDER_NEWEST, _('newest first')),
+    )
+
+    sort_order = models.CharField(
+        _('order'), max_length=10, choices=SORT_ORDER_CHOICES,
+        default=SORT_ORDER_MANUAL,
+        help_text=_('Order of the latest Job Openings, if none are chosen.'))
+    max_openings = models.PositiveIntegerField(
+        _('maximum number of job openings'), null=True, blank=True,
+        help_text=_('Number of latest Job Openings to show, if none are '
+                    'chosen. Leave empty to show all.'))
+
     def __str__(self):
         return force_text(self.pk)
 
-    def get_job_openings(self, namespace):
+    def get_selected_job_opening_ids(self):
+        # The through model is ordered by the sort value of the selection.
+        return list(self.jobopenings.through.objects.filter(
+            joblistplugin_id=self.pk,
+        ).values_list('jobopening_id', flat=True))
+
+    def get_latest_job_openings(self, available):
         """
-        Return the selected JobOpening for JobListPlugin.
+        Returns the latest openings out of the `available` openings (in the
+        default order of job openings), in the configured order and limited
+        to the configured number. Only iterates `available`, so a shared
+        queryset is fetched once.
+        """
+        openings = list(available)
+        if self.sort_order == self.SORT_ORDER_NEWEST:
+            openings.sort(key=lambda opening: opening.created, reverse=True)
+            # Openings without a publication start come after the others.
+            openings.sort(key=lambda opening: (
+                opening.publication_start is not None,
+                opening.publication_start,
+            ), reverse=True)
+        if self.max_openings is not None:
+            openings = openings[:self.max_openings]
+        return openings
+
+    def get_selected_job_openings(self, namespace, selected):
+        """
+        Returns the active openings out of the `selected` pks, in the order of
+        the selection. Selected openings are shown in languages they aren't
+        translated to, too.
+        """
+        openings = dict(
+            (opening.pk, opening) for opening in get_available_job_openings(
+                namespace, self.language, translated=False,
+            ).filter(pk__in=selected))
+        return [openings[pk] for pk in selected if pk in openings]
 
-        If no JobOpening are selected, return all active events for namespace
-        and language, sorted by title.
+    def get_job_openings(self, namespace, available=None):
         """
-        if self.jobopenings.exists():
-            return self.jobopenings.namespace(namespace).active()
+        Return the selected JobOpening for JobListPlugin.
 
-        return (
-            JobOpening.objects.namespace(namespace)
-                              .language(self.language)
-                              .active_translations(self.language)
-                              .active()
-        )
+        If no JobOpening are selected, return the latest active openings for
+        namespace and language, see get_latest_job_openings().
+
+        `available` may be given as a queryset of the active openings for
+        namespace and language shared by several plugins, which then share a
+        single query for the latest openings.
+        """
+        selected = self.get_selected_job_opening_ids()
+        if selected:
+            return self.get_selected_job_openings(namespace, selected)
+        if available is None:
+            available = get_available_job_openings(namespace, self.language)
+        return self.get_latest_job_openings(available)
+
+    def count_job_openings(self, namespace, available):
+        """
+        Returns the number of openings get_job_openings() would return without
+        the configured limit.
+        """
+        selected = self.get_selected_job_opening_ids()
+        if selected:
+            return get_available_job_openings(
+                namespace, self.language, translated=False,
+            ).filter(pk__in=selected).count()
+        return len(available)
 
     def copy_relations(self, oldinstance):
         self.app_config = oldinstance.app_config
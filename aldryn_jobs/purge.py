@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Surrogate keys for job pages and purging of them from a CDN or reverse proxy.
+
+Responses are tagged with the keys of the content they show (see
+patch_surrogate_keys()); model changes purge the affected keys through the
+backend configured in ``ALDRYN_JOBS_PURGE_BACKEND`` once the transaction is
+committed, with one request for all keys of the transaction.
+"""
+from __future__ import unicode_literals
+
+import logging
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+from django.utils.six.moves.urllib.error import URLError
+from django.utils.six.moves.urllib.request import Request, urlopen
+
+SURROGATE_KEY_HEADER = getattr(
+    settings, 'ALDRYN_JOBS_SURROGATE_KEY_HEADER', 'Surrogate-Key')
+
+logger = logging.getLogger(__name__)
+
+# Keys to purge once the current transaction of the thread is committed.
+_pending = threading.local()
+
+
+def get_config_key(config_id):
+    return 'aldryn-jobs-config-{0}'.format(config_id)
+
+
+def get_category_key(category_id):
+    return 'aldryn-jobs-category-{0}'.format(category_id)
+
+
+def get_opening_key(opening_id):
+    return 'aldryn-jobs-opening-{0}'.format(opening_id)
+
+
+def patch_surrogate_keys(response, keys):
+    """
+    Adds the given keys to the surrogate key header of the response.
+    """
+    keys = set(keys) | set(response.get(SURROGATE_KEY_HEADER, '').split())
+    response[SURROGATE_KEY_HEADER] = ' '.join(sorted(keys))
+
+
+def patch_surrogate_control(response):
+    """
+    Allows surrogates to cache a public response for
+    ``ALDRYN_JOBS_SURROGATE_MAX_AGE`` seconds, if set. Purging keeps it up to
+    date in the meantime.
+    """
+    max_age = getattr(settings, 'ALDRYN_JOBS_SURROGATE_MAX_AGE', None)
+    if max_age is not None:
+        response['Surrogate-Control'] = 'max-age={0}'.format(max_age)
+
+
+class BasePurgeBackend(object):
+    """
+    Purges nothing, subclasses purge the given keys from their surrogate
+    cache.
+    """
+
+    def purge(self, keys):
+        pass
+
+
+class HTTPPurgeBackend(BasePurgeBackend):
+    """
+    Sends a PURGE request with the keys in the surrogate key header to
+    ``ALDRYN_JOBS_PURGE_URL``, as understood by e.g. Varnish with xkey or a
+    local stand-in during development.
+    """
+    method = 'PURGE'
+
+    def __init__(self, url=None, timeout=5):
+        self.url = url or settings.ALDRYN_JOBS_PURGE_URL
+        self.timeout = timeout
+
+    def purge(self, keys):
+        request = Request(self.url, headers={
+            SURROGATE_KEY_HEADER: ' '.join(keys),
+        })
+        request.get_method = lambda: self.method
+        try:
+            urlopen(request, timeout=self.timeout).close()
+        except URLError as e:
+            # The change itself is saved, outdated pages expire eventually.
+            logger.error('Could not purge %s: %s', ' '.join(keys), e)
+
+
+def get_purge_backend():
+    path = getattr(settings, 'ALDRYN_JOBS_PURGE_BACKEND', None)
+    if not path:
+        return None
+    return import_string(path)()
+
+
+def _purge_now(backend, keys):
+    try:
+        backend.purge(keys)
+    except Exception:
+        # The change itself is saved, outdated pages expire eventually.
+        logger.exception('Could not purge %s', ' '.join(keys))
+
+
+def _purge_pending(backend):
+    keys = sorted(_pending.keys)
+    _pending.keys.clear()
+    # Only the first hook of a transaction finds any keys.
+    if keys:
+        _purge_now(backend, keys)
+
+
+def purge(keys):
+    """
+    Purges the given surrogate keys once the current transaction (if any) is
+    committed, together with all other keys purged in the transaction.
+    """
+    backend = get_purge_backend()
+    if backend is None or not keys:
+        return
+    on_commit = getattr(transaction, 'on_commit', None)
+    if on_commit is None:
+        # Django < 1.9
+        _purge_now(backend, sorted(set(keys)))
+        return
+    if not hasattr(_pending, 'keys'):
+        _pending.keys = set()
+    # Keys of a rolled back transaction are purged with the next one, which
+    # is harmless.
+    _pending.keys.update(keys)
+    on_commit(lambda: _purge_pending(backend))
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Optional rate limits for job applications, per client IP address and per job
+opening::
+
+    # At most 5 applications per IP address in 10 minutes, and 100 per job
+    # opening in an hour.
+    ALDRYN_JOBS_APPLICATION_RATE_LIMIT_PER_IP = (5, 600)
+    ALDRYN_JOBS_APPLICATION_RATE_LIMIT_PER_OPENING = (100, 3600)
+
+Requests over a limit are answered with 429 Too Many Requests. The job views
+check the limits themselves, but under django CMS the request body, with all
+its uploads, is parsed by the toolbar middleware before any view runs. Add
+the middleware before it to reject requests before that::
+
+    MIDDLEWARE_CLASSES = [
+        ...
+        'aldryn_jobs.ratelimit.ApplicationRateLimitMiddleware',
+        'cms.middleware.toolbar.ToolbarMiddleware',
+    ]
+
+Counters are kept in the default cache, which has to be shared by all
+processes (e.g. memcached or redis) for the limits to be global.
+"""
+from __future__ import unicode_literals
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.urlresolvers import Resolver404, resolve
+from django.http import HttpResponse, JsonResponse
+from django.utils.translation import ugettext
+
+from .cache import get_cache_key, get_jobs_config
+from .models import JobOpening
+
+try:
+    from django.utils.deprecation import MiddlewareMixin
+except ImportError:
+    # Django < 1.10
+    MiddlewareMixin = object
+
+# Names of the URL patterns through which applications are submitted.
+APPLICATION_URL_NAMES = ('job-opening-detail', 'api-job-application-create')
+
+
+def get_ip_limit():
+    return getattr(settings, 'ALDRYN_JOBS_APPLICATION_RATE_LIMIT_PER_IP', None)
+
+
+def get_opening_limit():
+    return getattr(
+        settings, 'ALDRYN_JOBS_APPLICATION_RATE_LIMIT_PER_OPENING', None)
+
+
+def get_client_ip(request):
+    # e.g. 'HTTP_X_FORWARDED_FOR' behind a proxy, which appends the address
+    # of the client it received the request from.
+    header = getattr(settings, 'ALDRYN_JOBS_CLIENT_IP_HEADER', None)
+    if header and request.META.get(header):
+        return request.META[header].split(',')[-1].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def hit(scope, identifier, limit):
+    """
+    Counts a request for the identifier and returns whether it exceeds the
+    (count, seconds) limit.
+
+    The sliding window is approximated from the counters of the current and
+    the previous fixed window, the latter weighted by how much of it still
+    overlaps the sliding window.
+    """
+    count, period = limit
+    now = time.time()
+    window = int(now // period)
+    key = get_cache_key('ratelimit', scope, identifier, window)
+    cache.add(key, 0, period * 2)
+    try:
+        current = cache.incr(key)
+    except ValueError:
+        # Expired since it was added.
+        cache.set(key, 1, period * 2)
+        current = 1
+    previous = cache.get(
+        get_cache_key('ratelimit', scope, identifier, window - 1), 0)
+    overlap = 1 - (now % period) / period
+    return previous * overlap + current > count
+
+
+def get_job_opening_pk(namespace, kwargs):
+    """
+    Returns the pk of the job opening the application URL with the given
+    keyword arguments refers to, None if there is no such opening.
+    """
+    if 'pk' in kwargs:
+        return kwargs['pk']
+    return (
+        JobOpening.objects.namespace(namespace)
+                          .filter(translations__url_path='{0}/{1}/'.format(
+                              kwargs['category_slug'],
+                              kwargs['job_opening_slug']))
+                          .values_list('pk', flat=True)
+                          .first()
+    )
+
+
+def check_rate_limits(request, resolver_match):
+    """
+    Counts an application request for the URL the resolver match describes
+    and returns a 429 response if it exceeds a limit, None otherwise.
+    Requests are only counted once, even if checked several times.
+    """
+    if getattr(request, '_aldryn_jobs_rate_limits_checked', False):
+        return None
+    request._aldryn_jobs_rate_limits_checked = True
+
+    limit = get_ip_limit()
+    # A client over its own limit doesn't count against the opening.
+    if limit and hit('ip', get_client_ip(request), limit):
+        return get_rate_limited_response(resolver_match, limit)
+    limit = get_opening_limit()
+    if limit:
+        pk = get_job_opening_pk(resolver_match.namespace, resolver_match.kwargs)
+        if pk is not None and hit('opening', pk, limit):
+            return get_rate_limited_response(resolver_match, limit)
+    return None
+
+
+def get_rate_limited_response(resolver_match, limit):
+    if resolver_match.url_name.startswith('api-'):
+        response = JsonResponse({'status': 'rate limited'}, status=429)
+    else:
+        response = HttpResponse(
+            ugettext('Too many applications, please try again later.'),
+            content_type='text/plain; charset=utf-8', status=429)
+    response['Retry-After'] = str(limit[1])
+    return response
+
+
+def is_application_request(request, resolver_match):
+    return (
+        request.method == 'POST'
+        and resolver_match.url_name in APPLICATION_URL_NAMES
+        and get_jobs_config(namespace=resolver_match.namespace) is not None
+    )
+
+
+class ApplicationRateLimitMiddleware(MiddlewareMixin):
+    """
+    Checks the rate limits of applications before the request body is
+    parsed.
+    """
+
+    def process_request(self, request):
+        if request.method != 'POST' or not (get_ip_limit()
+                                            or get_opening_limit()):
+            return None
+        try:
+            resolver_match = resolve(request.path_info)
+        except Resolver404:
+            return None
+        if not is_application_request(request, resolver_match):
+            return None
+        return check_rate_limits(request, resolver_match)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Optional routing of aldryn_jobs reads to a read replica.
+
+Add the router to the settings and name the replica database::
+
+    DATABASE_ROUTERS = ['aldryn_jobs.routers.ReplicaRouter']
+    ALDRYN_JOBS_REPLICA_DATABASE = 'replica'
+
+Only reads within read_from_replica() blocks are sent to the replica: the
+job views for safe requests (see views.ReplicaReadMixin), the menus,
+sitemaps and plugins. Writes and everything else, e.g. the admin, use the
+default database.
+"""
+from __future__ import unicode_literals
+
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+APP_LABEL = 'aldryn_jobs'
+
+_local = threading.local()
+
+
+def get_replica_database():
+    return getattr(settings, 'ALDRYN_JOBS_REPLICA_DATABASE', None)
+
+
+@contextmanager
+def read_from_replica():
+    """
+    Sends reads of aldryn_jobs models within the block to the replica, if
+    one is configured.
+    """
+    depth = getattr(_local, 'depth', 0)
+    _local.depth = depth + 1
+    try:
+        yield
+    finally:
+        _local.depth = depth
+
+
+def is_reading_from_replica():
+    return bool(get_replica_database() and getattr(_local, 'depth', 0))
+
+
+class ReplicaRouter(object):
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label == APP_LABEL and is_reading_from_replica():
+            return get_replica_database()
+        return None
+
+    def db_for_write(self, model, **hints):
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same data as the default database.
+        databases = {DEFAULT_DB_ALIAS, get_replica_database()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):
+        return None
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from django.db import transaction
+from django.dispatch import Signal
+
+
+# Sent when a job opening becomes visible to the public, either because it was
+# saved in a live state or because its publication window has started.
+job_opening_published = Signal(providing_args=['job_opening'])
+
+# Sent when a job opening stops being visible to the public, either because it
+# was deactivated or because its publication window has ended.
+job_opening_unpublished = Signal(providing_args=['job_opening'])
+
+
+def send_on_commit(signal, sender, **kwargs):
+    """
+    Sends the signal once the current transaction (if any) is committed, so
+    receivers don't act on changes which are rolled back.
+    """
+    on_commit = getattr(transaction, 'on_commit', None)
+    if on_commit is None:
+        # Django < 1.9
+        signal.send(sender=sender, **kwargs)
+    else:
+        on_commit(lambda: signal.send(sender=sender, **kwargs))
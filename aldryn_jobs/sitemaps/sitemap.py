@@ -2,6 +2,7 @@
 from django.contrib.sitemaps import Sitemap
 
 from ..models import JobCategory, JobOpening
+from ..routers import read_from_replica
 
 
 class JobOpeningCategoriesSitemap(Sitemap):
@@ -9,7 +10,8 @@ class JobOpeningCategoriesSitemap(Sitemap):
     priority = 0.5
 
     def items(self):
-        return JobCategory.objects.all()
+        with read_from_replica():
+            return list(JobCategory.objects.all())
 
 
 class JobOpeningSitemap(Sitemap):
@@ -17,7 +19,11 @@ class JobOpeningSitemap(Sitemap):
     priority = 0.5
 
     def items(self):
-        return JobOpening.objects.active()
+        with read_from_replica():
+            job_openings = (JobOpening.objects.active()
+                                              .select_related('category')
+                                              .prefetch_related('translations'))
+            return list(job_openings)
 
     def lastmod(self, obj):
         return obj.publication_start
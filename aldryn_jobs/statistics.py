@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Daily application statistics per job opening, see JobApplicationStatistic.
+Figures per category or namespace are sums over those of their openings.
+"""
+from __future__ import unicode_literals
+
+import datetime
+import operator
+from collections import defaultdict
+from datetime import timedelta
+from functools import reduce
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import JobApplication, JobApplicationStatistic, Watermark
+from .utils import get_statistic_date
+
+WATERMARK_NAME = 'application-statistics'
+
+# Date ranges per query, keeps the number of query parameters bounded.
+RANGES_PER_QUERY = 100
+
+
+def get_watermark_overlap():
+    """
+    Returns the seconds before the watermark from which changed applications
+    are processed again, so that those committed late are not missed.
+    """
+    return getattr(
+        settings, 'ALDRYN_JOBS_APPLICATION_STATISTICS_OVERLAP', 300)
+
+
+def get_day_start(date):
+    start = datetime.datetime.combine(date, datetime.time())
+    if settings.USE_TZ:
+        start = timezone.make_aware(start)
+    return start
+
+
+def get_changed_days(since=None):
+    """
+    Returns a {job opening pk: set of dates} dict of the days with
+    applications changed since the given time, of all days if None, and of
+    the days with deleted applications.
+    """
+    days = defaultdict(set)
+    applications = JobApplication.objects.all()
+    if since is not None:
+        applications = applications.filter(modified__gte=since)
+    for job_opening_id, created in applications.values_list(
+            'job_opening_id', 'created').iterator():
+        days[job_opening_id].add(get_statistic_date(created))
+    stale = JobApplicationStatistic.objects.filter(is_stale=True)
+    for job_opening_id, date in stale.values_list('job_opening_id', 'date'):
+        days[job_opening_id].add(date)
+    return days
+
+
+def get_date_ranges(dates):
+    """
+    Returns the given dates as a sorted list of [first, last] date ranges of
+    consecutive days.
+    """
+    ranges = []
+    for date in sorted(dates):
+        if ranges and date - ranges[-1][1] == timedelta(days=1):
+            ranges[-1][1] = date
+        else:
+            ranges.append([date, date])
+    return ranges
+
+
+def update_statistics(job_opening_id, dates):
+    """
+    Counts the applications for the job opening on the given days anew, with
+    one query per RANGES_PER_QUERY ranges of consecutive days.
+    """
+    counts = dict((date, [0, 0, 0]) for date in dates)
+    ranges = get_date_ranges(dates)
+    for offset in range(0, len(ranges), RANGES_PER_QUERY):
+        days = reduce(operator.or_, [
+            Q(created__gte=get_day_start(first),
+              created__lt=get_day_start(last + timedelta(days=1)))
+            for first, last in ranges[offset:offset + RANGES_PER_QUERY]
+        ])
+        applications = (
+            JobApplication.objects.filter(
+                days, job_opening_id=job_opening_id)
+            .annotate(attachment_count=Count('attachments'))
+            .values_list('created', 'is_rejected', 'attachment_count')
+        )
+        for created, is_rejected, attachment_count in applications.iterator():
+            date = get_statistic_date(created)
+            if date in counts:
+                counts[date][0] += 1
+                counts[date][1] += int(is_rejected)
+                counts[date][2] += attachment_count
+
+    with transaction.atomic():
+        JobApplicationStatistic.objects.filter(
+            job_opening_id=job_opening_id, date__in=dates).delete()
+        JobApplicationStatistic.objects.bulk_create([
+            JobApplicationStatistic(
+                job_opening_id=job_opening_id, date=date,
+                applications=count, rejections=rejections,
+                attachments=attachments)
+            for date, (count, rejections, attachments)
+            in sorted(counts.items()) if count
+        ])
+
+
+def update_application_statistics(full=False):
+    """
+    Updates the statistics of the days with applications changed since the
+    last update, or of all days. Returns the number of days updated.
+    """
+    now = timezone.now()
+    since = None if full else Watermark.get_value(WATERMARK_NAME)
+    if since is not None:
+        since -= timedelta(seconds=get_watermark_overlap())
+    changed_days = get_changed_days(since)
+    if full:
+        JobApplicationStatistic.objects.all().delete()
+    for job_opening_id, dates in changed_days.items():
+        update_statistics(job_opening_id, dates)
+    Watermark.set_value(WATERMARK_NAME, now)
+    return sum(len(dates) for dates in changed_days.values())
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from django import template
+from django.core.cache import cache
+from django.utils import six
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from ..cache import get_cache_key, get_max_cache_timeout
+
+register = template.Library()
+
+
+def get_job_opening_fragment_key(job_opening, template_name, request):
+    if not isinstance(job_opening.version, six.integer_types):
+        # Saved since it was loaded.
+        return None
+    toolbar = getattr(request, 'toolbar', None)
+    if toolbar is not None and getattr(
+            toolbar, 'edit_mode_active', getattr(toolbar, 'edit_mode', False)):
+        # Frontend editing adds its scripts to the page with sekizai, which
+        # doesn't work for cached output.
+        return None
+    user = getattr(request, 'user', None)
+    return get_cache_key(
+        'job', job_opening.pk, job_opening.version, get_language(),
+        template_name, int(bool(user and user.is_staff)))
+
+
+@register.simple_tag(takes_context=True)
+def render_job_openings(context, job_openings,
+                        template_name='aldryn_jobs/includes/job.html'):
+    """
+    Renders every job opening with the given template into its
+    `rendered_fragment` attribute and returns the openings as a list::
+
+        {% render_job_openings object_list as job_openings %}
+        {% for job_opening in job_openings %}
+            {{ job_opening.rendered_fragment }}
+        {% endfor %}
+
+    The fragments are cached per opening version and language, and fetched
+    with a single cache query.
+    """
+    job_openings = list(job_openings)
+    request = context.get('request')
+    keys = [
+        get_job_opening_fragment_key(job_opening, template_name, request)
+        for job_opening in job_openings]
+    cached = cache.get_many([key for key in keys if key])
+    fragment_template = context.template.engine.get_template(template_name)
+    missing = {}
+    for job_opening, key in zip(job_openings, keys):
+        fragment = cached.get(key) if key else None
+        if fragment is None:
+            with context.push(job_opening=job_opening):
+                fragment = fragment_template.render(context)
+            if key:
+                missing[key] = fragment
+        job_opening.rendered_fragment = mark_safe(fragment)
+    if missing:
+        cache.set_many(missing, get_max_cache_timeout())
+    return job_openings
@@ -0,0 +1,206 @@
+import smtplib
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.core.urlresolvers import reverse
+from django.test import override_settings
+from django.utils.six import StringIO
+from django.utils.translation import override
+
+from ..alerts import send_job_alerts
+from ..models import JobAlertSubscription, JobCategory, Watermark
+
+from .base import JobsBaseTestCase
+
+REFUSED = 'refused@example.com'
+
+
+class RefusingEmailBackend(EmailBackend):
+
+    def send_messages(self, messages):
+        for message in messages:
+            if REFUSED in message.to:
+                raise smtplib.SMTPRecipientsRefused({REFUSED: (550, b'')})
+        return super(RefusingEmailBackend, self).send_messages(messages)
+
+
+class FailingEmailBackend(EmailBackend):
+
+    def send_messages(self, messages):
+        raise smtplib.SMTPServerDisconnected()
+
+
+class JobAlertTestCase(JobsBaseTestCase):
+
+    def setUp(self):
+        super(JobAlertTestCase, self).setUp()
+        with override('en'):
+            self.other_category = JobCategory.objects.create(
+                app_config=self.app_config, name='Other category')
+        # Openings published before the first subscriptions aren't alerted.
+        send_job_alerts()
+
+    def get_url(self, name, **kwargs):
+        with override('en'):
+            return reverse(
+                '{0}:{1}'.format(self.app_config.namespace, name),
+                kwargs=kwargs)
+
+    def subscribe(self, email, category, is_confirmed=True):
+        return JobAlertSubscription.objects.create(
+            email=email, category=category, language='en',
+            is_confirmed=is_confirmed)
+
+    def send_alerts(self, chunk_size=None):
+        mail.outbox = []
+        sent = send_job_alerts(chunk_size=chunk_size)
+        self.assertEqual(sent, len(mail.outbox))
+        return dict((message.to[0], message) for message in mail.outbox)
+
+    def test_subscribe_sends_confirmation(self):
+        url = self.get_url('job-alert-subscribe')
+        response = self.client.get(
+            url, {'category': self.default_category.pk})
+        self.assertContains(response, 'name="email"')
+
+        mail.outbox = []
+        response = self.client.post(url, {
+            'email': 'jane@example.com',
+            'category': self.default_category.pk,
+        })
+        self.assertEqual(response.status_code, 302)
+        subscription = JobAlertSubscription.objects.get()
+        self.assertEqual(subscription.language, 'en')
+        self.assertFalse(subscription.is_confirmed)
+        self.assertEqual(len(mail.outbox), 1)
+        confirm_url = self.get_url('job-alert-confirm', key=subscription.key)
+        self.assertIn(confirm_url, mail.outbox[0].body)
+
+        # Following the link doesn't confirm, submitting the page does.
+        self.assertEqual(self.client.get(confirm_url).status_code, 200)
+        self.assertFalse(
+            JobAlertSubscription.objects.get().is_confirmed)
+        response = self.client.post(confirm_url)
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(JobAlertSubscription.objects.get().is_confirmed)
+
+        # Subscribing again doesn't create another subscription.
+        self.client.post(url, {
+            'email': 'jane@example.com',
+            'category': self.default_category.pk,
+        })
+        self.assertEqual(JobAlertSubscription.objects.count(), 1)
+
+    def test_confirmation_is_sent_once_per_interval(self):
+        url = self.get_url('job-alert-subscribe')
+        mail.outbox = []
+        for email in ['jane@example.com', 'Jane@Example.com']:
+            self.client.post(url, {
+                'email': email,
+                'category': self.default_category.pk,
+            })
+        self.assertEqual(
+            JobAlertSubscription.objects.get().email, 'jane@example.com')
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(
+        EMAIL_BACKEND='aldryn_jobs.tests.test_alerts.FailingEmailBackend')
+    def test_subscribe_survives_mail_errors(self):
+        response = self.client.post(self.get_url('job-alert-subscribe'), {
+            'email': 'jane@example.com',
+            'category': self.default_category.pk,
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(JobAlertSubscription.objects.exists())
+
+    def test_one_alert_per_address(self):
+        self.subscribe('jane@example.com', self.default_category)
+        self.subscribe('jane@example.com', self.other_category)
+        self.subscribe('john@example.com', self.other_category)
+        self.subscribe('unconfirmed@example.com', self.default_category,
+                       is_confirmed=False)
+        job_opening = self.create_default_job_opening()
+        other = self.create_new_job_opening(
+            self.prepare_data(1, category=self.other_category))
+
+        alerts = self.send_alerts()
+        self.assertEqual(
+            sorted(alerts), ['jane@example.com', 'john@example.com'])
+        with override('en'):
+            self.assertIn(job_opening.title, alerts['jane@example.com'].body)
+            self.assertIn(other.title, alerts['jane@example.com'].body)
+            self.assertNotIn(job_opening.title,
+                             alerts['john@example.com'].body)
+
+        # Nothing new, nothing sent.
+        self.assertEqual(self.send_alerts(), {})
+
+    def test_chunks(self):
+        for number in range(5):
+            self.subscribe('user{0}@example.com'.format(number),
+                           self.default_category)
+        self.subscribe('user0@example.com', self.other_category)
+        self.create_default_job_opening()
+        self.create_new_job_opening(
+            self.prepare_data(1, category=self.other_category))
+        self.assertEqual(len(self.send_alerts(chunk_size=2)), 5)
+        self.assertFalse(JobAlertSubscription.objects.filter(
+            last_alert__isnull=True).exists())
+
+    @override_settings(
+        EMAIL_BACKEND='aldryn_jobs.tests.test_alerts.RefusingEmailBackend')
+    def test_refused_recipients_are_not_alerted_again(self):
+        self.subscribe('jane@example.com', self.default_category)
+        self.subscribe(REFUSED, self.default_category)
+        self.subscribe('john@example.com', self.default_category)
+        self.create_default_job_opening()
+        self.assertEqual(
+            sorted(self.send_alerts()),
+            ['jane@example.com', 'john@example.com'])
+        self.assertFalse(JobAlertSubscription.objects.filter(
+            last_alert__isnull=True).exists())
+        self.assertEqual(self.send_alerts(), {})
+
+    def test_categories_without_config_are_skipped(self):
+        self.subscribe('jane@example.com', self.default_category)
+        with override('en'):
+            orphan = JobCategory.objects.create(name='Orphan')
+        self.create_new_job_opening(self.prepare_data(1, category=orphan))
+        self.create_default_job_opening()
+        self.assertEqual(list(self.send_alerts()), ['jane@example.com'])
+
+    def test_resumes_interrupted_run(self):
+        subscription = self.subscribe('jane@example.com',
+                                      self.default_category)
+        self.subscribe('john@example.com', self.default_category)
+        self.create_default_job_opening()
+        alerts = self.send_alerts()
+        self.assertEqual(len(alerts), 2)
+
+        # As if the run was interrupted before the second chunk was sent.
+        subscription.last_alert = None
+        subscription.save()
+        Watermark.objects.all().delete()
+        self.assertEqual(list(self.send_alerts()), ['jane@example.com'])
+
+    def test_unsubscribe(self):
+        subscription = self.subscribe('jane@example.com',
+                                      self.default_category)
+        self.create_default_job_opening()
+        alerts = self.send_alerts()
+        unsubscribe_url = self.get_url('job-alert-unsubscribe',
+                                       key=subscription.key)
+        self.assertIn(unsubscribe_url, alerts['jane@example.com'].body)
+
+        response = self.client.post(unsubscribe_url)
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(JobAlertSubscription.objects.exists())
+        self.assertEqual(self.client.post(unsubscribe_url).status_code, 404)
+
+    def test_command(self):
+        self.subscribe('jane@example.com', self.default_category)
+        self.create_default_job_opening()
+        stdout = StringIO()
+        call_command('send_job_alerts', stdout=stdout)
+        self.assertIn('1 alert(s) sent.', stdout.getvalue())
@@ -0,0 +1,147 @@
+import json
+
+from django.core import mail
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.urlresolvers import reverse
+from django.utils.translation import override
+
+from ..models import JobApplication, JobOpening
+
+from .base import JobsBaseTestCase
+
+
+class JobOpeningAPITestCase(JobsBaseTestCase):
+
+    def get_url(self, name='api-job-opening-list', language='en'):
+        with override(language):
+            return reverse('{0}:{1}'.format(self.app_config.namespace, name))
+
+    def get_json(self, url, status_code=200, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status_code)
+        return json.loads(b''.join(response.streaming_content).decode('utf-8')
+                          if response.streaming else
+                          response.content.decode('utf-8'))
+
+    def test_lists_active_openings_of_namespace_and_language(self):
+        job_opening = self.create_default_job_opening(translated=True)
+        self.create_new_job_opening(self.prepare_data(1, update_date=True))
+        data = self.get_json(self.get_url(language='de'))
+        self.assertEqual(data['next'], None)
+        self.assertEqual(len(data['results']), 1)
+        item = data['results'][0]
+        with override('de'):
+            job_opening = JobOpening.objects.get(pk=job_opening.pk)
+            self.assertEqual(item['title'], job_opening.title)
+            self.assertEqual(item['url'], job_opening.get_absolute_url())
+        self.assertEqual(item['category'], self.default_category.pk)
+
+    def test_cursor_pagination(self):
+        openings = [self.create_new_job_opening(self.prepare_data(number))
+                    for number in range(3)]
+        url = self.get_url()
+        data = self.get_json(url, limit=2)
+        ids = [item['id'] for item in data['results']]
+        self.assertEqual(len(ids), 2)
+        data = self.get_json(data['next'])
+        ids += [item['id'] for item in data['results']]
+        self.assertIsNone(data['next'])
+        self.assertEqual(ids, sorted(opening.pk for opening in openings))
+
+        self.get_json(url, status_code=400, cursor='invalid')
+
+    def test_field_selection(self):
+        self.create_default_job_opening()
+        data = self.get_json(self.get_url(), fields='id,title')
+        self.assertEqual(list(data['results'][0]), ['id', 'title'])
+
+        data = self.get_json(self.get_url(), status_code=400, fields='secret')
+        self.assertIn('secret', data['error'])
+
+    def test_etag_changes_with_content(self):
+        job_opening = self.create_default_job_opening()
+        url = self.get_url()
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        job_opening.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_lists_categories(self):
+        data = self.get_json(self.get_url('api-job-category-list'))
+        self.assertEqual(data['results'], [{
+            'id': self.default_category.pk,
+            'name': self.default_category.name,
+            'slug': self.default_category.slug,
+            'ordering': self.default_category.ordering,
+            'url': self.default_category.get_absolute_url('en'),
+        }])
+
+
+class JobApplicationAPITestCase(JobsBaseTestCase):
+
+    def get_url(self, job_opening):
+        with override('en'):
+            return reverse(
+                '{0}:api-job-application-create'.format(
+                    self.app_config.namespace),
+                kwargs={'pk': job_opening.pk})
+
+    def post(self, job_opening, data, status_code, **extra):
+        response = self.client.post(self.get_url(job_opening), data, **extra)
+        self.assertEqual(response.status_code, status_code)
+        return json.loads(response.content.decode('utf-8'))
+
+    def get_data(self, **kwargs):
+        data = {
+            'first_name': 'Jane',
+            'last_name': 'Doe',
+            'email': 'jane@example.com',
+        }
+        data.update(kwargs)
+        return data
+
+    def test_creates_application_with_attachments(self):
+        job_opening = self.create_default_job_opening()
+        data = self.post(job_opening, self.get_data(attachments=[
+            SimpleUploadedFile('cv.txt', b'curriculum vitae')]), 201)
+        application = JobApplication.objects.get(pk=data['id'])
+        self.addCleanup(application.delete)
+        self.assertEqual(data['status'], 'created')
+        self.assertEqual(application.job_opening, job_opening)
+        self.assertEqual(application.attachments.count(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_invalid_application(self):
+        job_opening = self.create_default_job_opening()
+        data = self.post(job_opening, self.get_data(email='invalid'), 400)
+        self.assertEqual(data['status'], 'invalid')
+        self.assertEqual(list(data['errors']), ['email'])
+        self.assertFalse(JobApplication.objects.exists())
+
+    def test_idempotency_key(self):
+        job_opening = self.create_default_job_opening()
+        first = self.post(job_opening, self.get_data(), 201,
+                          HTTP_IDEMPOTENCY_KEY='key')
+        sent = len(mail.outbox)
+        repeated = self.post(job_opening, self.get_data(), 200,
+                             HTTP_IDEMPOTENCY_KEY='key')
+        self.assertEqual(repeated, first)
+        self.assertEqual(len(mail.outbox), sent)
+        self.assertEqual(JobApplication.objects.count(), 1)
+
+        # Keys are scoped to the job opening.
+        other = self.create_new_job_opening(self.prepare_data(1))
+        self.post(other, self.get_data(), 201, HTTP_IDEMPOTENCY_KEY='key')
+
+    def test_closed_and_unknown_openings(self):
+        job_opening = self.create_default_job_opening()
+        job_opening.can_apply = False
+        job_opening.save()
+        self.post(job_opening, self.get_data(), 403)
+        job_opening.is_active = False
+        job_opening.save()
+        self.post(job_opening, self.get_data(), 404)
+        self.assertFalse(JobApplication.objects.exists())
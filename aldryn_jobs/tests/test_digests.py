@@ -0,0 +1,141 @@
+import smtplib
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils.six import StringIO
+from django.utils.translation import override
+
+from ..digests import claim_pending_applications, get_claimed_applications
+from ..forms import JobApplicationForm
+from ..models import JobApplication, JobCategory
+
+from .base import JobsBaseTestCase
+
+REFUSED = 'supervisor@example.com'
+
+
+class RefusingEmailBackend(EmailBackend):
+
+    def send_messages(self, messages):
+        for message in messages:
+            if REFUSED in message.to:
+                raise smtplib.SMTPRecipientsRefused({REFUSED: (550, b'')})
+        return super(RefusingEmailBackend, self).send_messages(messages)
+
+
+@override_settings(ALDRYN_JOBS_NOTIFICATION_DIGEST='category')
+class NotificationDigestTestCase(JobsBaseTestCase):
+
+    def setUp(self):
+        super(NotificationDigestTestCase, self).setUp()
+        self.supervisor = self.create_supervisor('supervisor')
+        self.default_category.supervisors.add(self.supervisor)
+        with override('en'):
+            self.other_category = JobCategory.objects.create(
+                app_config=self.app_config, name='Other category')
+        self.other_supervisor = self.create_supervisor('other')
+        self.other_category.supervisors.add(
+            self.supervisor, self.other_supervisor)
+
+    def create_supervisor(self, name):
+        user = self.create_user(name, name)
+        user.email = '{0}@example.com'.format(name)
+        user.save()
+        return user
+
+    def apply(self, job_opening, number):
+        data = dict(
+            (field, value.format(number))
+            for field, value in self.application_values_raw.items())
+        form = JobApplicationForm(data, job_opening=job_opening)
+        self.assertTrue(form.is_valid())
+        return form.save()
+
+    def send_digests(self):
+        mail.outbox = []
+        call_command('send_application_digests', stdout=StringIO())
+        return dict(
+            (tuple(sorted(message.to)), message) for message in mail.outbox)
+
+    def create_applications(self):
+        job_opening = self.create_default_job_opening()
+        other = self.create_new_job_opening(
+            self.prepare_data(1, category=self.other_category))
+        mail.outbox = []
+        applications = [
+            self.apply(job_opening, 1),
+            self.apply(job_opening, 2),
+            self.apply(other, 3),
+        ]
+        # Confirmations only.
+        self.assertEqual(len(mail.outbox), 3)
+        return applications
+
+    def test_digest_per_category(self):
+        applications = self.create_applications()
+        messages = self.send_digests()
+        self.assertEqual(sorted(messages), [
+            ('other@example.com', 'supervisor@example.com'),
+            ('supervisor@example.com',),
+        ])
+        body = messages[('supervisor@example.com',)].body
+        self.assertIn(applications[0].get_full_name(), body)
+        self.assertIn(applications[1].get_full_name(), body)
+        self.assertNotIn(applications[2].get_full_name(), body)
+        self.assertFalse(
+            JobApplication.objects.filter(notified__isnull=True).exists())
+
+        self.assertEqual(self.send_digests(), {})
+
+    @override_settings(ALDRYN_JOBS_NOTIFICATION_DIGEST='supervisor')
+    def test_digest_per_supervisor(self):
+        applications = self.create_applications()
+        messages = self.send_digests()
+        self.assertEqual(sorted(messages), [
+            ('other@example.com',),
+            ('supervisor@example.com',),
+        ])
+        body = messages[('supervisor@example.com',)].body
+        for application in applications:
+            self.assertIn(application.get_full_name(), body)
+        self.assertIn('3 new job applications',
+                      messages[('supervisor@example.com',)].subject)
+
+    @override_settings(ALDRYN_JOBS_NOTIFICATION_DIGEST='supervisor')
+    def test_failed_supervisor_digest_does_not_repeat_others(self):
+        applications = self.create_applications()
+        with override_settings(EMAIL_BACKEND='aldryn_jobs.tests.'
+                                             'test_digests.RefusingEmailBackend'):
+            messages = self.send_digests()
+        self.assertEqual(sorted(messages), [('other@example.com',)])
+
+        # Only the applications which were in no digest sent are pending.
+        self.assertEqual(
+            sorted(JobApplication.objects.filter(
+                notified__isnull=True).values_list('pk', flat=True)),
+            [applications[0].pk, applications[1].pk])
+        messages = self.send_digests()
+        self.assertEqual(sorted(messages), [('supervisor@example.com',)])
+        body = messages[('supervisor@example.com',)].body
+        self.assertNotIn(applications[2].get_full_name(), body)
+
+    def test_applications_are_claimed_once(self):
+        applications = self.create_applications()
+        claimed = claim_pending_applications()
+        # An overlapping run finds nothing left to send.
+        self.assertFalse(get_claimed_applications(
+            claim_pending_applications()).exists())
+        self.assertEqual(
+            len(get_claimed_applications(claimed)), len(applications))
+        self.assertEqual(self.send_digests(), {})
+
+    @override_settings(ALDRYN_JOBS_NOTIFICATION_DIGEST=None)
+    def test_immediate_notifications(self):
+        job_opening = self.create_default_job_opening()
+        mail.outbox = []
+        application = self.apply(job_opening, 1)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIsNotNone(application.notified)
+        self.assertEqual(self.send_digests(), {})
@@ -0,0 +1,124 @@
+import os
+import shutil
+import tempfile
+from xml.etree import ElementTree
+
+from django.core.management import call_command
+from django.core.urlresolvers import reverse
+from django.utils.six import StringIO
+from django.utils.translation import override
+
+from cms import api
+
+from ..feeds import generate_feed, iter_job_openings
+from ..models import JobCategory, JobOpening
+
+from .base import JobsBaseTestCase
+
+
+class JobOpeningFeedTestCase(JobsBaseTestCase):
+
+    def get_url(self, language='en'):
+        with override(language):
+            return reverse(
+                '{0}:job-opening-feed'.format(self.app_config.namespace))
+
+    def get_feed(self, language='en'):
+        response = self.client.get(self.get_url(language))
+        self.assertEqual(response.status_code, 200)
+        return ElementTree.fromstring(b''.join(response.streaming_content))
+
+    def get_jobs(self, feed):
+        return dict((job.findtext('referencenumber'), job)
+                    for job in feed.findall('job'))
+
+    def test_lists_active_openings_of_namespace_and_language(self):
+        job_opening = self.create_default_job_opening(translated=True)
+        other = self.create_new_job_opening(self.prepare_data(1))
+        self.create_new_job_opening(self.prepare_data(2, update_date=True))
+
+        jobs = self.get_jobs(self.get_feed())
+        self.assertEqual(
+            sorted(jobs), sorted([str(job_opening.pk), str(other.pk)]))
+        job = jobs[str(job_opening.pk)]
+        self.assertEqual(job.findtext('title'), job_opening.title)
+        self.assertEqual(job.findtext('url'), 'http://testserver{0}'.format(
+            job_opening.get_absolute_url('en')))
+        self.assertEqual(job.findtext('category'), self.default_category.name)
+        self.assertIn(self.default_plugin_content['en'],
+                      job.findtext('description'))
+
+        jobs = self.get_jobs(self.get_feed('de'))
+        self.assertEqual(list(jobs), [str(job_opening.pk)])
+        self.assertIn(self.default_plugin_content['de'],
+                      jobs[str(job_opening.pk)].findtext('description'))
+
+    def test_category_named_feed_does_not_shadow_the_feed(self):
+        with override('en'):
+            category = JobCategory.objects.create(
+                name='Feed', app_config=self.app_config)
+        job_opening = self.create_new_job_opening(
+            self.prepare_data(1, category=category))
+        self.assertEqual(list(self.get_jobs(self.get_feed())),
+                         [str(job_opening.pk)])
+
+    def test_search_data_is_stored_until_the_opening_changes(self):
+        job_opening = self.create_default_job_opening()
+        self.get_feed()
+        with self.assertNumQueries(2):
+            # Categories and the only chunk of openings.
+            list(generate_feed(self.app_config.namespace, 'en', ''))
+
+        api.add_plugin(job_opening.content, 'TextPlugin', 'en',
+                       body='Changed job details')
+        job = self.get_jobs(self.get_feed())[str(job_opening.pk)]
+        self.assertIn('Changed job details', job.findtext('description'))
+
+    def test_invalid_characters_are_removed(self):
+        job_opening = self.create_default_job_opening()
+        with override('en'):
+            job_opening = JobOpening.objects.get(pk=job_opening.pk)
+            job_opening.title = 'Job\x0b opening'
+            job_opening.save()
+        job = self.get_jobs(self.get_feed())[str(job_opening.pk)]
+        self.assertEqual(job.findtext('title'), 'Job opening')
+
+    def test_chunks(self):
+        openings = [self.create_new_job_opening(self.prepare_data(number))
+                    for number in range(5)]
+        chunks = list(iter_job_openings(
+            self.app_config.namespace, 'en', chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual([row['pk'] for chunk in chunks for row in chunk],
+                         [opening.pk for opening in openings])
+
+    def test_etag_changes_with_content(self):
+        job_opening = self.create_default_job_opening()
+        url = self.get_url()
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        job_opening.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_command(self):
+        job_opening = self.create_default_job_opening()
+        stdout = StringIO()
+        call_command('export_job_feed', self.app_config.namespace,
+                     language='en', base_url='https://example.com/',
+                     stdout=stdout)
+        feed = ElementTree.fromstring(stdout.getvalue().encode('utf-8'))
+        job = self.get_jobs(feed)[str(job_opening.pk)]
+        self.assertEqual(job.findtext('url'), 'https://example.com{0}'.format(
+            job_opening.get_absolute_url('en')))
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'feed.xml')
+        call_command('export_job_feed', self.app_config.namespace,
+                     language='en', output=path, stdout=StringIO())
+        self.assertEqual(
+            list(self.get_jobs(ElementTree.parse(path).getroot())),
+            [str(job_opening.pk)])
@@ -1,5 +1,12 @@
-from ..models import JobCategory
-from ..forms import JobCategoryAdminForm, JobOpeningAdminForm
+from datetime import timedelta
+
+from django.core import mail
+from django.test import override_settings
+
+from ..models import JobApplication, JobCategory
+from ..forms import (
+    JobApplicationForm, JobCategoryAdminForm, JobOpeningAdminForm,
+)
 
 from .base import JobsBaseTestCase
 
@@ -204,3 +211,48 @@ class JobOpeningAdminFormTestCase(JobsBaseTestCase):
                          data['title'])
         self.assertGreater(len(new_opening.slug), 0)
         self.assertEqual(new_opening.category, self.default_category)
+
+
+class JobApplicationFormTestCase(JobsBaseTestCase):
+
+    def get_form(self, job_opening, **kwargs):
+        data = {
+            'first_name': 'Jane',
+            'last_name': 'Doe',
+            'email': 'jane@example.com',
+        }
+        data.update(kwargs)
+        form = JobApplicationForm(data, job_opening=job_opening)
+        self.assertTrue(form.is_valid())
+        return form
+
+    def test_rendered_form_is_saved_once(self):
+        job_opening = self.create_default_job_opening()
+        token = JobApplicationForm(
+            job_opening=job_opening).fields['idempotency_key'].initial
+        form = self.get_form(job_opening, idempotency_key=token)
+        application, created = form.save_once()
+        self.assertTrue(created)
+        sent = len(mail.outbox)
+        # e.g. a double click
+        form = self.get_form(job_opening, idempotency_key=token)
+        self.assertEqual(form.save_once(), (application, False))
+        self.assertEqual(len(mail.outbox), sent)
+        self.assertEqual(JobApplication.objects.count(), 1)
+
+        # Forms without a token are always saved.
+        self.assertTrue(self.get_form(job_opening).save_once()[1])
+
+    def test_repeat_window(self):
+        job_opening = self.create_default_job_opening()
+        application, created = self.get_form(job_opening).save_once()
+        with override_settings(ALDRYN_JOBS_APPLICATION_REPEAT_WINDOW=60):
+            self.assertEqual(
+                self.get_form(job_opening).save_once(), (application, False))
+            form = self.get_form(job_opening, email='Jane@Example.com')
+            self.assertEqual(form.save_once(), (application, False))
+            form = self.get_form(job_opening, email='john@example.com')
+            self.assertTrue(form.save_once()[1])
+            JobApplication.objects.filter(pk=application.pk).update(
+                created=application.created - timedelta(seconds=61))
+            self.assertTrue(self.get_form(job_opening).save_once()[1])
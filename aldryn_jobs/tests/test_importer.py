@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+
+from django.core.management import call_command
+from django.utils.six import StringIO
+from django.utils.translation import override
+
+from ..importer import import_job_openings
+from ..models import JobOpening
+
+from .base import JobsBaseTestCase
+
+
+class ImportJobOpeningsTestCase(JobsBaseTestCase):
+
+    def get_rows(self, **overrides):
+        rows = [{
+            'external_id': 'ats-1',
+            'language': 'en',
+            'category': self.default_category.slug,
+            'title': 'Software Engineer',
+            'lead_in': 'Write code.',
+        }, {
+            'external_id': 'ats-1',
+            'language': 'de',
+            'category': self.default_category.slug,
+            'title': 'Softwareentwickler',
+        }, {
+            'external_id': 'ats-2',
+            'language': 'en',
+            'category': self.default_category.slug,
+            'title': 'Software Engineer',
+            'is_active': 'false',
+        }]
+        for row in rows:
+            row.update(overrides)
+        return rows
+
+    def import_rows(self, rows):
+        return import_job_openings(rows, self.app_config.namespace)
+
+    def test_import_creates_openings_and_translations(self):
+        result = self.import_rows(self.get_rows())
+        self.assertEqual((result.created, result.updated), (2, 0))
+        self.assertEqual(result.errors, [])
+
+        first = JobOpening.objects.language('de').get(external_id='ats-1')
+        self.assertEqual(first.title, 'Softwareentwickler')
+        self.assertTrue(first.is_live)
+        self.assertIsNotNone(first.content_id)
+        second = JobOpening.objects.language('en').get(external_id='ats-2')
+        self.assertFalse(second.is_live)
+        with override('en'):
+            first.set_current_language('en')
+            # same title in the same namespace gets a unique slug
+            self.assertEqual(first.slug, 'software-engineer')
+            self.assertEqual(second.slug, 'software-engineer-1')
+            self.assertEqual(first.get_absolute_url('en'), '{0}{1}/{2}/'.format(
+                self.page.get_absolute_url('en'), self.default_category.slug,
+                'software-engineer'))
+
+    def test_reimport_skips_unchanged_rows(self):
+        self.import_rows(self.get_rows())
+        rows = self.get_rows()
+        rows[0]['title'] = 'Senior Software Engineer'
+
+        result = self.import_rows(rows[1:])
+        self.assertEqual(
+            (result.created, result.updated, result.unchanged), (0, 0, 2))
+
+        result = self.import_rows(rows)
+        self.assertEqual(
+            (result.created, result.updated, result.unchanged), (0, 1, 2))
+        opening = JobOpening.objects.language('en').get(external_id='ats-1')
+        self.assertEqual(opening.title, 'Senior Software Engineer')
+        # existing URLs are kept
+        self.assertEqual(opening.slug, 'software-engineer')
+
+    def test_invalid_rows_are_reported(self):
+        rows = self.get_rows()
+        rows[0]['category'] = 'unknown'
+        rows[2]['publication_start'] = 'yesterday'
+        result = self.import_rows(rows)
+        self.assertEqual([number for number, __ in result.errors], [1, 3])
+        self.assertEqual(result.created, 1)
+
+    def test_import_jobs_command_reads_csv(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'jobs.csv')
+        with io.open(path, 'w', encoding='utf-8') as fileobj:
+            fileobj.write(
+                'external_id,language,category,title\n'
+                'ats-1,en,{0},D\u00e9veloppeur\n'.format(
+                    self.default_category.slug))
+
+        stdout = StringIO()
+        call_command(
+            'import_jobs', self.app_config.namespace, path, stdout=stdout)
+        self.assertIn('1 created', stdout.getvalue())
+        opening = JobOpening.objects.language('en').get(external_id='ats-1')
+        self.assertEqual(opening.title, 'D\u00e9veloppeur')
@@ -1,6 +1,14 @@
+from django import forms
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
 from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
+from django.utils.six import StringIO
 from django.utils.translation import override
 from parler.utils.context import switch_language
 
@@ -8,11 +16,17 @@ from cms import api
 from cms.models import Placeholder
 from cms.utils.conf import get_cms_setting
 from cms.utils.i18n import force_language
+from cms.utils.plugins import get_plugins
 from cms.test_utils.testcases import CMSTestCase
 
+from ..cache import get_jobs_config
+from ..forms import JobApplicationForm
 from ..models import JobCategory, JobOpening
 from ..cms_appconfig import JobsConfig
-from ..utils import namespace_is_apphooked
+from ..utils import (
+    get_language_changer, get_request, namespace_is_apphooked,
+)
+from ..views import JobOpeningDetail
 
 from .base import JobsBaseTestCase, tz_datetime
 
@@ -433,3 +447,321 @@ class JobApphookTest(JobsBaseTestCase):
             with switch_language(same_name_opening, language):
                 self.assertContains(response_other, same_name_opening.title)
                 self.assertContains(response_other, same_name_opening.lead_in)
+
+
+@override_settings(ALDRYN_JOBS_APPLICATION_FORM_FRAGMENT=True)
+class JobOpeningDetailShellTest(JobsBaseTestCase):
+
+    def test_detail_page_is_cached_without_application_form(self):
+        job_opening = self.create_default_job_opening()
+        with override('en'):
+            job_url = job_opening.get_absolute_url()
+            form_url = reverse(
+                '{0}:job-opening-apply'.format(self.app_config.namespace),
+                kwargs={
+                    'category_slug': job_opening.category.slug,
+                    'job_opening_slug': job_opening.slug,
+                })
+        response = self.client.get(job_url)
+        self.assertContains(response, job_opening.title)
+        self.assertContains(response, form_url)
+        self.assertNotContains(response, 'csrfmiddlewaretoken')
+        self.assertIn('max-age', response['Cache-Control'])
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.client.get(job_url)
+        self.assertEqual(cached.content, response.content)
+        self.assertFalse([
+            query for query in queries.captured_queries
+            if 'aldryn_jobs_jobopening' in query['sql']])
+
+        response = self.client.get(form_url)
+        self.assertContains(response, 'csrfmiddlewaretoken')
+        self.assertContains(response, 'action="{0}"'.format(job_url))
+        self.assertIn('no-cache', response['Cache-Control'])
+
+    def test_forms_with_captcha_are_rendered_inline(self):
+        class CaptchaApplicationForm(JobApplicationForm):
+            captcha = forms.CharField(required=False)
+
+        form_class = JobOpeningDetail.form_class
+        JobOpeningDetail.form_class = CaptchaApplicationForm
+        self.addCleanup(setattr, JobOpeningDetail, 'form_class', form_class)
+        job_opening = self.create_default_job_opening()
+        with override('en'):
+            job_url = job_opening.get_absolute_url()
+        response = self.client.get(job_url)
+        self.assertContains(response, 'csrfmiddlewaretoken')
+        self.assertContains(response, 'name="captcha"')
+        self.assertNotContains(response, 'js-aldryn-jobs-application')
+        self.assertIn('private', response['Cache-Control'])
+
+    def test_detail_page_is_not_cached_for_editors(self):
+        job_opening = self.create_default_job_opening()
+        with override('en'):
+            job_url = job_opening.get_absolute_url()
+        self.client.login(
+            username=self.super_user, password=self.super_user_password)
+        self.client.get(job_url)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(job_url)
+        self.assertTrue([
+            query for query in queries.captured_queries
+            if 'aldryn_jobs_jobopening' in query['sql']])
+
+
+class JobOpeningFragmentCacheTest(JobsBaseTestCase):
+
+    def get_version(self, job_opening):
+        return JobOpening.objects.get(pk=job_opening.pk).version
+
+    def test_version_is_bumped_by_related_changes(self):
+        job_opening = self.create_default_job_opening()
+        version = self.get_version(job_opening)
+
+        job_opening.save()
+        self.assertGreater(self.get_version(job_opening), version)
+        self.assertEqual(job_opening.version, self.get_version(job_opening))
+        version = self.get_version(job_opening)
+
+        self.default_category.save()
+        self.assertGreater(self.get_version(job_opening), version)
+        version = self.get_version(job_opening)
+
+        plugin = api.add_plugin(
+            job_opening.content, 'TextPlugin', 'en', body='More')
+        self.assertGreater(self.get_version(job_opening), version)
+        version = self.get_version(job_opening)
+
+        plugin.body = 'Changed'
+        plugin.save()
+        self.assertGreater(self.get_version(job_opening), version)
+        version = self.get_version(job_opening)
+
+        plugin.delete()
+        self.assertGreater(self.get_version(job_opening), version)
+        version = self.get_version(job_opening)
+
+        # Other models are ignored.
+        self.app_config.save()
+        self.assertEqual(self.get_version(job_opening), version)
+
+    def test_list_page_reuses_rendered_fragments(self):
+        job_opening = self.create_default_job_opening()
+        with override('en'):
+            list_url = self.page.get_absolute_url()
+        response = self.client.get(list_url)
+        self.assertContains(response, job_opening.title)
+        self.assertNotContains(response, '2001')
+
+        # Bypasses all signals, the cached fragment is still used.
+        JobOpening.objects.filter(pk=job_opening.pk).update(
+            publication_start=tz_datetime(2001, 1, 1))
+        response = self.client.get(list_url)
+        self.assertNotContains(response, '2001')
+
+        with override('en'):
+            job_opening = JobOpening.objects.get(pk=job_opening.pk)
+            job_opening.title = 'Renamed opening'
+            job_opening.save()
+        response = self.client.get(list_url)
+        self.assertContains(response, 'Renamed opening')
+        self.assertContains(response, '2001')
+
+
+class LanguageChangerTest(JobsBaseTestCase):
+
+    def setUp(self):
+        super(LanguageChangerTest, self).setUp()
+        self.job_opening = self.create_default_job_opening(translated=True)
+        self.languages = [code for code, __ in settings.LANGUAGES]
+
+    def assert_language_changer(self, obj, queries):
+        expected = dict(
+            (language, obj.get_absolute_url(language))
+            for language in self.languages)
+        changer = get_language_changer(obj)
+        with self.assertNumQueries(queries):
+            urls = dict(
+                (language, changer(language)) for language in self.languages)
+        self.assertEqual(urls, expected)
+
+    def test_job_opening_urls_are_looked_up_at_once(self):
+        # One query for the slugs of the opening, one for the category.
+        self.assert_language_changer(self.job_opening, 2)
+
+    def test_category_urls_are_looked_up_at_once(self):
+        self.assert_language_changer(self.default_category, 1)
+
+    def test_missing_translation_falls_back_to_category(self):
+        job_opening = self.create_default_job_opening()
+        self.assertEqual(
+            job_opening.get_absolute_urls(['de'])['de'],
+            self.default_category.get_absolute_url('de'))
+
+
+class JobsConfigCacheTest(JobsBaseTestCase):
+
+    def test_configs_are_loaded_once(self):
+        namespace = self.app_config.namespace
+        config = get_jobs_config(namespace=namespace)
+        self.assertEqual(config.pk, self.app_config.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_jobs_config(pk=self.app_config.pk).namespace, namespace)
+            self.assertEqual(
+                get_jobs_config(namespace=namespace).pk, self.app_config.pk)
+        self.assertIsNone(get_jobs_config(namespace='missing'))
+
+    def test_saving_invalidates_cached_configs(self):
+        get_jobs_config(pk=self.app_config.pk)
+        config = JobsConfig.objects.get(pk=self.app_config.pk)
+        config.namespace = 'renamed_namespace'
+        config.save()
+        self.assertEqual(
+            get_jobs_config(pk=self.app_config.pk).namespace,
+            'renamed_namespace')
+        self.assertIsNone(
+            get_jobs_config(namespace=self.app_config.namespace))
+
+    def test_pages_do_not_load_configs(self):
+        job_opening = self.create_default_job_opening()
+        with override('en'):
+            urls = [
+                self.page.get_absolute_url(),
+                self.default_category.get_absolute_url(),
+                job_opening.get_absolute_url(),
+            ]
+        for url in urls:
+            self.client.get(url)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            config_queries = [
+                query['sql'] for query in queries.captured_queries
+                if 'FROM "aldryn_jobs_jobsconfig"' in query['sql']]
+            self.assertEqual(config_queries, [])
+
+
+class NotificationEmailsCacheTest(JobsBaseTestCase):
+
+    def setUp(self):
+        super(NotificationEmailsCacheTest, self).setUp()
+        self.supervisor = self.create_user('supervisor', 'supervisor')
+        self.supervisor.email = 'supervisor@example.com'
+        self.supervisor.save()
+        self.default_category.supervisors.add(self.supervisor)
+        self.job_opening = self.create_default_job_opening()
+
+    def get_emails(self):
+        return JobOpening.objects.get(
+            pk=self.job_opening.pk).get_notification_emails()
+
+    def test_emails_are_loaded_once(self):
+        self.assertEqual(self.get_emails(), ['supervisor@example.com'])
+        job_opening = JobOpening.objects.get(pk=self.job_opening.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(job_opening.get_notification_emails(),
+                             ['supervisor@example.com'])
+
+    def test_supervisor_changes_invalidate_emails(self):
+        self.get_emails()
+        other = self.create_user('other', 'other')
+        other.email = 'other@example.com'
+        other.save()
+        self.default_category.supervisors.add(other)
+        self.assertEqual(sorted(self.get_emails()),
+                         ['other@example.com', 'supervisor@example.com'])
+        other.job_opening_categories.remove(self.default_category)
+        self.assertEqual(self.get_emails(), ['supervisor@example.com'])
+
+        self.supervisor.email = 'changed@example.com'
+        self.supervisor.save()
+        self.assertEqual(self.get_emails(), ['changed@example.com'])
+
+        self.supervisor.job_opening_categories.clear()
+        self.assertEqual(self.get_emails(), [])
+        self.default_category.supervisors.add(self.supervisor)
+        self.assertEqual(self.get_emails(), ['changed@example.com'])
+        self.supervisor.delete()
+        self.assertEqual(self.get_emails(), [])
+
+    def test_applying_does_not_query_users(self):
+        self.get_emails()
+        form = JobApplicationForm(
+            self.application_default_values, job_opening=self.job_opening)
+        self.assertTrue(form.is_valid())
+        with CaptureQueriesContext(connection) as queries:
+            form.save()
+        user_table = get_user_model()._meta.db_table
+        self.assertEqual([
+            query['sql'] for query in queries.captured_queries
+            if user_table in query['sql']], [])
+        self.assertIn('supervisor@example.com', mail.outbox[-1].to)
+
+
+class ConfigPlaceholdersTest(JobsBaseTestCase):
+
+    def setUp(self):
+        super(ConfigPlaceholdersTest, self).setUp()
+        for field in self.app_config.get_placeholder_fields():
+            api.add_plugin(getattr(self.app_config, field.name),
+                           'TextPlugin', 'en', body=field.name)
+
+    def test_placeholders_are_loaded_in_one_batch(self):
+        config = JobsConfig.objects.get(pk=self.app_config.pk)
+        request = get_request('en')
+        # Placeholders, plugins and text plugins.
+        with self.assertNumQueries(3):
+            config.prefetch_placeholders(request)
+        with self.assertNumQueries(0):
+            for field in config.get_placeholder_fields():
+                plugins = get_plugins(
+                    request, getattr(config, field.name), None)
+                self.assertEqual(plugins[0].body, field.name)
+
+    def test_views_prefetch_placeholders(self):
+        with override('en'):
+            url = self.page.get_absolute_url()
+        with override_settings(ALDRYN_JOBS_PREFETCH_CONFIG_PLACEHOLDERS=True):
+            response = self.client.get(url)
+        config = response.context['view'].config
+        self.assertTrue(hasattr(config.placeholder_jobs_top, '_plugins_cache'))
+
+        response = self.client.get(url)
+        config = response.context['view'].config
+        self.assertFalse(
+            hasattr(config.placeholder_jobs_top, '_plugins_cache'))
+
+
+class WarmJobsCacheCommandTest(JobsBaseTestCase):
+
+    def test_command_renders_all_pages(self):
+        self.create_default_job_opening(translated=True)
+        stdout = StringIO()
+        call_command(
+            'warm_jobs_cache', threads=1, host='testserver', stdout=stdout,
+            stderr=stdout)
+        output = stdout.getvalue()
+        languages = len(settings.LANGUAGES)
+        self.assertIn('list: {0} page(s)'.format(languages), output)
+        self.assertIn('category: {0} page(s)'.format(languages), output)
+        self.assertIn('detail: {0} page(s)'.format(languages), output)
+        self.assertNotIn(' /', output)
+
+    def test_command_reports_view_errors(self):
+        job_opening = self.create_default_job_opening()
+
+        def get(*args, **kwargs):
+            raise ValueError('Broken detail page')
+
+        self.addCleanup(setattr, JobOpeningDetail, 'get',
+                        JobOpeningDetail.__dict__['get'])
+        JobOpeningDetail.get = get
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            'warm_jobs_cache', threads=1, host='testserver', language=['en'],
+            stdout=stdout, stderr=stderr)
+        self.assertIn('detail: 1 page(s)', stdout.getvalue())
+        self.assertIn('500 {0}: ValueError'.format(
+            job_opening.get_absolute_url('en')), stderr.getvalue())
@@ -1,10 +1,17 @@
 from datetime import timedelta
 
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.template import Context
+from django.template.loader import get_template
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import override
 from django.utils.timezone import now
 
 from cms import api
 
+from ..cms_plugins import JobList
 from ..models import JobCategory, JobOpening
 
 from .base import JobsBaseTestCase
@@ -273,3 +280,111 @@ class TestJobListPlugin(TestAppConfigPluginsMixin,
         # check that there is no openings from other config
         self.assertNotContains(response, self.job_opening.title)
         self.assertNotContains(response, default_opening_url)
+
+    def render_plugin(self, plugin, request):
+        instance = plugin.get_plugin_instance()[0]
+        context = JobList().render(
+            Context({'request': request}), instance, instance.placeholder)
+        return get_template(JobList.render_template).render(context.flatten())
+
+    def get_anonymous_request(self):
+        request = RequestFactory().get('/')
+        request.user = AnonymousUser()
+        return request
+
+    def run_commit_hooks(self):
+        # The test case never commits.
+        hooks, connection.run_on_commit = connection.run_on_commit, []
+        for __, hook in hooks:
+            hook()
+
+    @override_settings(CMS_PAGE_CACHE=False)
+    def test_list_plugin_output_is_cached_until_openings_change(self):
+        with override('en'):
+            page_url = self.plugin_page.get_absolute_url()
+            self.assertContains(self.client.get(page_url),
+                                self.job_opening.title)
+
+            # The placeholder is cached by django CMS.
+            self.job_opening.title = 'Renamed opening'
+            self.job_opening.save_translations()
+            self.assertNotContains(self.client.get(page_url),
+                                   'Renamed opening')
+
+            # Cleared once the change is committed.
+            self.job_opening.save()
+            self.assertNotContains(self.client.get(page_url),
+                                   'Renamed opening')
+            self.run_commit_hooks()
+            self.assertContains(self.client.get(page_url), 'Renamed opening')
+
+    @override_settings(CMS_PAGE_CACHE=False)
+    def test_list_plugins_of_other_configs_stay_cached(self):
+        new_config = self.create_config(namespace='another_namespace')
+        with override('en'):
+            category = JobCategory.objects.create(
+                name='Other', app_config=new_config)
+            self.run_commit_hooks()
+            page_url = self.plugin_page.get_absolute_url()
+            self.assertContains(self.client.get(page_url),
+                                self.job_opening.title)
+            self.job_opening.title = 'Renamed opening'
+            self.job_opening.save_translations()
+
+            category.save()
+            self.run_commit_hooks()
+            self.assertNotContains(self.client.get(page_url),
+                                   'Renamed opening')
+
+    def test_list_plugin_shows_selected_untranslated_openings(self):
+        new_opening = self.create_new_job_opening(self.prepare_data(1))
+        plugin = self.create_plugin(
+            self.plugin_page, 'de', self.app_config, jobopenings=new_opening)
+        plugin.aldryn_jobs_joblistplugin.jobopenings.add(self.job_opening)
+        with override('de'):
+            output = self.render_plugin(plugin, self.get_anonymous_request())
+        self.assertLess(
+            output.index(new_opening.safe_translation_getter(
+                'title', language_code='en')),
+            output.index(self.job_opening.safe_translation_getter(
+                'title', language_code='de')))
+
+    def test_list_plugins_share_openings_of_a_namespace(self):
+        newest = self.create_new_job_opening(self.prepare_data(1))
+        plugin = self.create_plugin(self.plugin_page, 'en', self.app_config)
+        other_plugin = self.create_plugin(
+            self.plugin_page, 'en', self.app_config,
+            sort_order='newest', max_openings=1)
+        request = self.get_anonymous_request()
+        with override('en'):
+            self.render_plugin(plugin, request)
+            with CaptureQueriesContext(connection) as queries:
+                output = self.render_plugin(other_plugin, request)
+            self.assertIn(newest.title, output)
+        self.assertIn('Showing 2 job openings', ' '.join(output.split()))
+        # Neither the openings nor their translations are fetched again.
+        opening_queries = [
+            query['sql'] for query in queries.captured_queries
+            if '"aldryn_jobs_jobopening' in query['sql']]
+        self.assertEqual(opening_queries, [])
+
+    def test_list_plugin_shows_limited_number_of_newest_openings(self):
+        plugin = self.create_plugin(
+            self.plugin_page, 'en', self.app_config,
+            sort_order='newest', max_openings=2)
+        openings = []
+        for days in (3, 2, 1):
+            with override('en'):
+                openings.append(JobOpening.objects.create(
+                    title='Opening {0} days old'.format(days),
+                    category=self.default_category,
+                    publication_start=now() - timedelta(days=days)))
+        with override('en'):
+            output = self.render_plugin(plugin, self.get_anonymous_request())
+        self.assertNotIn(openings[0].title, output)
+        self.assertIn(openings[1].title, output)
+        self.assertIn(openings[2].title, output)
+        self.assertLess(
+            output.index(openings[2].title), output.index(openings[1].title))
+        self.assertIn('Showing {0} job openings'.format(
+            JobOpening.objects.active().count()), ' '.join(output.split()))
@@ -0,0 +1,149 @@
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.db import connection
+from django.utils.six import StringIO
+from django.utils.timezone import now
+from django.utils.translation import override
+
+from ..cache import (
+    get_next_publication_transition, get_publication_cache_timeout,
+)
+from ..models import JobOpening
+from ..signals import job_opening_published, job_opening_unpublished
+
+from .base import JobsBaseTestCase
+
+
+class JobOpeningLiveStateTestCase(JobsBaseTestCase):
+
+    def setUp(self):
+        super(JobOpeningLiveStateTestCase, self).setUp()
+        self.received = []
+        job_opening_published.connect(self.on_published)
+        job_opening_unpublished.connect(self.on_unpublished)
+
+    def tearDown(self):
+        job_opening_published.disconnect(self.on_published)
+        job_opening_unpublished.disconnect(self.on_unpublished)
+        super(JobOpeningLiveStateTestCase, self).tearDown()
+
+    def on_published(self, sender, job_opening, **kwargs):
+        self.received.append(('published', job_opening.pk))
+
+    def on_unpublished(self, sender, job_opening, **kwargs):
+        self.received.append(('unpublished', job_opening.pk))
+
+    def run_commit_hooks(self):
+        hooks, connection.run_on_commit = connection.run_on_commit, []
+        for __, hook in hooks:
+            hook()
+
+    def create_opening(self, **kwargs):
+        with override('en'):
+            return JobOpening.objects.create(
+                title='Opening', category=self.default_category, **kwargs)
+
+    def test_save_updates_live_state(self):
+        opening = self.create_opening()
+        self.assertTrue(opening.is_live)
+        # the signals are only sent once the transaction is committed
+        self.assertEqual(self.received, [])
+        self.run_commit_hooks()
+        self.assertEqual(self.received, [('published', opening.pk)])
+
+        opening.is_active = False
+        opening.save()
+        self.run_commit_hooks()
+        self.assertFalse(
+            JobOpening.objects.filter(pk=opening.pk).active().exists())
+        self.assertEqual(self.received[-1], ('unpublished', opening.pk))
+
+    def test_future_opening_is_not_live(self):
+        opening = self.create_opening(
+            publication_start=now() + timedelta(days=1))
+        self.assertFalse(opening.is_live)
+        self.run_commit_hooks()
+        self.assertEqual(self.received, [])
+
+    def test_stale_instances_send_one_signal(self):
+        opening = self.create_opening()
+        stale = JobOpening.objects.get(pk=opening.pk)
+        self.run_commit_hooks()
+        self.received = []
+
+        opening.is_active = False
+        opening.save()
+        stale.is_active = False
+        stale.save()
+        self.run_commit_hooks()
+        self.assertEqual(self.received, [('unpublished', opening.pk)])
+
+    def test_command_updates_live_state_at_boundaries(self):
+        starting = self.create_opening(
+            publication_start=now() + timedelta(days=1))
+        ending = self.create_opening()
+        # move the publication windows without going through save()
+        JobOpening.objects.filter(pk=starting.pk).update(
+            publication_start=now() - timedelta(minutes=1))
+        JobOpening.objects.filter(pk=ending.pk).update(
+            publication_end=now() - timedelta(minutes=1))
+        self.run_commit_hooks()
+        self.received = []
+
+        call_command('update_job_openings', stdout=StringIO())
+        self.run_commit_hooks()
+
+        self.assertEqual(
+            list(JobOpening.objects.active().values_list('pk', flat=True)),
+            [starting.pk])
+        self.assertEqual(
+            sorted(self.received),
+            [('published', starting.pk), ('unpublished', ending.pk)])
+
+        # nothing left to do on the next run
+        self.received = []
+        call_command('update_job_openings', stdout=StringIO())
+        self.run_commit_hooks()
+        self.assertEqual(self.received, [])
+
+
+class PublicationTransitionTestCase(JobsBaseTestCase):
+
+    def create_opening(self, **kwargs):
+        with override('en'):
+            return JobOpening.objects.create(
+                title='Opening', category=self.default_category, **kwargs)
+
+    def test_no_transition_scheduled(self):
+        self.create_opening()
+        namespace = self.app_config.namespace
+        self.assertIsNone(get_next_publication_transition(namespace))
+        self.assertGreater(get_publication_cache_timeout(namespace), 0)
+
+    def test_next_transition_is_earliest_start_or_end(self):
+        namespace = self.app_config.namespace
+        end = now() + timedelta(hours=2)
+        self.create_opening(publication_end=end)
+        self.assertEqual(get_next_publication_transition(namespace), end)
+
+        start = now() + timedelta(hours=1)
+        self.create_opening(publication_start=start)
+        self.assertEqual(get_next_publication_transition(namespace), start)
+        self.assertIsNone(get_next_publication_transition('other'))
+
+    def test_due_transition_disables_caching(self):
+        opening = self.create_opening(
+            publication_start=now() + timedelta(days=1))
+        JobOpening.objects.filter(pk=opening.pk).update(
+            publication_start=now() - timedelta(minutes=1))
+        self.assertEqual(
+            get_publication_cache_timeout(self.app_config.namespace), 0)
+
+    def test_list_view_expires_at_next_transition(self):
+        self.create_opening(publication_end=now() + timedelta(seconds=30))
+        with override('en'):
+            url = self.page.get_absolute_url()
+        response = self.client.get(url)
+        max_age = int(response['Cache-Control'].split('max-age=')[1])
+        self.assertLessEqual(max_age, 30)
@@ -0,0 +1,126 @@
+import threading
+
+from django.db import connection, transaction
+from django.test import override_settings
+from django.utils.six.moves.BaseHTTPServer import (
+    BaseHTTPRequestHandler, HTTPServer,
+)
+from django.utils.translation import override
+
+from cms import api
+
+from ..purge import (
+    HTTPPurgeBackend, get_category_key, get_config_key, get_opening_key,
+)
+
+from .base import JobsBaseTestCase
+
+
+class PurgeRequestHandler(BaseHTTPRequestHandler):
+
+    def do_PURGE(self):
+        self.server.purged.append(self.headers['Surrogate-Key'])
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class SurrogateKeyTestCase(JobsBaseTestCase):
+
+    def setUp(self):
+        super(SurrogateKeyTestCase, self).setUp()
+        self.server = HTTPServer(('127.0.0.1', 0), PurgeRequestHandler)
+        self.server.purged = []
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        settings = override_settings(
+            ALDRYN_JOBS_PURGE_BACKEND='aldryn_jobs.purge.HTTPPurgeBackend',
+            ALDRYN_JOBS_PURGE_URL='http://127.0.0.1:{0}/'.format(
+                self.server.server_port),
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        super(SurrogateKeyTestCase, self).tearDown()
+
+    def run_commit_hooks(self):
+        # The test case never commits.
+        hooks, connection.run_on_commit = connection.run_on_commit, []
+        for __, hook in hooks:
+            hook()
+
+    def test_views_emit_surrogate_keys(self):
+        job_opening = self.create_default_job_opening()
+        config_key = get_config_key(self.app_config.pk)
+        category_key = get_category_key(self.default_category.pk)
+        with override('en'):
+            list_url = self.page.get_absolute_url()
+            category_url = self.default_category.get_absolute_url()
+            job_url = job_opening.get_absolute_url()
+
+        response = self.client.get(list_url)
+        self.assertEqual(response['Surrogate-Key'], config_key)
+        self.assertIn('max-age', response['Cache-Control'])
+        response = self.client.get(category_url)
+        self.assertEqual(
+            set(response['Surrogate-Key'].split()),
+            {config_key, category_key})
+        response = self.client.get(job_url)
+        self.assertEqual(
+            set(response['Surrogate-Key'].split()),
+            {get_opening_key(job_opening.pk), category_key})
+        self.assertIn('private', response['Cache-Control'])
+
+    def test_changes_are_purged_after_commit(self):
+        job_opening = self.create_default_job_opening()
+        self.run_commit_hooks()
+        del self.server.purged[:]
+
+        job_opening.save()
+        self.assertEqual(self.server.purged, [])
+        self.run_commit_hooks()
+        purged = set(' '.join(self.server.purged).split())
+        self.assertIn(get_opening_key(job_opening.pk), purged)
+        self.assertIn(get_config_key(self.app_config.pk), purged)
+
+        del self.server.purged[:]
+        self.default_category.save()
+        self.run_commit_hooks()
+        purged = set(' '.join(self.server.purged).split())
+        self.assertIn(get_category_key(self.default_category.pk), purged)
+
+    def test_one_request_per_transaction(self):
+        job_opening = self.create_default_job_opening()
+        self.run_commit_hooks()
+        del self.server.purged[:]
+
+        with transaction.atomic():
+            job_opening.save()
+            self.default_category.save()
+        self.run_commit_hooks()
+        self.assertEqual(len(self.server.purged), 1)
+        self.assertEqual(set(self.server.purged[0].split()), {
+            get_opening_key(job_opening.pk),
+            get_config_key(self.app_config.pk),
+            get_category_key(self.default_category.pk),
+        })
+
+        del self.server.purged[:]
+        api.add_plugin(job_opening.content, 'TextPlugin', 'en',
+                       body='Changed job details')
+        self.run_commit_hooks()
+        self.assertEqual(self.server.purged, [
+            get_opening_key(job_opening.pk)])
+
+    def test_unreachable_url_is_not_an_error(self):
+        # Nothing listens on the port anymore.
+        url = 'http://127.0.0.1:{0}/'.format(self.server.server_port)
+        self.server.shutdown()
+        self.server.server_close()
+        HTTPPurgeBackend(url=url, timeout=1).purge([get_opening_key(1)])
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.core.urlresolvers import reverse
+from django.test import override_settings
+from django.utils.translation import override
+
+from ..models import JobApplication
+
+from .base import JobsBaseTestCase
+
+
+@override_settings(ALDRYN_JOBS_APPLICATION_RATE_LIMIT_PER_IP=(2, 60))
+class ApplicationRateLimitTestCase(JobsBaseTestCase):
+
+    def get_url(self, job_opening):
+        with override('en'):
+            return reverse(
+                '{0}:api-job-application-create'.format(
+                    self.app_config.namespace),
+                kwargs={'pk': job_opening.pk})
+
+    def apply(self, url, ip='10.0.0.1'):
+        return self.client.post(url, {
+            'first_name': 'Jane',
+            'last_name': 'Doe',
+            'email': 'jane@example.com',
+        }, REMOTE_ADDR=ip)
+
+    def test_limit_per_ip(self):
+        url = self.get_url(self.create_default_job_opening())
+        self.assertEqual(self.apply(url).status_code, 201)
+        self.assertEqual(self.apply(url).status_code, 201)
+        response = self.apply(url)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '60')
+        self.assertEqual(JobApplication.objects.count(), 2)
+        self.assertEqual(self.apply(url, ip='10.0.0.2').status_code, 201)
+
+    @override_settings(
+        ALDRYN_JOBS_APPLICATION_RATE_LIMIT_PER_IP=None,
+        ALDRYN_JOBS_APPLICATION_RATE_LIMIT_PER_OPENING=(1, 60),
+    )
+    def test_limit_per_opening(self):
+        url = self.get_url(self.create_default_job_opening())
+        self.assertEqual(self.apply(url).status_code, 201)
+        self.assertEqual(self.apply(url, ip='10.0.0.2').status_code, 429)
+        other = self.create_new_job_opening(self.prepare_data(1))
+        self.assertEqual(self.apply(self.get_url(other)).status_code, 201)
+
+    def test_middleware_rejects_detail_page_posts(self):
+        name = ('MIDDLEWARE' if getattr(settings, 'MIDDLEWARE', None)
+                else 'MIDDLEWARE_CLASSES')
+        middleware = list(getattr(settings, name))
+        middleware.insert(
+            middleware.index('cms.middleware.toolbar.ToolbarMiddleware'),
+            'aldryn_jobs.ratelimit.ApplicationRateLimitMiddleware')
+        job_opening = self.create_default_job_opening()
+        with override('en'):
+            url = job_opening.get_absolute_url()
+        with override_settings(**{name: middleware}):
+            # Loads the middleware anew.
+            self.client = self.client_class()
+            self.assertEqual(self.apply(url).status_code, 302)
+            self.assertEqual(self.apply(url).status_code, 302)
+            response = self.apply(url)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(JobApplication.objects.count(), 2)
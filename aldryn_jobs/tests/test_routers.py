@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.six import StringIO
+from django.utils.translation import override
+
+from cms.models import Placeholder
+
+from ..models import JobCategory, JobOpening, JobsConfig
+from ..routers import read_from_replica
+
+from .base import JobsBaseTestCase
+
+REPLICA = 'replica'
+
+# Tables the job pages need, the CMS itself always reads from the default
+# database.
+REPLICATED_MODELS = [
+    Placeholder,
+    JobsConfig,
+    JobCategory,
+    JobCategory._parler_meta.root_model,
+    JobOpening,
+    JobOpening._parler_meta.root_model,
+]
+
+
+@override_settings(
+    DATABASE_ROUTERS=['aldryn_jobs.routers.ReplicaRouter'],
+    ALDRYN_JOBS_REPLICA_DATABASE=REPLICA,
+)
+class ReplicaRouterTestCase(JobsBaseTestCase):
+    multi_db = True
+
+    @classmethod
+    def setUpClass(cls):
+        # A second in-memory SQLite database acts as the replica.
+        connections.databases[REPLICA] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+        connections.ensure_defaults(REPLICA)
+        with connections[REPLICA].schema_editor() as schema_editor:
+            # Category supervisors refer to users.
+            for model in [get_user_model()] + REPLICATED_MODELS:
+                schema_editor.create_model(model)
+        super(ReplicaRouterTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super(ReplicaRouterTestCase, cls).tearDownClass()
+        connections[REPLICA].close()
+        del connections[REPLICA]
+        del connections.databases[REPLICA]
+
+    def replicate(self):
+        data = StringIO()
+        labels = [model._meta.label_lower for model in REPLICATED_MODELS]
+        call_command('dumpdata', *labels, format='json', stdout=data)
+        handle, path = tempfile.mkstemp(suffix='.json')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, 'w') as fixture:
+            fixture.write(data.getvalue())
+        call_command('loaddata', path, database=REPLICA, verbosity=0)
+
+    def test_reads_within_block_use_replica(self):
+        job_opening = self.create_default_job_opening()
+        self.assertTrue(JobOpening.objects.filter(pk=job_opening.pk).exists())
+        with read_from_replica():
+            self.assertFalse(
+                JobOpening.objects.filter(pk=job_opening.pk).exists())
+            # Writes go to the default database regardless.
+            JobOpening.objects.filter(pk=job_opening.pk).update(
+                can_apply=False)
+        self.assertFalse(JobOpening.objects.get(pk=job_opening.pk).can_apply)
+
+    def test_reads_use_default_without_replica(self):
+        job_opening = self.create_default_job_opening()
+        with override_settings(ALDRYN_JOBS_REPLICA_DATABASE=None):
+            with read_from_replica():
+                self.assertTrue(
+                    JobOpening.objects.filter(pk=job_opening.pk).exists())
+
+    def test_list_view_reads_from_replica(self):
+        replicated = self.create_default_job_opening()
+        self.replicate()
+        fresh = self.create_new_job_opening(self.prepare_data())
+        with override('en'):
+            url = self.page.get_absolute_url()
+        response = self.client.get(url)
+        self.assertContains(response, replicated.title)
+        self.assertNotContains(response, fresh.title)
+
+        # Visitors who just posted something see their own writes.
+        self.client.cookies['aldryn_jobs_primary'] = '1'
+        response = self.client.get(url)
+        self.assertContains(response, replicated.title)
+        self.assertContains(response, fresh.title)
+
+    def test_detail_view_reads_opening_from_replica(self):
+        job_opening = self.create_default_job_opening()
+        self.replicate()
+        with override('en'):
+            url = job_opening.get_absolute_url()
+        table = JobOpening._meta.db_table
+        with CaptureQueriesContext(connections[REPLICA]) as replica_queries:
+            with CaptureQueriesContext(connection) as default_queries:
+                response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(any(
+            'FROM "{0}"'.format(table) in query['sql']
+            for query in replica_queries.captured_queries))
+        self.assertFalse(any(
+            'FROM "{0}"'.format(table) in query['sql']
+            for query in default_queries.captured_queries))
+
+    def test_application_pins_to_default(self):
+        job_opening = self.create_default_job_opening()
+        self.replicate()
+        with override('en'):
+            url = job_opening.get_absolute_url()
+        response = self.client.post(url, {})
+        self.assertIn('aldryn_jobs_primary', response.cookies)
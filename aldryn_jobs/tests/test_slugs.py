@@ -0,0 +1,175 @@
+from importlib import import_module
+
+from django.apps import apps
+from django.core.urlresolvers import reverse
+from django.utils.translation import override
+
+from ..cache import get_jobs_config
+from ..models import JobCategory, JobOpening
+from ..utils import get_app_url
+
+from .base import JobsBaseTestCase
+
+
+class ScopedSlugTestCase(JobsBaseTestCase):
+
+    def create_opening(self, title='Software Engineer', **kwargs):
+        kwargs.setdefault('category', self.default_category)
+        with override('en'):
+            return JobOpening.objects.create(title=title, **kwargs)
+
+    def test_common_titles_get_numbered_suffixes(self):
+        slugs = [self.create_opening().slug for __ in range(3)]
+        self.assertEqual(slugs, [
+            'software-engineer',
+            'software-engineer-1',
+            'software-engineer-2',
+        ])
+
+    def test_free_suffix_is_found_with_a_single_query(self):
+        for __ in range(5):
+            self.create_opening()
+        opening = JobOpening(category=self.default_category)
+        opening.set_current_language('en')
+        with self.assertNumQueries(1):
+            slug = opening.make_new_slug('software-engineer')
+        self.assertEqual(slug, 'software-engineer-5')
+
+    def test_slugs_are_scoped_by_app_config(self):
+        self.create_opening()
+        new_config = self.create_config(namespace='another_namespace')
+        with override('en'):
+            category = JobCategory.objects.create(
+                name='Other', app_config=new_config)
+        opening = self.create_opening(category=category)
+        self.assertEqual(opening.slug, 'software-engineer')
+
+    def test_moving_a_category_reallocates_conflicting_slugs(self):
+        self.create_opening()
+        new_config = self.create_config(namespace='another_namespace')
+        with override('en'):
+            category = JobCategory.objects.create(
+                name='Other', app_config=new_config)
+        opening = self.create_opening(category=category)
+        opening.set_current_language('de')
+        opening.title = 'Software Engineer'
+        opening.save()
+        self.assertEqual(opening.slug, 'software-engineer')
+
+        category.app_config = self.app_config
+        category.save()
+        translations = dict(opening.translations.values_list(
+            'language_code', 'slug'))
+        self.assertEqual(translations, {
+            'en': 'software-engineer-1',
+            'de': 'software-engineer',
+        })
+        self.assertEqual(
+            opening.translations.get(language_code='en').url_path,
+            'other/software-engineer-1/')
+
+    def test_reserved_category_slugs_are_not_allocated(self):
+        for slug in JobCategory.reserved_slugs:
+            with override('en'):
+                category = JobCategory.objects.create(
+                    name=slug.title(), app_config=self.app_config)
+            self.assertEqual(category.slug, '{0}-1'.format(slug))
+
+    def test_migration_renames_reserved_category_slugs(self):
+        opening = self.create_opening()
+        JobCategory._parler_meta.root_model.objects.filter(
+            master=self.default_category, language_code='en',
+        ).update(slug='alerts')
+        import_module(
+            'aldryn_jobs.migrations.0019_reserve_category_slugs'
+        ).rename_slugs(apps, JobCategory.reserved_slugs)
+        translation = opening.translations.get(language_code='en')
+        self.assertEqual(translation.url_path, 'alerts-1/software-engineer/')
+
+    def test_conflicting_slug_is_reallocated_on_save(self):
+        self.create_opening()
+        opening = JobOpening(category=self.default_category)
+        opening.set_current_language('en')
+        opening.title = 'Software Engineer'
+        calls = []
+
+        def stale_make_new_slug(slug=None, language=None, **kwargs):
+            # the first allocation doesn't see the concurrently saved slug
+            calls.append(slug)
+            if len(calls) == 1:
+                return 'software-engineer'
+            return JobOpening.make_new_slug(opening, slug, language)
+
+        opening.make_new_slug = stale_make_new_slug
+        opening.save()
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(
+            JobOpening.objects.language('en').get(pk=opening.pk).slug,
+            'software-engineer-1')
+
+
+class JobOpeningPathTestCase(JobsBaseTestCase):
+
+    def get_url_path(self, job_opening, language='en'):
+        return job_opening.translations.get(language_code=language).url_path
+
+    def get_detail_url(self, category_slug, slug, language='en'):
+        with override(language):
+            return reverse(
+                '{0}:job-opening-detail'.format(self.app_config.namespace),
+                kwargs={'category_slug': category_slug,
+                        'job_opening_slug': slug})
+
+    def test_path_is_stored_per_translation(self):
+        job_opening = self.create_default_job_opening(translated=True)
+        for language in ('en', 'de'):
+            category_slug = self.default_category.safe_translation_getter(
+                'slug', language_code=language)
+            slug = job_opening.safe_translation_getter(
+                'slug', language_code=language)
+            self.assertEqual(
+                self.get_url_path(job_opening, language),
+                '{0}/{1}/'.format(category_slug, slug))
+            self.assertEqual(
+                job_opening.get_absolute_url(language),
+                self.get_detail_url(category_slug, slug, language))
+
+    def test_absolute_url_needs_no_queries(self):
+        job_opening = self.create_default_job_opening()
+        job_opening = JobOpening.objects.language('en').select_related(
+            'category').get(pk=job_opening.pk)
+        job_opening.title
+        get_jobs_config(pk=self.app_config.pk)
+        get_app_url(self.app_config.namespace, 'en')
+        with self.assertNumQueries(0):
+            url = job_opening.get_absolute_url()
+        self.assertEqual(url, self.get_detail_url(
+            self.default_category.slug, job_opening.slug))
+
+    def test_category_slug_change_updates_paths(self):
+        job_opening = self.create_default_job_opening()
+        category = JobCategory.objects.language('en').get(
+            pk=self.default_category.pk)
+        category.slug = 'renamed-category'
+        category.save()
+        self.assertEqual(
+            self.get_url_path(job_opening),
+            'renamed-category/{0}/'.format(job_opening.slug))
+        job_opening = JobOpening.objects.language('en').get(
+            pk=job_opening.pk)
+        self.assertEqual(
+            job_opening.get_absolute_url(),
+            self.get_detail_url('renamed-category', job_opening.slug))
+
+    def test_category_change_updates_paths(self):
+        job_opening = self.create_default_job_opening()
+        with override('en'):
+            category = JobCategory.objects.create(
+                name='Other', app_config=self.app_config)
+        JobOpening.objects.filter(pk=job_opening.pk).update(category=category)
+        job_opening = JobOpening.objects.get(pk=job_opening.pk)
+        job_opening.save()
+        self.assertEqual(
+            self.get_url_path(job_opening),
+            'other/{0}/'.format(job_opening.safe_translation_getter(
+                'slug', language_code='en')))
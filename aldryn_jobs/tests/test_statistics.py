@@ -0,0 +1,116 @@
+from datetime import date, timedelta
+
+from django.core.management import call_command
+from django.core.urlresolvers import reverse
+from django.test import override_settings
+from django.utils.six import StringIO
+
+from ..models import (
+    JobApplication, JobApplicationAttachment, JobApplicationStatistic,
+)
+from ..statistics import get_date_ranges
+from ..utils import get_statistic_date
+
+from .base import JobsBaseTestCase
+
+
+@override_settings(ALDRYN_JOBS_APPLICATION_STATISTICS_OVERLAP=0)
+class ApplicationStatisticsTestCase(JobsBaseTestCase):
+
+    def create_application(self, job_opening, attachments=0):
+        application = JobApplication.objects.create(
+            job_opening=job_opening, first_name='Jane', last_name='Doe',
+            email='jane@example.com')
+        for number in range(attachments):
+            JobApplicationAttachment.objects.create(
+                application=application, file='cv{0}.txt'.format(number))
+        return application
+
+    def update_statistics(self, *args):
+        call_command('update_application_statistics', *args,
+                     stdout=StringIO())
+
+    def get_statistics(self):
+        return list(JobApplicationStatistic.objects.values_list(
+            'job_opening_id', 'date', 'applications', 'rejections',
+            'attachments'))
+
+    def test_counts_applications_per_opening_and_day(self):
+        job_opening = self.create_default_job_opening()
+        other = self.create_new_job_opening(self.prepare_data(1))
+        application = self.create_application(job_opening, attachments=2)
+        self.create_application(job_opening)
+        self.create_application(other)
+        self.update_statistics()
+        date = get_statistic_date(application.created)
+        self.assertEqual(sorted(self.get_statistics()), sorted([
+            (job_opening.pk, date, 2, 0, 2),
+            (other.pk, date, 1, 0, 0),
+        ]))
+
+    def test_processes_changes_since_last_run(self):
+        job_opening = self.create_default_job_opening()
+        application = self.create_application(job_opening)
+        self.create_application(job_opening)
+        self.update_statistics()
+
+        # Unchanged days aren't counted again.
+        JobApplicationStatistic.objects.update(applications=10)
+        self.update_statistics()
+        self.assertEqual(self.get_statistics()[0][2], 10)
+
+        application.is_rejected = True
+        application.save()
+        self.update_statistics()
+        self.assertEqual(self.get_statistics()[0][2:], (2, 1, 0))
+
+        JobApplication.objects.all().delete()
+        self.update_statistics()
+        self.assertEqual(self.get_statistics(), [])
+
+    def test_only_changed_days_are_counted_again(self):
+        job_opening = self.create_default_job_opening()
+        applications = [self.create_application(job_opening)
+                        for __ in range(3)]
+        for days, application in enumerate(applications):
+            JobApplication.objects.filter(pk=application.pk).update(
+                created=application.created - timedelta(days=2 * days))
+        self.update_statistics()
+        JobApplicationStatistic.objects.update(applications=10)
+
+        for application in applications[::2]:
+            application.refresh_from_db()
+            application.save()
+        self.update_statistics()
+        counts = JobApplicationStatistic.objects.order_by(
+            'date').values_list('applications', flat=True)
+        self.assertEqual(list(counts), [1, 10, 1])
+
+    def test_date_ranges(self):
+        dates = [date(2020, 1, day) for day in (7, 1, 2, 3, 5, 8)]
+        self.assertEqual(get_date_ranges(dates), [
+            [date(2020, 1, 1), date(2020, 1, 3)],
+            [date(2020, 1, 5), date(2020, 1, 5)],
+            [date(2020, 1, 7), date(2020, 1, 8)],
+        ])
+
+    def test_full_rebuild(self):
+        job_opening = self.create_default_job_opening()
+        self.create_application(job_opening)
+        self.update_statistics()
+        JobApplicationStatistic.objects.update(applications=10)
+        self.update_statistics('--full')
+        self.assertEqual(self.get_statistics()[0][2], 1)
+
+    def test_admin_report(self):
+        job_opening = self.create_default_job_opening()
+        self.create_application(job_opening, attachments=1)
+        self.create_application(job_opening)
+        self.update_statistics()
+        self.create_user('admin', 'admin', is_staff=True, is_superuser=True)
+        self.client.login(username='admin', password='admin')
+        response = self.client.get(
+            reverse('admin:aldryn_jobs_jobapplicationstatistic_changelist'))
+        self.assertContains(
+            response,
+            'Total: 2 application(s), 0 rejection(s), 1 attachment(s)')
@@ -4,7 +4,12 @@ from __future__ import unicode_literals
 
 from django.conf.urls import url
 
-from .views import CategoryJobOpeningList, JobOpeningDetail, JobOpeningList
+from .api import JobApplicationAPI, JobCategoryListAPI, JobOpeningListAPI
+from .feeds import JobOpeningFeed
+from .views import (
+    CategoryJobOpeningList, JobAlertSubscribe, JobAlertSubscriptionAction,
+    JobApplicationFormFragment, JobOpeningDetail, JobOpeningList,
+)
 
 # default view (root url) which is pointing to ^$ url
 DEFAULT_VIEW = 'job-opening-list'
@@ -12,10 +17,31 @@ DEFAULT_VIEW = 'job-opening-list'
 urlpatterns = [
     url(r'^$', JobOpeningList.as_view(),
         name='job-opening-list'),
+    # Before the slug patterns, which would match them, too.
+    url(r'^api/openings/$', JobOpeningListAPI.as_view(),
+        name='api-job-opening-list'),
+    url(r'^api/openings/(?P<pk>\d+)/applications/$',
+        JobApplicationAPI.as_view(),
+        name='api-job-application-create'),
+    url(r'^api/categories/$', JobCategoryListAPI.as_view(),
+        name='api-job-category-list'),
+    url(r'^feed/$', JobOpeningFeed.as_view(),
+        name='job-opening-feed'),
+    url(r'^alerts/$', JobAlertSubscribe.as_view(),
+        name='job-alert-subscribe'),
+    url(r'^alerts/confirm/(?P<key>[0-9a-f]{32})/$',
+        JobAlertSubscriptionAction.as_view(action='confirm'),
+        name='job-alert-confirm'),
+    url(r'^alerts/unsubscribe/(?P<key>[0-9a-f]{32})/$',
+        JobAlertSubscriptionAction.as_view(action='unsubscribe'),
+        name='job-alert-unsubscribe'),
     url(r'^(?P<category_slug>\w[-_\w]*)/$',
         CategoryJobOpeningList.as_view(),
         name='category-job-opening-list'),
     url(r'^(?P<category_slug>\w[-_\w]*)/(?P<job_opening_slug>\w[-_\w]*)/$',
         JobOpeningDetail.as_view(),
         name='job-opening-detail'),
+    url(r'^(?P<category_slug>\w[-_\w]*)/(?P<job_opening_slug>\w[-_\w]*)/apply/$',
+        JobApplicationFormFragment.as_view(),
+        name='job-opening-apply'),
 ]
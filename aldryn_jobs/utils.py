@@ -1,14 +1,20 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 from os.path import splitext
+from weakref import WeakKeyDictionary
 
 from cms.plugin_rendering import ContentRenderer
+from cms.utils.i18n import force_language
 from aldryn_search.utils import strip_tags
 
+from django.utils import timezone
 from django.utils.encoding import force_text
 from django.utils.text import smart_split
 from django.db import models
-from django.core.urlresolvers import reverse, NoReverseMatch
+from django.db.models import Case, Value, When
+from django.core.urlresolvers import (
+    get_resolver, get_script_prefix, get_urlconf, reverse, NoReverseMatch,
+)
 from django.utils.text import get_valid_filename as get_valid_filename_django
 from django.template.defaultfilters import slugify
 from django.conf import settings
@@ -46,6 +52,40 @@ def namespace_is_apphooked(namespace):
     return True
 
 
+# URL resolver -> {(script prefix, namespace, language): URL}, so that the
+# URLs are forgotten when the URLs are reloaded (e.g. when apphooks change).
+_app_urls = WeakKeyDictionary()
+
+
+def get_app_url(namespace, language):
+    """
+    Returns the URL of the page the given namespace is hooked to in the given
+    language, or None if there is no such page.
+    """
+    # avoid circular import
+    from .urls import DEFAULT_VIEW
+
+    urls = _app_urls.setdefault(get_resolver(get_urlconf()), {})
+    key = (get_script_prefix(), namespace, language)
+    if key not in urls:
+        with force_language(language):
+            try:
+                urls[key] = reverse('{0}:{1}'.format(namespace, DEFAULT_VIEW))
+            except NoReverseMatch:
+                urls[key] = None
+    return urls[key]
+
+
+def get_statistic_date(value):
+    """
+    Returns the day, in the current time zone, on which statistics count
+    something that happened at the given time.
+    """
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.date()
+
+
 def SALUTATION_CHOICES():
     SALUTATIONS = getattr(settings, "ALDRYN_JOBS_SALUTATIONS", None)
     if SALUTATIONS:
@@ -77,6 +117,24 @@ def get_request(language=None):
     return request
 
 
+def get_language_changer(obj):
+    """
+    Returns a language changer for django CMS which looks up the URLs of the
+    object in all languages at once (see get_absolute_urls()), when it is
+    called for the first one.
+    """
+    urls = {}
+
+    def language_changer(language):
+        if not urls:
+            urls.update(obj.get_absolute_urls())
+        if language in urls:
+            return urls[language]
+        return obj.get_absolute_url(language)
+
+    return language_changer
+
+
 def render_plugin(request, plugin_instance):
     renderer = ContentRenderer(request)
     context = {'request': request}
@@ -149,3 +207,27 @@ def get_plugin_index_data(base_plugin, request):
             cleaned_bits = get_cleaned_bits(value or '')
             text_bits.extend(cleaned_bits)
     return text_bits
+
+
+def bulk_update(objects, fields, batch_size=500):
+    """
+    Writes the given fields of already saved model instances back to the
+    database with one UPDATE ... CASE query per batch. A minimal stand-in for
+    QuerySet.bulk_update(), which is not available before Django 2.2.
+    """
+    objects = list(objects)
+    if not objects:
+        return
+    model = objects[0].__class__
+    for start in range(0, len(objects), batch_size):
+        batch = objects[start:start + batch_size]
+        updates = {}
+        for name in fields:
+            field = model._meta.get_field(name)
+            updates[field.attname] = Case(
+                *[When(pk=obj.pk, then=Value(getattr(obj, field.attname)))
+                  for obj in batch],
+                output_field=field
+            )
+        model._default_manager.filter(
+            pk__in=[obj.pk for obj in batch]).update(**updates)
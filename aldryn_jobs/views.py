@@ -2,21 +2,45 @@
 
 from __future__ import unicode_literals
 
+import hashlib
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.urlresolvers import reverse
 from django.db import transaction
 from django.contrib import messages
-from django.http import Http404
-from django.shortcuts import redirect
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404, redirect
+from django.utils.cache import (
+    add_never_cache_headers, patch_cache_control, patch_response_headers,
+)
+from django.utils.encoding import force_bytes
 from django.utils.translation import (
-    ugettext as _, get_language_from_request
+    ugettext as _, ugettext_lazy, get_language_from_request
 )
-from django.views.generic import DetailView, ListView
+from django.views.generic import DetailView, FormView, ListView, TemplateView
 from aldryn_apphooks_config.mixins import AppConfigMixin
 from aldryn_apphooks_config.utils import get_app_instance
 from menus.utils import set_language_changer
 from parler.views import TranslatableSlugMixin
 
-from .forms import JobApplicationForm
-from .models import JobCategory, JobOpening
+from .cache import (
+    get_cache_key, get_content_version, get_publication_cache_timeout,
+)
+from .alerts import send_confirmation_email
+from .forms import JobAlertSubscriptionForm, JobApplicationForm
+from .models import JobAlertSubscription, JobCategory, JobOpening
+from .purge import (
+    SURROGATE_KEY_HEADER, get_category_key, get_config_key, get_opening_key,
+    patch_surrogate_control, patch_surrogate_keys,
+)
+from .ratelimit import check_rate_limits, is_application_request
+from .routers import get_replica_database, read_from_replica
+from .utils import get_language_changer
+
+logger = logging.getLogger(__name__)
 
 
 class JobsBaseMixin(object):
@@ -46,14 +70,123 @@ class JobsBaseMixin(object):
         )
 
 
-class JobOpeningList(JobsBaseMixin, AppConfigMixin, ListView):
+class ApplicationRateLimitMixin(object):
+    """
+    Checks the rate limits of applications (see aldryn_jobs.ratelimit) before
+    the request body is read, unless ApplicationRateLimitMiddleware did
+    already.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        resolver_match = getattr(request, 'resolver_match', None)
+        if (resolver_match is not None
+                and is_application_request(request, resolver_match)):
+            response = check_rate_limits(request, resolver_match)
+            if response is not None:
+                return response
+        return super(ApplicationRateLimitMixin, self).dispatch(
+            request, *args, **kwargs)
+
+
+class ReplicaReadMixin(object):
+    """
+    Reads safe requests from the replica database (see aldryn_jobs.routers).
+
+    Visitors who just submitted something keep reading from the default
+    database for ALDRYN_JOBS_REPLICA_LAG seconds, so that they see their own
+    writes.
+    """
+    primary_cookie_name = 'aldryn_jobs_primary'
+
+    def dispatch(self, request, *args, **kwargs):
+        if not get_replica_database():
+            return super(ReplicaReadMixin, self).dispatch(
+                request, *args, **kwargs)
+        if request.method not in ('GET', 'HEAD'):
+            response = super(ReplicaReadMixin, self).dispatch(
+                request, *args, **kwargs)
+            response.set_cookie(
+                self.primary_cookie_name, '1', httponly=True,
+                max_age=getattr(settings, 'ALDRYN_JOBS_REPLICA_LAG', 10))
+            return response
+        if self.primary_cookie_name in request.COOKIES:
+            return super(ReplicaReadMixin, self).dispatch(
+                request, *args, **kwargs)
+        with read_from_replica():
+            response = super(ReplicaReadMixin, self).dispatch(
+                request, *args, **kwargs)
+            # Template responses evaluate their querysets when rendered.
+            if hasattr(response, 'render') and not response.is_rendered:
+                response.render()
+        return response
+
+
+class SurrogateKeyMixin(object):
+    """
+    Tags responses with the surrogate keys of the content they show, so that
+    they can be purged from a CDN when it changes (see aldryn_jobs.purge).
+    """
+
+    def get_surrogate_keys(self):
+        if self.config is None:
+            return []
+        return [get_config_key(self.config.pk)]
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super(SurrogateKeyMixin, self).render_to_response(
+            context, **response_kwargs)
+        patch_surrogate_keys(response, self.get_surrogate_keys())
+        return response
+
+
+class PublicationCacheMixin(object):
+    """
+    Allows anonymous responses to be cached until the next job opening of the
+    namespace goes live or expires.
+    """
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super(PublicationCacheMixin, self).render_to_response(
+            context, **response_kwargs)
+        if self.config is not None and not self.request.user.is_authenticated():
+            patch_response_headers(
+                response, get_publication_cache_timeout(self.namespace))
+            patch_surrogate_control(response)
+        return response
+
+
+class ConfigPlaceholdersMixin(object):
+    """
+    Loads the placeholders of the app config in one batch for templates which
+    render them, if ALDRYN_JOBS_PREFETCH_CONFIG_PLACEHOLDERS is set.
+    """
+    prefetch_config_placeholders = True
+
+    def get_context_data(self, **kwargs):
+        prefetch = self.prefetch_config_placeholders and getattr(
+            settings, 'ALDRYN_JOBS_PREFETCH_CONFIG_PLACEHOLDERS', False)
+        if prefetch and self.config is not None:
+            self.config.prefetch_placeholders(self.request)
+        return super(ConfigPlaceholdersMixin, self).get_context_data(**kwargs)
+
+
+class JobOpeningList(ReplicaReadMixin, SurrogateKeyMixin, PublicationCacheMixin,
+                     ConfigPlaceholdersMixin, JobsBaseMixin, AppConfigMixin,
+                     ListView):
 
     def get_queryset(self):
         return super(JobOpeningList, self).get_queryset().order_by(
             'category__ordering', 'ordering')
 
 
-class CategoryJobOpeningList(JobsBaseMixin, AppConfigMixin, ListView):
+class CategoryJobOpeningList(ReplicaReadMixin, SurrogateKeyMixin,
+                             PublicationCacheMixin, ConfigPlaceholdersMixin,
+                             JobsBaseMixin, AppConfigMixin, ListView):
+
+    def get_surrogate_keys(self):
+        keys = super(CategoryJobOpeningList, self).get_surrogate_keys()
+        return keys + [get_category_key(self.category.pk)]
+
     def get_queryset(self):
         category_slug = self.kwargs['category_slug']
         try:
@@ -73,12 +206,26 @@ class CategoryJobOpeningList(JobsBaseMixin, AppConfigMixin, ListView):
                 .filter(category=self.category)
                 .order_by('ordering'))
 
+    def get_context_data(self, **kwargs):
+        context = super(CategoryJobOpeningList, self).get_context_data(
+            **kwargs)
+        context['alert_subscription_url'] = '{0}?category={1}'.format(
+            reverse('{0}:job-alert-subscribe'.format(self.namespace)),
+            self.category.pk)
+        return context
+
     def set_language_changer(self, category):
         """Translate the slug while changing the language."""
-        set_language_changer(self.request, category.get_absolute_url)
+        set_language_changer(self.request, get_language_changer(category))
 
 
-class JobOpeningDetail(AppConfigMixin, TranslatableSlugMixin, DetailView):
+def use_application_form_fragment():
+    return getattr(settings, 'ALDRYN_JOBS_APPLICATION_FORM_FRAGMENT', False)
+
+
+class JobOpeningDetail(ApplicationRateLimitMixin, ReplicaReadMixin,
+                       SurrogateKeyMixin, ConfigPlaceholdersMixin,
+                       AppConfigMixin, TranslatableSlugMixin, DetailView):
     model = JobOpening
     form_class = JobApplicationForm
     template_name = 'aldryn_jobs/jobs_detail.html'
@@ -86,10 +233,81 @@ class JobOpeningDetail(AppConfigMixin, TranslatableSlugMixin, DetailView):
 
     def dispatch(self, request, *args, **kwargs):
         self.request = request
-        self.namespace, self.config = get_app_instance(request)
-        self.object = self.get_object()
-        self.set_language_changer(self.object)
-        return super(JobOpeningDetail, self).dispatch(request, *args, **kwargs)
+        cache_key = self.get_shell_cache_key()
+        if cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return self.get_cached_response(*cached)
+        response = super(JobOpeningDetail, self).dispatch(
+            request, *args, **kwargs)
+        if cache_key is not None and response.status_code == 200:
+            self.cache_response(cache_key, response)
+        return response
+
+    def use_application_form_fragment(self):
+        """
+        Whether the application form is loaded separately. Forms with a
+        captcha (e.g. ReCaptcha) are always rendered inline, so that the
+        captcha doesn't depend on scripts inserted after the page loaded.
+        """
+        return (use_application_form_fragment()
+                and 'captcha' not in self.get_form_class().base_fields)
+
+    def get_shell_cache_key(self):
+        """
+        Returns the cache key of the page shell (the page without the
+        application form, which is loaded separately) if it can be served
+        from the shared cache, otherwise None.
+
+        Only visitors without a session or pending messages get the shared
+        page, everybody else (e.g. editors) gets a freshly rendered one.
+        """
+        request = self.request
+        if (not self.use_application_form_fragment()
+                or request.method != 'GET' or request.GET
+                or settings.SESSION_COOKIE_NAME in request.COOKIES
+                or 'messages' in request.COOKIES):
+            return None
+        location = hashlib.md5(force_bytes(':'.join([
+            request.get_host(), request.path, get_language_from_request(
+                request, check_path=True)]))).hexdigest()
+        return get_cache_key('detail', get_content_version(), location)
+
+    def cache_response(self, cache_key, response):
+        response.render()
+        timeout = get_publication_cache_timeout(self.namespace)
+        headers = dict(
+            (header, response[header])
+            for header in ('Content-Type', SURROGATE_KEY_HEADER)
+            if response.has_header(header))
+        cache.set(cache_key, (
+            response.content, headers, time.time() + timeout,
+        ), timeout)
+        patch_response_headers(response, timeout)
+        patch_surrogate_control(response)
+
+    def get_cached_response(self, content, headers, expires):
+        response = HttpResponse(content)
+        for header, value in headers.items():
+            response[header] = value
+        patch_response_headers(response, max(0, int(expires - time.time())))
+        patch_surrogate_control(response)
+        return response
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super(JobOpeningDetail, self).render_to_response(
+            context, **response_kwargs)
+        if self.object.can_apply and 'application_form_url' not in context:
+            # Contains the application form with the visitor's CSRF token.
+            patch_cache_control(response, private=True)
+        return response
+
+    def get_surrogate_keys(self):
+        # Not the app config key, the page doesn't show other openings.
+        return [
+            get_opening_key(self.object.pk),
+            get_category_key(self.object.category_id),
+        ]
 
     def get_form_class(self):
         return self.form_class
@@ -115,12 +333,29 @@ class JobOpeningDetail(AppConfigMixin, TranslatableSlugMixin, DetailView):
 
     def set_language_changer(self, job_opening):
         """Translate the slug while changing the language."""
-        set_language_changer(self.request, job_opening.get_absolute_url)
+        set_language_changer(
+            self.request, get_language_changer(job_opening))
+
+    def load_object(self):
+        """
+        Looks up the job opening once per request. Called from the handlers,
+        so that safe requests read it from the replica (see
+        ReplicaReadMixin).
+        """
+        if getattr(self, 'object', None) is None:
+            self.object = self.get_object()
+            self.set_language_changer(self.object)
+        return self.object
+
+    def render_form(self):
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
 
     def get(self, *args, **kwargs):
+        self.load_object()
         form_class = self.get_form_class()
         self.form = self.get_form(form_class)
-        return super(JobOpeningDetail, self).get(*args, **kwargs)
+        return self.render_form()
 
     def get_queryset(self):
         qs = super(JobOpeningDetail, self).get_queryset()
@@ -129,6 +364,7 @@ class JobOpeningDetail(AppConfigMixin, TranslatableSlugMixin, DetailView):
     @transaction.atomic
     def post(self, *args, **kwargs):
         """Handles application for the job."""
+        self.load_object()
         if not self.object.can_apply:
             messages.success(self.request, _("You can't apply for this job."))
             return redirect(self.object.get_absolute_url())
@@ -137,16 +373,150 @@ class JobOpeningDetail(AppConfigMixin, TranslatableSlugMixin, DetailView):
         self.form = self.get_form(form_class)
 
         if self.form.is_valid():
-            self.form.save()
+            # Repeated submissions, e.g. double clicks, show the same message.
+            self.form.save_once()
             msg = _("You have successfully applied for %(job)s.") % {
                 'job': self.object.title
             }
             messages.success(self.request, msg)
             return redirect(self.object.get_absolute_url())
         else:
-            return super(JobOpeningDetail, self).get(*args, **kwargs)
+            return self.render_form()
 
     def get_context_data(self, **kwargs):
         context = super(JobOpeningDetail, self).get_context_data(**kwargs)
         context['form'] = self.form
+        # "?apply" renders the form inline, e.g. for visitors without
+        # JavaScript.
+        if (self.use_application_form_fragment()
+                and self.request.method == 'GET'
+                and 'apply' not in self.request.GET):
+            context['application_form_url'] = reverse(
+                '{0}:job-opening-apply'.format(self.namespace),
+                kwargs=self.kwargs, current_app=self.namespace)
+        return context
+
+
+class JobApplicationFormFragment(JobOpeningDetail):
+    """
+    Renders the application form of a job opening on its own, so that it can
+    be loaded into a cached detail page.
+    """
+    template_name = 'aldryn_jobs/includes/application.html'
+    prefetch_config_placeholders = False
+
+    def get_shell_cache_key(self):
+        return None
+
+    def get(self, *args, **kwargs):
+        if not self.load_object().can_apply:
+            raise Http404
+        response = super(JobApplicationFormFragment, self).get(
+            *args, **kwargs)
+        add_never_cache_headers(response)
+        return response
+
+    def get_context_data(self, **kwargs):
+        context = super(JobApplicationFormFragment, self).get_context_data(
+            **kwargs)
+        context.pop('application_form_url', None)
+        # The form is embedded into the detail page, which handles the post.
+        context['form_action'] = self.object.get_absolute_url()
+        return context
+
+
+class JobAlertSubscribe(AppConfigMixin, FormView):
+    """
+    Subscribes to the alerts of a category, the subscription has to be
+    confirmed with the link sent to the email address.
+    """
+    form_class = JobAlertSubscriptionForm
+    template_name = 'aldryn_jobs/alert_subscription.html'
+
+    def dispatch(self, request, *args, **kwargs):
+        response = super(JobAlertSubscribe, self).dispatch(
+            request, *args, **kwargs)
+        add_never_cache_headers(response)
+        return response
+
+    def get_form_kwargs(self):
+        if self.config is None:
+            raise Http404
+        kwargs = super(JobAlertSubscribe, self).get_form_kwargs()
+        kwargs.update(
+            namespace=self.namespace,
+            language=get_language_from_request(self.request, check_path=True))
+        return kwargs
+
+    def get_initial(self):
+        return {'category': self.request.GET.get('category')}
+
+    def form_valid(self, form):
+        subscription = form.save()
+        if not subscription.is_confirmed:
+            confirm_url = self.request.build_absolute_uri(reverse(
+                '{0}:job-alert-confirm'.format(self.namespace),
+                kwargs={'key': subscription.key}))
+            try:
+                send_confirmation_email(subscription, confirm_url)
+            except:  # noqa: This is a 3rd-party app, so we don't know for sure which kinds of errors may be raised here
+                logger.exception('Could not send a job alert confirmation!')
+        # The same for confirmed subscriptions, which aren't disclosed.
+        messages.success(self.request, _(
+            'Please confirm your subscription with the link we have sent '
+            'to %(email)s.') % {'email': subscription.email})
+        return redirect(self.request.get_full_path())
+
+
+class JobAlertSubscriptionAction(TemplateView):
+    """
+    Asks to confirm the action on the subscription, which is done on post.
+    Links in emails are followed by some mail scanners, too. The action,
+    'confirm' or 'unsubscribe', is passed to as_view().
+    """
+    template_name = 'aldryn_jobs/alert_subscription_action.html'
+    action = None
+    action_labels = {
+        'confirm': ugettext_lazy('Confirm subscription'),
+        'unsubscribe': ugettext_lazy('Unsubscribe'),
+    }
+    success_messages = {
+        'confirm': ugettext_lazy('Your subscription is confirmed.'),
+        'unsubscribe': ugettext_lazy('You have been unsubscribed.'),
+    }
+
+    def dispatch(self, request, *args, **kwargs):
+        self.namespace, self.config = get_app_instance(request)
+        self.subscription = get_object_or_404(
+            JobAlertSubscription.objects.select_related('category'),
+            key=kwargs['key'], category__app_config=self.config)
+        response = super(JobAlertSubscriptionAction, self).dispatch(
+            request, *args, **kwargs)
+        add_never_cache_headers(response)
+        return response
+
+    def get_context_data(self, **kwargs):
+        context = super(JobAlertSubscriptionAction, self).get_context_data(
+            **kwargs)
+        context.update(subscription=self.subscription,
+                       action_label=self.action_labels[self.action])
         return context
+
+    def post(self, request, *args, **kwargs):
+        if self.action == 'confirm':
+            url = self.confirm()
+        else:
+            url = self.unsubscribe()
+        messages.success(request, self.success_messages[self.action])
+        return redirect(url)
+
+    def confirm(self):
+        JobAlertSubscription.objects.filter(pk=self.subscription.pk).update(
+            is_confirmed=True)
+        category = self.subscription.category
+        return (category.get_absolute_url(self.subscription.language)
+                or reverse('{0}:job-opening-list'.format(self.namespace)))
+
+    def unsubscribe(self):
+        self.subscription.delete()
+        return reverse('{0}:job-opening-list'.format(self.namespace))